@@ -0,0 +1,231 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from argparse import RawTextHelpFormatter
+from os.path import dirname
+
+from seahorse.game.light_action import LightAction
+
+from board_hex import BoardHex
+from game_state_hex import GameStateHex
+from my_player import MyPlayer
+from player_hex import PlayerHex
+from src_2485686_2485067.algorithme_minimax_alpha_beta_typeA import Algorithme_minimax_alpha_beta_typeA
+
+BOARD_SIZE = 14
+POSITIONS = os.path.join(dirname(os.path.abspath(__file__)), "benchmark_positions.json")
+
+
+def random_games(count, length, seed):
+    """
+    Parties aléatoires reproductibles : listes de positions (i, j) du plateau aggrandi,
+    jouées alternativement par R (premier coup) et B.
+    """
+    rng = random.Random(seed)
+    cells = [(i + 1, j + 1) for i in range(BOARD_SIZE) for j in range(BOARD_SIZE)]
+    return [rng.sample(cells, length) for _ in range(count)]
+
+
+def bench_heuristics(names, games):
+    """
+    Mesure le débit (évaluations par seconde) de chaque heuristique sur les mêmes positions :
+    chaque coup des parties est joué sur la mémoire d'un joueur neuf, puis la position est évaluée.
+
+    Returns:
+        {nom: (nombre d'évaluations, temps total en secondes)}
+    """
+    results = {}
+    for name in names:
+        evaluations, elapsed = 0, 0.0
+        for moves in games:
+            player = MyPlayer("R", name=name, heuristique=name)
+            heuristique = player._heuristique
+            player._memory.heuristique_cache.new_search(heuristique.get_coefficients())
+            for ply, position in enumerate(moves):
+                player._memory.play(position, ply % 2 == 0)
+                start = time.perf_counter()
+                heuristique.execute()
+                elapsed += time.perf_counter() - start
+                evaluations += 1
+        results[name] = (evaluations, elapsed)
+    return results
+
+
+def load_positions(path):
+    """
+    Positions de référence : liste de {"name", "phase", "moves", "board"}, moves étant la suite des coups
+    de la partie d'origine ([couleur, [i, j]], rouge en premier) et board le plateau obtenu,
+    sérialisé comme BoardHex.to_json.
+    """
+    with open(path) as file:
+        positions = json.load(file)
+    for position in positions:
+        position["board"] = BoardHex.from_json(json.dumps(position["board"]))
+    return positions
+
+
+def setup_position(position, seed, workers=1):
+    """
+    Joueur au trait sur une position de référence (avec workers processus de calcul), avec sa mémoire à jour :
+    les coups de la partie d'origine sont rejoués dans leur ordre.
+
+    Returns:
+        (joueur, état de jeu de la position)
+    """
+    board = position["board"]
+    moves = [(color, tuple(cell)) for color, cell in position["moves"]]
+    to_play = "R" if len(moves) % 2 == 0 else "B"
+    player = MyPlayer(to_play, name="benchmark", workers=workers, seed=seed)
+    opponent = PlayerHex("B" if to_play == "R" else "R", name="opponent")
+    red, blue = (player, opponent) if to_play == "R" else (opponent, player)
+
+    state = GameStateHex(scores={red.get_id(): 0, blue.get_id(): 0}, next_player=red, players=[red, blue],
+                         rep=BoardHex(env={}, dim=board.get_dimensions()), step=0)
+    for color, cell in moves:
+        state = state.apply_action(LightAction({"piece": color, "position": cell}))
+        player._memory.update(state)
+    stones = {cell: piece.get_type() for cell, piece in state.get_rep().get_env().items()}
+    if stones != {cell: piece.get_type() for cell, piece in board.get_env().items()}:
+        raise ValueError(f"Les coups de la position {position['name']} ne donnent pas son plateau")
+    return player, state
+
+
+def bench_search(positions, depth, seed):
+    """
+    Recherche alpha-beta à profondeur fixe (sans limite de temps) sur chaque position, graine fixe.
+
+    Returns:
+        [{"name", "phase", "nodes", "leaf_evals", "time", "nodes_per_sec", "move", "score"}]
+    """
+    results = []
+    for position in positions:
+        player, state = setup_position(position, seed)
+        engine = player._ai_engine
+        nodes, leaf_evaluations = engine.nodes, engine.leaf_evaluations
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            score, move = engine.execute(state, max_depth=depth)
+        elapsed = time.perf_counter() - start
+        player.shutdown()
+        nodes = engine.nodes - nodes
+        results.append({
+            "name": position["name"],
+            "phase": position["phase"],
+            "nodes": nodes,
+            "leaf_evals": engine.leaf_evaluations - leaf_evaluations,
+            "time": elapsed,
+            "nodes_per_sec": nodes / elapsed if elapsed > 0 else None,
+            "move": list(move.data["position"]) if move is not None else None,
+            "score": float(score),
+        })
+    return results
+
+
+def check_parallel(positions, depth, seed, workers):
+    """
+    Compare la recherche parallèle (workers processus) à la recherche séquentielle sur chaque position,
+    à profondeur fixe et même graine. Les coups de la racine sont cherchés indépendamment de leurs frères
+    (Algorithme_minimax_alpha_beta_typeA.INDEPENDENT_ROOT_MOVES) : score et coup doivent être identiques.
+
+    Returns:
+        [{"name", "sequential", "parallel"}], chaque recherche étant (score, coup, temps en secondes)
+    """
+    results = []
+    for position in positions:
+        result = {"name": position["name"]}
+        for mode, count in (("sequential", 1), ("parallel", workers)):
+            player, state = setup_position(position, seed, workers=count)
+            engine = player._ai_engine
+            engine.INDEPENDENT_ROOT_MOVES = True
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                score, move = engine.execute(state, max_depth=depth)
+            result[mode] = (float(score), move.data["position"] if move is not None else None,
+                            time.perf_counter() - start)
+            player.shutdown()
+        results.append(result)
+    return results
+
+
+def print_search(results, baseline=None):
+    """ Tableau des résultats; avec baseline (résultats d'une exécution précédente), écarts de vitesse et de coup."""
+    reference = {result["name"]: result for result in baseline or []}
+    print(f"{'position':<12}{'nodes':>8}{'leaves':>8}{'time (s)':>10}{'nodes/s':>10}{'move':>10}{'score':>12}  vs baseline")
+    for result in results:
+        line = (f"{result['name']:<12}{result['nodes']:>8}{result['leaf_evals']:>8}{result['time']:>10.3f}"
+                f"{result['nodes_per_sec'] or 0:>10.0f}{str(tuple(result['move'] or ())):>10}{result['score']:>12.4f}")
+        old = reference.get(result["name"])
+        if old is not None:
+            line += f"  x{result['nodes_per_sec'] / old['nodes_per_sec']:.2f} nodes/s" if old["nodes_per_sec"] else ""
+            if old["move"] != result["move"] or old["nodes"] != result["nodes"]:
+                line += f"  CHANGED (move {tuple(old['move'] or ())}, {old['nodes']} nodes)"
+        print(line)
+    total_nodes = sum(result["nodes"] for result in results)
+    total_time = sum(result["time"] for result in results)
+    print(f"{'total':<12}{total_nodes:>8}{sum(result['leaf_evals'] for result in results):>8}{total_time:>10.3f}"
+          f"{total_nodes / total_time if total_time > 0 else 0:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                        prog="benchmark_hex.py",
+                        description="Benchmarks of the Hex agent:\n"
+                                    "  heuristics : evaluations per second of each evaluation function on the same random positions\n"
+                                    "  search     : fixed-depth alpha-beta search with a fixed seed on the reference positions\n"
+                                    "               (nodes, leaf evaluations, time, nodes/s and chosen move per position)\n"
+                                    "  parallel   : the same search with --workers processes must give the sequential score and move\n"
+                                    "               (root moves searched independently, exit code 1 on mismatch)",
+                        formatter_class=RawTextHelpFormatter)
+    parser.add_argument("-m", "--mode", choices=["heuristics", "search", "parallel"], default="heuristics")
+    parser.add_argument("--heuristics", nargs="+", choices=list(MyPlayer.HEURISTIQUES), default=list(MyPlayer.HEURISTIQUES))
+    parser.add_argument("--games", type=int, default=5, help="number of random games")
+    parser.add_argument("--length", type=int, default=60, help="moves per random game")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--positions", default=POSITIONS, help="reference positions (search mode)")
+    parser.add_argument("--depth", type=int, default=3, help="search depth (search and parallel modes)")
+    parser.add_argument("--workers", type=int, default=3, help="processes of the parallel search (parallel mode)")
+    parser.add_argument("--output", default=None, help="JSON file of the results (search mode)")
+    parser.add_argument("--baseline", default=None, help="JSON results of a previous run to compare with (search mode)")
+    args = parser.parse_args()
+
+    if args.mode == "parallel":
+        if args.depth < Algorithme_minimax_alpha_beta_typeA.PARALLEL_MIN_DEPTH:
+            parser.error(f"parallel mode: --depth must be at least {Algorithme_minimax_alpha_beta_typeA.PARALLEL_MIN_DEPTH}"
+                         " (shallower searches are not parallelised)")
+        results = check_parallel(load_positions(args.positions), args.depth, args.seed, args.workers)
+        print(f"{'position':<12}{'sequential':>24}{'time (s)':>10}{'parallel':>24}{'time (s)':>10}")
+        mismatches = 0
+        for result in results:
+            (seq_score, seq_move, seq_time), (par_score, par_move, par_time) = result["sequential"], result["parallel"]
+            line = (f"{result['name']:<12}{seq_score:>14.4f}{str(seq_move):>10}{seq_time:>10.3f}"
+                    f"{par_score:>14.4f}{str(par_move):>10}{par_time:>10.3f}")
+            if (seq_score, seq_move) != (par_score, par_move):
+                mismatches += 1
+                line += "  MISMATCH"
+            print(line)
+        print(f"{len(results)} positions, {mismatches} mismatches")
+        sys.exit(1 if mismatches else 0)
+    elif args.mode == "search":
+        results = bench_search(load_positions(args.positions), args.depth, args.seed)
+        baseline = None
+        if args.baseline is not None:
+            with open(args.baseline) as file:
+                baseline = json.load(file)
+        print_search(results, baseline)
+        if args.output is not None:
+            with open(args.output, "w") as file:
+                json.dump(results, file, indent=2)
+    else:
+        games = random_games(args.games, args.length, args.seed)
+        results = bench_heuristics(args.heuristics, games)
+        reference = results[args.heuristics[0]]
+        print(f"{'heuristic':<15}{'evals':>8}{'time (s)':>12}{'evals/s':>12}{'speed-up':>10}")
+        for name, (evaluations, elapsed) in results.items():
+            speed = evaluations / elapsed if elapsed > 0 else float("inf")
+            speed_up = reference[1] / elapsed if elapsed > 0 else float("inf")
+            print(f"{name:<15}{evaluations:>8}{elapsed:>12.3f}{speed:>12.0f}{speed_up:>10.2f}")
@@ -0,0 +1,81 @@
+import argparse
+import random
+import sys
+from argparse import RawTextHelpFormatter
+
+from my_player import MyPlayer
+from src_2485686_2485067.Metrics.distance import Distance
+
+BOARD_SIZE = 14
+
+
+def distance_manager(player):
+    """ Manager Distance de la mémoire du joueur."""
+    return next(manager for manager in player._memory.manager if isinstance(manager, Distance))
+
+
+def observe(player):
+    """ Distances et chemins critiques de la mémoire du joueur."""
+    memory = player._memory
+    return (memory.get_my_distance(), memory.get_adversary_distance(),
+            memory.get_my_critical_path(), memory.get_adversary_critical_path())
+
+
+def check_game(seed, length, undo_rate):
+    """
+    Joue la même suite aléatoire de coups et d'annulations sur deux joueurs, l'un réparant ses plus courts
+    chemins (Distance.INCREMENTAL), l'autre refaisant le calcul complet à chaque mise à jour, et compare
+    distances et chemins critiques après chaque opération.
+
+    Returns:
+        (nombre de comparaisons, liste des écarts)
+    """
+    rng = random.Random(seed)
+    players = [MyPlayer("R" if seed % 2 == 0 else "B", name=f"check_{incremental}") for incremental in (True, False)]
+    distance_manager(players[1]).INCREMENTAL = False
+
+    empty = [(i + 1, j + 1) for i in range(BOARD_SIZE) for j in range(BOARD_SIZE)]
+    played = []
+    checks, mismatches = 0, []
+    while len(played) < length:
+        if played and rng.random() < undo_rate:
+            operation = "undo"
+            for player in players:
+                player._memory.undo()
+            empty.append(played.pop())
+        else:
+            position = empty.pop(rng.randrange(len(empty)))
+            operation = f"play {position}"
+            for player in players:
+                player._memory.play(position, len(played) % 2 == 0)
+            played.append(position)
+        incremental, full = (observe(player) for player in players)
+        checks += 1
+        if incremental != full:
+            mismatches.append({"seed": seed, "ply": len(played), "operation": operation,
+                               "incremental": incremental, "full": full})
+    return checks, mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                        prog="check_distance_hex.py",
+                        description="Randomised equivalence check of the incremental shortest paths (Distance):\n"
+                                    "random move / undo sequences are replayed on a repairing and a recomputing player,\n"
+                                    "distances and critical paths must be identical after every operation.",
+                        formatter_class=RawTextHelpFormatter)
+    parser.add_argument("--games", type=int, default=20, help="number of random sequences")
+    parser.add_argument("--length", type=int, default=80, help="moves per sequence (undone moves excluded)")
+    parser.add_argument("--undo-rate", type=float, default=0.3, help="probability of an undo at each operation")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    total, failures = 0, []
+    for game in range(args.games):
+        checks, mismatches = check_game(args.seed + game, args.length, args.undo_rate)
+        total += checks
+        failures.extend(mismatches)
+    for failure in failures[:10]:
+        print(failure)
+    print(f"{total} checks, {len(failures)} mismatches")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,113 @@
+import argparse
+import random
+import sys
+from argparse import RawTextHelpFormatter
+
+import numpy as np
+
+from my_player import MyPlayer
+from src_2485686_2485067.Memory.maillons_manager import MaillonsManager
+from src_2485686_2485067.Memory.trapezoid_manager import TrapezoidManager
+
+BOARD_SIZE = 14
+
+
+def manager(player, manager_class):
+    """ Manager manager_class de la mémoire du joueur."""
+    return next(manager for manager in player._memory.manager if isinstance(manager, manager_class))
+
+
+def canonical(value):
+    """
+    Forme comparable d'une structure de la mémoire : l'ordre des espaces d'un maillon ou d'un trapèze,
+    des maillons cassés et des dictionnaires ne dépend que de l'ordre de découverte, il n'est pas comparé.
+    Seules les coordonnées (tuples d'entiers) restent ordonnées; les ensembles deviennent des tuples triés
+    (le repr d'un frozenset dépend de son ordre d'itération et ne peut pas servir de clé de tri).
+    """
+    if isinstance(value, dict):
+        return dict(sorted(((canonical(key), canonical(item)) for key, item in value.items()), key=repr))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [canonical(item) for item in value]
+        if isinstance(value, tuple) and all(isinstance(item, int) for item in items):
+            return tuple(items)
+        return tuple(sorted(items, key=repr))
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def observe(player):
+    """ Maillons et trapèzes (des deux couleurs, avec leurs espaces et ceux cassés au dernier coup) de la mémoire du joueur."""
+    memory = player._memory
+    return canonical({
+        "me_links": memory.get_me_links(), "me_space_links": memory.get_me_space_links(),
+        "adversary_links": memory.get_adversary_links(), "adversary_space_links": memory.get_adversary_space_links(),
+        "me_broken_links": memory.get_me_broken_links(), "adversary_broken_links": memory.get_adversary_broken_links(),
+        "me_trapezoid": memory.get_me_trapezoid(), "me_space_trapezoid": memory.get_me_space_trapezoid(),
+        "adversary_trapezoid": memory.get_adversary_trapezoid(),
+        "adversary_space_trapezoid": memory.get_adversary_space_trapezoid(),
+        "me_broken_trapezoid": memory.get_me_broken_trapezoid(),
+        "adversary_broken_trapezoid": memory.get_adversary_broken_trapezoid(),
+    })
+
+
+def check_game(seed, length, undo_rate):
+    """
+    Joue la même suite aléatoire de coups et d'annulations sur deux joueurs, l'un mettant à jour ses maillons
+    et trapèzes autour du dernier coup (MaillonsManager.INCREMENTAL, TrapezoidManager.INCREMENTAL), l'autre
+    les recalculant sur tout le plateau à chaque mise à jour, et compare les deux mémoires après chaque opération.
+
+    Returns:
+        (nombre de comparaisons, liste des écarts)
+    """
+    rng = random.Random(seed)
+    players = [MyPlayer("R" if seed % 2 == 0 else "B", name=f"check_{incremental}") for incremental in (True, False)]
+    manager(players[1], MaillonsManager).INCREMENTAL = False
+    manager(players[1], TrapezoidManager).INCREMENTAL = False
+
+    empty = [(i + 1, j + 1) for i in range(BOARD_SIZE) for j in range(BOARD_SIZE)]
+    played = []
+    checks, mismatches = 0, []
+    while len(played) < length:
+        if played and rng.random() < undo_rate:
+            operation = "undo"
+            for player in players:
+                player._memory.undo()
+            empty.append(played.pop())
+        else:
+            position = empty.pop(rng.randrange(len(empty)))
+            operation = f"play {position}"
+            for player in players:
+                player._memory.play(position, len(played) % 2 == 0)
+            played.append(position)
+        incremental, full = (observe(player) for player in players)
+        checks += 1
+        if incremental != full:
+            differences = sorted(key for key in incremental if incremental[key] != full[key])
+            mismatches.append({"seed": seed, "ply": len(played), "operation": operation, "differences": differences})
+    return checks, mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                        prog="check_links_hex.py",
+                        description="Randomised equivalence check of the incremental links and trapezoids\n"
+                                    "(MaillonsManager, TrapezoidManager): random move / undo sequences are replayed\n"
+                                    "on an incremental and a rebuilding player, links, trapezoids, their spaces and\n"
+                                    "the broken ones must be identical after every operation.",
+                        formatter_class=RawTextHelpFormatter)
+    parser.add_argument("--games", type=int, default=20, help="number of random sequences")
+    parser.add_argument("--length", type=int, default=80, help="moves per sequence (undone moves excluded)")
+    parser.add_argument("--undo-rate", type=float, default=0.3, help="probability of an undo at each operation")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    total, failures = 0, []
+    for game in range(args.games):
+        checks, mismatches = check_game(args.seed + game, args.length, args.undo_rate)
+        total += checks
+        failures.extend(mismatches)
+    for failure in failures[:10]:
+        print(failure)
+    print(f"{total} checks, {len(failures)} mismatches")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,108 @@
+import argparse
+import random
+import sys
+from argparse import RawTextHelpFormatter
+
+import numpy as np
+
+import check_distance_hex
+import check_links_hex
+from my_player import MyPlayer
+
+BOARD_SIZE = 14
+
+
+def array(value):
+    """ Forme comparable d'une matrice (identique au bit près, valeurs nan et infinies comprises)."""
+    return value.shape, value.dtype.str, value.tobytes()
+
+
+def observe(player):
+    """ Données de tous les managers dérivés de la mémoire du joueur (leur lecture rattrape les coups en retard)."""
+    memory = player._memory
+    return {
+        "links_trapezoids": check_links_hex.observe(player),
+        "distances": check_distance_hex.observe(player),
+        "attention": array(memory.get_attention_board()),
+        "attention_history": [array(board) for board in memory.get_attention_history()],
+        "board": array(memory.get_board()),
+        "hash": memory.heuristique_cache.current_hash,
+    }
+
+
+# lectures partielles de la mémoire paresseuse : chacune ne rattrape que les managers jusqu'à son étape
+PARTIAL_READS = (
+    lambda memory: memory.get_me_links(),
+    lambda memory: memory.get_my_distance(),
+    lambda memory: memory.get_adversary_trapezoid(),
+    lambda memory: memory.get_attention_board(),
+)
+
+
+def check_game(seed, length, undo_rate, read_rate, observe_rate):
+    """
+    Joue la même suite aléatoire de coups et d'annulations sur deux joueurs, l'un à mémoire paresseuse
+    (Memory.LAZY : managers dérivés rattrapés à la lecture, ici lue partiellement au hasard), l'autre mettant
+    tous les managers à jour à chaque coup, et compare les deux mémoires au hasard entre deux opérations.
+
+    Returns:
+        (nombre de comparaisons, liste des écarts)
+    """
+    rng = random.Random(seed)
+    players = [MyPlayer("R" if seed % 2 == 0 else "B", name=f"check_{lazy}") for lazy in (True, False)]
+    players[1]._memory.LAZY = False
+
+    empty = [(i + 1, j + 1) for i in range(BOARD_SIZE) for j in range(BOARD_SIZE)]
+    played = []
+    checks, mismatches = 0, []
+    while len(played) < length:
+        if played and rng.random() < undo_rate:
+            operation = "undo"
+            for player in players:
+                player._memory.undo()
+            empty.append(played.pop())
+        else:
+            position = empty.pop(rng.randrange(len(empty)))
+            operation = f"play {position}"
+            for player in players:
+                player._memory.play(position, len(played) % 2 == 0)
+            played.append(position)
+        if rng.random() < read_rate:
+            rng.choice(PARTIAL_READS)(players[0]._memory)
+        if rng.random() < observe_rate or len(played) == length:
+            lazy, eager = (observe(player) for player in players)
+            checks += 1
+            if lazy != eager:
+                differences = sorted(key for key in lazy if lazy[key] != eager[key])
+                mismatches.append({"seed": seed, "ply": len(played), "operation": operation, "differences": differences})
+    return checks, mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                        prog="check_memory_hex.py",
+                        description="Randomised equivalence check of the lazy Memory pipeline (Memory._refresh):\n"
+                                    "random move / undo sequences are replayed on a lazy and an eager player, the lazy\n"
+                                    "memory being read partially at random; links, trapezoids, distances, critical paths,\n"
+                                    "attention and hash must be identical whenever both memories are compared.",
+                        formatter_class=RawTextHelpFormatter)
+    parser.add_argument("--games", type=int, default=20, help="number of random sequences")
+    parser.add_argument("--length", type=int, default=80, help="moves per sequence (undone moves excluded)")
+    parser.add_argument("--undo-rate", type=float, default=0.3, help="probability of an undo at each operation")
+    parser.add_argument("--read-rate", type=float, default=0.3,
+                        help="probability of a partial read of the lazy memory after each operation")
+    parser.add_argument("--observe-rate", type=float, default=0.2,
+                        help="probability of comparing the two memories after each operation")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    total, failures = 0, []
+    for game in range(args.games):
+        checks, mismatches = check_game(args.seed + game, args.length, args.undo_rate, args.read_rate,
+                                        args.observe_rate)
+        total += checks
+        failures.extend(mismatches)
+    for failure in failures[:10]:
+        print(failure)
+    print(f"{total} checks, {len(failures)} mismatches")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,116 @@
+import argparse
+import contextlib
+import io
+import random
+import sys
+from argparse import RawTextHelpFormatter
+
+from benchmark_hex import POSITIONS, load_positions, setup_position
+from src_2485686_2485067.Memory.transposition_table import TranspositionTable
+
+FLAGS = {TranspositionTable.EXACT: "exact", TranspositionTable.LOWER_BOUND: "lower", TranspositionTable.UPPER_BOUND: "upper"}
+
+
+def record_stores(player, root_length):
+    """
+    Enregistre chaque écriture dans la table de transposition du joueur : (ligne depuis la racine, profondeur
+    restante, valeur, type de borne). La ligne est lue dans l'historique des coups de la mémoire.
+
+    Returns:
+        liste des écritures (remplie pendant la recherche)
+    """
+    memory = player._memory
+    table = memory.transposition_table
+    store = table.store
+    records = []
+
+    def recording_store(key, depth, value, flag, best_move):
+        records.append((list(memory.move_history)[root_length:], depth, value, flag))
+        return store(key, depth, value, flag, best_move)
+
+    table.store = recording_store
+    return records
+
+
+def node_value(player, line, remaining):
+    """
+    Valeur exacte (fenêtre complète) du noeud atteint par line depuis la racine, à remaining coups de
+    la profondeur maximale. Le noeud est cherché à sa profondeur d'origine, MAX si line est de longueur paire.
+    """
+    engine = player._ai_engine
+    memory = player._memory
+    for ply, position in enumerate(line):
+        memory.play(position, ply % 2 == 0)
+    depth = len(line)
+    engine.maximum_depth = depth + remaining
+    engine.pv_table, engine.follow_pv, engine.deadline = {}, False, None
+    search = (engine._Algorithme_minimax_alpha_beta_typeA__maxValue if depth % 2 == 0
+              else engine._Algorithme_minimax_alpha_beta_typeA__minValue)
+    try:
+        return search(float("-inf"), float("+inf"), depth)[0]
+    finally:
+        for _ in line:
+            memory.undo()
+
+
+def check_position(position, depth, seed, samples):
+    """
+    Recherche par approfondissement itératif (fenêtres d'aspiration et fenêtres nulles de PVS) jusqu'à depth,
+    puis recherche à nouveau en fenêtre complète des noeuds tirés au hasard parmi ceux écrits dans la table :
+    une valeur exacte doit être retrouvée, une borne inférieure (supérieure) ne doit pas dépasser
+    (être dépassée par) la vraie valeur.
+    Les coups de la racine sont cherchés indépendamment (INDEPENDENT_ROOT_MOVES) : sans lecture de la table,
+    la valeur d'un noeud ne dépend que de sa position et de sa profondeur restante. La racine elle-même
+    (coups annexes raccourcis selon leur rang dans l'ordonnancement) n'est pas revérifiée.
+
+    Returns:
+        (nombre de vérifications par type de borne, liste des écarts)
+    """
+    player, state = setup_position(position, seed)
+    engine = player._ai_engine
+    engine.INDEPENDENT_ROOT_MOVES = True
+    records = record_stores(player, player._memory.move_history.len())
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.execute(state, max_depth=depth, time_budget=float("inf"))
+    del player._memory.transposition_table.store # fin de l'enregistrement
+    records = [record for record in records if record[0]]
+
+    checks = {name: 0 for name in FLAGS.values()}
+    mismatches = []
+    for line, remaining, value, flag in random.Random(seed).sample(records, min(samples, len(records))):
+        true_value = node_value(player, line, remaining)
+        checks[FLAGS[flag]] += 1
+        if ((flag == TranspositionTable.EXACT and true_value != value)
+                or (flag == TranspositionTable.LOWER_BOUND and true_value < value)
+                or (flag == TranspositionTable.UPPER_BOUND and true_value > value)):
+            mismatches.append({"position": position["name"], "line": line, "remaining": remaining,
+                               "flag": FLAGS[flag], "stored": float(value), "value": float(true_value)})
+    player.shutdown()
+    return checks, mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                        prog="check_tt_hex.py",
+                        description="Check of the transposition table bound flags: after an iterative deepening search\n"
+                                    "on each reference position, sampled stored nodes are searched again with a full\n"
+                                    "window; exact values must match, lower / upper bounds must hold (exit code 1 otherwise).",
+                        formatter_class=RawTextHelpFormatter)
+    parser.add_argument("--positions", default=POSITIONS, help="reference positions")
+    parser.add_argument("--depth", type=int, default=3, help="maximum depth of the iterative deepening")
+    parser.add_argument("--samples", type=int, default=40, help="stored nodes searched again per position")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    totals = {name: 0 for name in FLAGS.values()}
+    failures = []
+    for position in load_positions(args.positions):
+        checks, mismatches = check_position(position, args.depth, args.seed, args.samples)
+        for name, count in checks.items():
+            totals[name] += count
+        failures.extend(mismatches)
+    for failure in failures[:10]:
+        print(failure)
+    print(f"{sum(totals.values())} checks ({', '.join(f'{count} {name}' for name, count in totals.items())}),"
+          f" {len(failures)} mismatches")
+    sys.exit(1 if failures else 0)
@@ -4,6 +4,7 @@ from typing import Dict, Generator, List, Optional, Set, Tuple
 
 from board_hex import BoardHex
 from player_hex import PlayerHex
+from union_find_hex import HexUnionFind
 from seahorse.game.game_layout.board import Piece
 from seahorse.game.game_state import GameState
 from seahorse.game.heavy_action import HeavyAction
@@ -23,6 +24,8 @@ class GameStateHex(GameState):
         rep (Representation): Representation of the game.
     """
     def __init__(self, scores: Dict, next_player: Player, players: List[Player], rep: BoardHex, step: int,  *args, **kwargs) -> None:
+        self._union_find = None  # connectivity of the current board, built lazily
+        self._next_union_find = None  # connectivity computed by the last compute_scores call
         super().__init__(scores, next_player, players, rep)
         self.max_step = rep.get_dimensions()[0] * rep.get_dimensions()[1] #+ 1 #+1 for the swap
         self.step = step
@@ -47,6 +50,20 @@ class GameStateHex(GameState):
             return True
         return False
 
+    def get_union_find(self) -> HexUnionFind:
+        """
+        Return the disjoint-set of the stones of the current board (built from the environment if needed).
+
+        Returns:
+            HexUnionFind: The connectivity of the current board.
+        """
+        if self._union_find is None:
+            union_find = HexUnionFind(self.get_rep().get_dimensions()[0], self.players[0].get_piece_type())
+            for (i, j), piece in self.get_rep().get_env().items():
+                union_find.place(i, j, piece.get_type())
+            self._union_find = union_find
+        return self._union_find
+
     def get_neighbours(self, i: int, j: int) -> Dict[str,Tuple[str,Tuple[int,int]]]:
         return self.get_rep().get_neighbours(i, j)
 
@@ -101,6 +118,7 @@ class GameStateHex(GameState):
                 new_board,
                 step=self.step + 1,
             )
+            new_state._union_find = self._next_union_find
             yield HeavyAction(self, new_state)
 
                         
@@ -149,13 +167,15 @@ class GameStateHex(GameState):
         copy_b[position] = Piece(piece_type=piece_type, owner=self.next_player)
         new_board = BoardHex(env=copy_b, dim=d)
         play_info = (position, piece_type, self.next_player.get_id())
-        return GameStateHex(
+        new_state = GameStateHex(
             self.compute_scores(play_info=play_info),
             self.compute_next_player(),
             self.players,
             new_board,
             step=self.step + 1,
         )
+        new_state._union_find = self._next_union_find
+        return new_state
     
     def convert_heavy_action_to_light_action(self, heavy_action: HeavyAction) -> LightAction:
         """
@@ -206,51 +226,16 @@ class GameStateHex(GameState):
         player1, player2 = self.players[0].id, self.players[1].id
         pos, piece_type, id_player = play_info
         if self.get_rep().get_env().get(pos) is not None and self.step == 1:
+            self._next_union_find = None
             return {player1: 0.0, player2: 0.0}
-        self.get_rep().get_env()[pos] = Piece(piece_type=piece_type, owner=self.get_player_id(id_player))
-        dim = self.get_rep().get_dimensions()[0]
-        visited = set()
-        def dfs_bot(i,j):
-            if (i,j) in visited:
-                return False
-            visited.add((i,j))
-            if i == dim-1:
-                return True
-            for k, v in self.get_neighbours(i,j).items():
-                t, (ni, nj) = v
-                if t == piece_type and (ni,nj) not in visited:
-                    if dfs_bot(ni,nj):
-                        return True
-            return False
-        
-        def dfs_right(i,j):
-            if (i,j) in visited:
-                return False
-            visited.add((i,j))
-            if j == dim-1:
-                return True
-            for k, v in self.get_neighbours(i,j).items():
-                t, (ni, nj) = v
-                if t == piece_type and (ni,nj) not in visited:
-                    if dfs_right(ni,nj):
-                        return True
-            return False
-
-        if id_player == player1:
-            for j in range(dim):
-                piece = self.get_rep().get_env().get((0,j), -1)
-                if piece != -1 and piece.get_type() == piece_type:
-                    if dfs_bot(0,j):
-                        self.get_rep().get_env().pop(pos)
-                        return {player1: 1.0, player2: 0.0}
-        else:
-            for i in range(dim):
-                piece = self.get_rep().get_env().get((i,0), -1)
-                if piece != -1 and piece.get_type() == piece_type:
-                    if dfs_right(i,0):
-                        self.get_rep().get_env().pop(pos)
-                        return {player1: 0.0, player2: 1.0}
-        self.get_rep().get_env().pop(pos)
+        # Only the placed stone is merged into a copy of the current connectivity
+        union_find = self.get_union_find().copy()
+        union_find.place(pos[0], pos[1], piece_type)
+        self._next_union_find = union_find
+        if union_find.is_connected(piece_type):
+            if id_player == player1:
+                return {player1: 1.0, player2: 0.0}
+            return {player1: 0.0, player2: 1.0}
         return  {player1: 0, player2: 0}
 
     def __str__(self) -> str:
@@ -259,7 +244,7 @@ class GameStateHex(GameState):
         return "The game is finished!"
 
     def to_json(self) -> str:
-        data = { i:j for i,j in self.__dict__.items() if i!="_possible_light_actions" and i!="_possible_heavy_actions"}
+        data = { i:j for i,j in self.__dict__.items() if i not in ("_possible_light_actions", "_possible_heavy_actions", "_union_find", "_next_union_find")}
         data["step"] = self.step
         return data
     
@@ -38,4 +38,16 @@ class MasterHex(GameMaster):
         return itera
 
     def get_custom_stats(self):
-        return [{"name": "coups", "value": self.current_game_state.get_step(), "agent_id":-1}]
\ No newline at end of file
+        stats = [{"name": "coups", "value": self.current_game_state.get_step(), "agent_id":-1}]
+        for player in self.players:
+            # local players are wrapped in a proxy; remote ones expose nothing
+            instrumentation = getattr(getattr(player, "wrapped_player", player), "get_instrumentation", lambda: None)()
+            if instrumentation is None:
+                continue
+            for label, counter in instrumentation.totals().items():
+                stats.append({"name": f"{label} (ms)", "value": round(counter["total_ms"], 3), "agent_id": player.get_id()})
+                stats.append({"name": f"{label} (calls)", "value": counter["calls"], "agent_id": player.get_id()})
+            stats.append({"name": "time per move (ms)", "agent_id": player.get_id(),
+                          "value": [{label: round(counter["total_ms"], 3) for label, counter in move.items()}
+                                    for move in instrumentation.history]})
+        return stats
\ No newline at end of file
@@ -6,14 +6,22 @@ from player_hex import PlayerHex
 from seahorse.game.action import Action
 from seahorse.game.game_state import GameState
 from src_2485686_2485067.algorithme_minimax_alpha_beta_typeA import Algorithme_minimax_alpha_beta_typeA
+from src_2485686_2485067.algorithme_mcts_rave import Algorithme_mcts_rave
 from src_2485686_2485067.Memory.memory import Memory
+from src_2485686_2485067.Memory.memoisation_manager import MemoisationManager
 from src_2485686_2485067.heuristique_v1 import Heuristique_v1
+from src_2485686_2485067.heuristique_two_distance import Heuristique_two_distance
+from src_2485686_2485067.heuristique_resistance import Heuristique_resistance
 from src_2485686_2485067.forced_move import ForcedMove
 from src_2485686_2485067.early_victory_detector import EarlyVictory
 import random
 from seahorse.game.light_action import LightAction
 from src_2485686_2485067.game_debug import GameDebug
 from src_2485686_2485067.Metrics.distance import Distance
+from src_2485686_2485067.ponder import Ponderer
+from src_2485686_2485067.instrumentation import Instrumentation
+from src_2485686_2485067.trace import Trace
+import time
 
 # import cProfile
 # import pstats
@@ -35,21 +43,80 @@ class MyPlayer(PlayerHex):
         piece_type (str): piece type of the player "R" for the first player and "B" for the second player
     """
 
-    def __init__(self, piece_type: str, name: str = "MyPlayer"):
+    MAX_SEARCH_DEPTH = 6 # profondeur maximale de l'approfondissement itératif
+    MIN_MOVES_LEFT = 10 # nombre minimal de coups restants supposé pour répartir le temps
+    MAX_MOVE_TIME = 30.0 # temps maximal (s) alloué à un coup
+    TIME_SAFETY_MARGIN = 0.9 # part du budget réellement utilisée par la recherche
+
+    ENGINES = ("alpha_beta", "mcts") # moteurs de recherche disponibles
+    HEURISTIQUES = { # heuristiques d'évaluation disponibles (moteur alpha_beta)
+        "v1": Heuristique_v1,
+        "two_distance": Heuristique_two_distance,
+        "resistance": Heuristique_resistance,
+    }
+
+    def __init__(self, piece_type: str, name: str = "MyPlayer", engine: str = "alpha_beta",
+                 workers: int = 1, start_method: str = None, ponder: bool = False,
+                 heuristique: str = "v1", batch_ordering: bool = False, seed: int = None,
+                 cache_max_entries: int = MemoisationManager.MAX_ENTRIES, cache_max_age: int = MemoisationManager.MAX_AGE,
+                 instrument: bool = False, trace_level: str = "off", trace_subsystems: tuple = None,
+                 trace_records: str = None):
         """
         Initialize the PlayerHex instance.
 
         Args:
             piece_type (str): Type of the player's game piece
             name (str, optional): Name of the player (default is "bob")
+            engine (str, optional): search engine, "alpha_beta" (default) or "mcts"
+            workers (int, optional): number of processes of the alpha-beta root-parallel search (default 1: sequential).
+                Only iterations of depth >= Algorithme_minimax_alpha_beta_typeA.PARALLEL_MIN_DEPTH are split.
+                No speed-up has been measured: on a single core, 3 processes are 2 to 4 times slower at depth 4
+            start_method (str, optional): multiprocessing start method of the search processes (default: platform default)
+            ponder (bool, optional): search the opponent's likely replies during their time (alpha-beta only, default False)
+            heuristique (str, optional): evaluation function, "v1" (default), "two_distance" or "resistance"
+            batch_ordering (bool, optional): order the root and depth-1 children by a batched numpy evaluation
+                (alpha-beta with the "v1" heuristique only, default False)
+            seed (int, optional): seed of the engine's random move selection (default None: not reproducible)
+            cache_max_entries (int, optional): maximum number of entries of the heuristique cache
+                (default MemoisationManager.MAX_ENTRIES)
+            cache_max_age (int, optional): searches without use after which a heuristique cache entry is evicted
+                (default MemoisationManager.MAX_AGE)
+            instrument (bool, optional): count the calls and time of the memory managers and of the heuristique
+                at each move (see get_instrumentation, default False)
+            trace_level (str, optional): level of the traces written at each move, "off" (default), "info" or "debug"
+            trace_subsystems (tuple, optional): traced subsystems among Trace.SUBSYSTEMS (default None: all)
+            trace_records (str, optional): JSONL file receiving one record per move (board, distances,
+                critical paths, chosen move, score; default None: no record)
         """
         super().__init__(piece_type, name)
-        self._memory = Memory(self)
+        if engine not in self.ENGINES:
+            raise ValueError(f"Moteur inconnu : {engine} (attendu : {', '.join(self.ENGINES)})")
+        if ponder and engine != "alpha_beta":
+            raise ValueError("La réflexion pendant le temps adverse n'est disponible qu'avec le moteur alpha_beta")
+        if batch_ordering and engine != "alpha_beta":
+            raise ValueError("L'évaluation groupée n'est disponible qu'avec le moteur alpha_beta")
+        if heuristique not in self.HEURISTIQUES:
+            raise ValueError(f"Heuristique inconnue : {heuristique} (attendu : {', '.join(self.HEURISTIQUES)})")
+        self._trace = Trace(trace_level, trace_subsystems, trace_records)
+        self._memory = Memory(self, cache_max_entries=cache_max_entries, cache_max_age=cache_max_age)
 
         self._early_victory_detector = EarlyVictory(self._memory)
-        self._heuristique = Heuristique_v1(self)
-        self._ai_engine = Algorithme_minimax_alpha_beta_typeA(self,self._heuristique)
+        self._heuristique_name = heuristique
+        self._heuristique = self.HEURISTIQUES[heuristique](self)
+        if engine == "mcts":
+            self._ai_engine = Algorithme_mcts_rave(self, seed=seed)
+        else:
+            self._ai_engine = Algorithme_minimax_alpha_beta_typeA(self,self._heuristique,workers=workers,start_method=start_method,
+                                                                  batch_ordering=batch_ordering, seed=seed)
         self._forced_move = ForcedMove(self)
+        self._ponderer = Ponderer(self, self.MAX_SEARCH_DEPTH) if ponder else None
+
+        # temps et appels par manager / métrique (branché seulement sur demande : aucun coût sinon)
+        self._instrumentation = None
+        if instrument:
+            self._instrumentation = Instrumentation()
+            self._memory.instrument(self._instrumentation)
+            self._heuristique.instrument(self._instrumentation)
 
         self.debug = GameDebug(self)
 
@@ -70,9 +137,13 @@ class MyPlayer(PlayerHex):
 
 
         try:
+            # fin de la réflexion pendant le temps adverse (elle utilise la mémoire)
+            pondered = self._ponderer.stop() if self._ponderer is not None else {}
+            if self._instrumentation is not None:
+                self._instrumentation.reset() # le temps de la réflexion adverse n'est pas compté
             self._memory.update(current_state) # MAJ de la mémoire pour récupérer le coup adverse
-            self._memory.heuristique_cache.clear() # vide le cache de l'heuristique
-            print(self._memory.print__memory())
+            resume = pondered.get(self._memory.move_history.peek()) # recherche déjà faite sur le coup adverse
+            self._trace.dump("memory", Trace.DEBUG, self._memory.print__memory)
             #print(self._heuristique.print_debug())
             # if self._memory.last_move is not None and DEBUG == True:
             #     print(self._memory.print__memory())
@@ -112,7 +183,17 @@ class MyPlayer(PlayerHex):
 
 
 
-            (score,move) = self._ai_engine.execute(current_state,max_depth=3)
+            time_budget = self.move_time_budget(current_state, remaining_time)
+            self._trace.log("time", Trace.INFO, "budget %.2f s (reste %.1f s)", time_budget, remaining_time)
+            start, nodes = time.perf_counter(), self._ai_engine.nodes
+            if resume is not None:
+                (score,move) = self._ai_engine.execute(current_state,max_depth=self.MAX_SEARCH_DEPTH,time_budget=time_budget,resume=resume)
+            else:
+                (score,move) = self._ai_engine.execute(current_state,max_depth=self.MAX_SEARCH_DEPTH,time_budget=time_budget)
+            elapsed, nodes = time.perf_counter() - start, self._ai_engine.nodes - nodes
+            self._trace.log("search", Trace.INFO, "coup %s score %.4f (%d noeuds, %.2f s)",
+                            move.data["position"], score, nodes, elapsed)
+            self._trace.record(lambda: self.trace_record(current_state, move, score, elapsed))
 
             # mise à jour de la mémoire
             new_state = current_state.apply_action(move)
@@ -133,7 +214,17 @@ class MyPlayer(PlayerHex):
             # ps = pstats.Stats(profiler, stream=s).sort_stats('cumtime')  # trie par temps cumulé
             # ps.print_stats()  # pas d'argument = affiche toutes les fonctions
             # print(s.getvalue())  # Affiche toutes les stats dans la console
-            print(self._memory.print__memory())
+            self._trace.dump("memory", Trace.DEBUG, self._memory.print__memory)
+
+            if self._instrumentation is not None:
+                timings = self._instrumentation.end_move()
+                self._trace.log("time", Trace.INFO, lambda: ", ".join(
+                    f"{label} {counter['total_ms']:.1f} ms" for label, counter in
+                    sorted(timings.items(), key=lambda item: -item[1]["total_ms"]) if counter["calls"]))
+
+            # réflexion sur les réponses adverses probables (à lancer en dernier : elle utilise la mémoire)
+            if self._ponderer is not None:
+                self._ponderer.start(new_state)
             return move
         
         # Catch de toutes les erreurs
@@ -149,8 +240,63 @@ class MyPlayer(PlayerHex):
             self._memory.update(s_prime)
             if not isinstance(fallback_move, LightAction):
                 fallback_move = LightAction({"piece": self._memory.get_my_color(), "position": fallback_move})
+            if self._instrumentation is not None:
+                self._instrumentation.end_move()
             return 0, fallback_move
 
+    def trace_record(self, current_state: GameState, move: Action, score: float, elapsed: float) -> dict:
+        """
+        Enregistrement JSON du coup choisi, sur la position avant ce coup (mémoire à jour du coup adverse) :
+        plateau sans les bords (1 : moi, -1 : adversaire), distances, chemins critiques (plateau aggrandi),
+        coup, score et temps de recherche. Les distances infinies sont notées None.
+        """
+        def finite(value):
+            return float(value) if value is not None and np.isfinite(value) else None
+
+        def path(cells):
+            return [[int(i), int(j)] for i, j in cells or ()]
+
+        return {
+            "step": current_state.get_step(),
+            "player": self.get_name(),
+            "color": self._memory.get_my_color(),
+            "board": self._memory.get_board()[1:-1, 1:-1].tolist(),
+            "my_distance": finite(self._memory.get_my_distance()),
+            "adversary_distance": finite(self._memory.get_adversary_distance()),
+            "my_critical_path": path(self._memory.get_my_critical_path()),
+            "adversary_critical_path": path(self._memory.get_adversary_critical_path()),
+            "move": list(move.data["position"]),
+            "score": finite(score),
+            "time": elapsed,
+        }
+
+    def shutdown(self):
+        """
+        Fin de partie : arrête la réflexion pendant le temps adverse, puis les processus de la recherche
+        parallèle du moteur alpha_beta (recréés à la demande si le joueur rejoue ensuite).
+        """
+        if self._ponderer is not None:
+            self._ponderer.stop()
+        if isinstance(self._ai_engine, Algorithme_minimax_alpha_beta_typeA):
+            self._ai_engine.shutdown()
+
+    def get_instrumentation(self) -> Instrumentation:
+        """
+        Compteurs par manager / métrique (snapshot() pour le coup en cours, history pour les coups joués,
+        totals() pour la partie), None si le joueur n'est pas instrumenté.
+        """
+        return self._instrumentation
+
+    def move_time_budget(self, current_state: GameState, remaining_time: float) -> float:
+        """
+        Temps (en secondes) alloué à la recherche du coup courant :
+        le temps restant est réparti sur le nombre de coups qu'il nous reste à jouer.
+        """
+        empty_cells = sum(1 for _ in current_state.get_rep().get_empty())
+        moves_left = max(self.MIN_MOVES_LEFT, empty_cells // 2)
+        budget = min(remaining_time / moves_left, self.MAX_MOVE_TIME)
+        return budget * self.TIME_SAFETY_MARGIN
+
     # def display_hex_matrix(self, probability_board):
     #     """
     #     Affiche une matrice avec un affichage hexagonal,
@@ -0,0 +1,143 @@
+import argparse
+import contextlib
+import inspect
+import io
+import json
+import os
+import random
+import sys
+import time
+from argparse import RawTextHelpFormatter
+from concurrent.futures import ProcessPoolExecutor
+from os.path import basename, splitext, dirname
+
+import numpy as np
+
+from board_hex import BoardHex
+from game_state_hex import GameStateHex
+
+PLAYERS = ("p1", "p2")
+SEED_OFFSETS = {"p1": 0, "p2": 1_000_000} # décalage de la graine de chaque joueur (graines distinctes dans une partie)
+
+
+def load_player_class(path):
+    """ Classe MyPlayer du module path (comme main_hex.py)."""
+    folder = dirname(os.path.abspath(path))
+    if folder not in sys.path:
+        sys.path.append(folder)
+    return __import__(splitext(basename(path))[0], fromlist=[None]).MyPlayer
+
+
+def play_game(game, paths, time_limit, seed):
+    """
+    Joue une partie sans GameMaster ni proxys : p1 a les rouges (commence) si game est pair, les bleus sinon.
+    Un joueur qui dépasse son temps ou lève une exception perd la partie.
+    Les joueurs dont le constructeur a un paramètre seed reçoivent seed + game + SEED_OFFSETS[label] :
+    la partie se rejoue à l'identique tant qu'aucune recherche n'est interrompue par son budget de temps.
+
+    Returns:
+        dict résumant la partie (gagnant, coups, temps et noeuds par joueur)
+    """
+    random.seed(seed + game)
+    np.random.seed(seed + game)
+    labels = PLAYERS if game % 2 == 0 else PLAYERS[::-1] # (rouge, bleu)
+    players = {}
+    for label, piece_type in zip(labels, ("R", "B")):
+        player_class = load_player_class(paths[label])
+        options = {}
+        if "seed" in inspect.signature(player_class).parameters:
+            options["seed"] = seed + game + SEED_OFFSETS[label]
+        players[label] = player_class(piece_type, name=f"{label}_{piece_type}", **options)
+    red, blue = players[labels[0]], players[labels[1]]
+    label_of = {player.get_id(): label for label, player in players.items()}
+
+    state = GameStateHex(scores={red.get_id(): 0, blue.get_id(): 0}, next_player=red, players=[red, blue],
+                         rep=BoardHex(env={}, dim=[14, 14]), step=0)
+    stats = {label: {"moves": 0, "time": 0.0, "nodes": None} for label in PLAYERS}
+    remaining = {label: float(time_limit) for label in PLAYERS}
+    winner, reason = None, "connection"
+    while not state.is_done():
+        player = state.next_player
+        label = label_of[player.get_id()]
+        engine = getattr(player, "_ai_engine", None)
+        nodes_before = getattr(engine, "nodes", None)
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()): # les joueurs peuvent afficher des traces à chaque coup
+                action = player.compute_action(current_state=state, remaining_time=remaining[label])
+        except Exception as error:
+            winner, reason = PLAYERS[1 - PLAYERS.index(label)], f"{label} error: {error!r}"
+            break
+        elapsed = time.perf_counter() - start
+        remaining[label] -= elapsed
+        stats[label]["moves"] += 1
+        stats[label]["time"] += elapsed
+        if nodes_before is not None:
+            stats[label]["nodes"] = (stats[label]["nodes"] or 0) + engine.nodes - nodes_before
+        if remaining[label] < 0:
+            winner, reason = PLAYERS[1 - PLAYERS.index(label)], f"{label} timeout"
+            break
+        state = state.apply_action(action)
+    for player in players.values():
+        shutdown = getattr(player, "shutdown", None) # absent des anciennes versions de MyPlayer
+        if shutdown is not None:
+            shutdown()
+
+    if winner is None:
+        scores = state.get_scores()
+        winner = label_of[max(scores, key=scores.get)]
+    return {"game": game, "red": labels[0], "winner": winner, "reason": reason,
+            "moves": state.get_step(), "players": stats}
+
+
+def summarize(paths, games):
+    """ Résumé lisible par machine : taux de victoire (global et par couleur), temps moyen par coup, noeuds/s."""
+    summary = {"players": dict(paths), "games": len(games), "results": {}}
+    for label in PLAYERS:
+        wins = [game for game in games if game["winner"] == label]
+        as_red = [game for game in games if game["red"] == label]
+        moves = sum(game["players"][label]["moves"] for game in games)
+        elapsed = sum(game["players"][label]["time"] for game in games)
+        nodes = [game["players"][label]["nodes"] for game in games if game["players"][label]["nodes"] is not None]
+        summary["results"][label] = {
+            "wins": len(wins),
+            "win_rate": len(wins) / len(games) if games else None,
+            "wins_as_red": sum(1 for game in wins if game["red"] == label),
+            "games_as_red": len(as_red),
+            "wins_as_blue": sum(1 for game in wins if game["red"] != label),
+            "games_as_blue": len(games) - len(as_red),
+            "moves": moves,
+            "avg_move_time": elapsed / moves if moves else None,
+            "nodes": sum(nodes) if nodes else None,
+            "nodes_per_sec": sum(nodes) / elapsed if nodes and elapsed > 0 else None,
+        }
+    summary["details"] = games
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                        prog="selfplay_hex.py",
+                        description="Headless matches between two players (no GameMaster, no GUI):\n"
+                                    "the colours alternate from one game to the next, games run in parallel processes\n"
+                                    "and a JSON summary (win rates, average move time, nodes/s) is written at the end.",
+                        formatter_class=RawTextHelpFormatter)
+    parser.add_argument("players_list", nargs=2, help="The two player modules (e.g. my_player.py greedy_player_hex.py)")
+    parser.add_argument("-n", "--games", type=int, default=10, help="Number of games\n\n")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(), help="Number of parallel game processes\n\n")
+    parser.add_argument("-t", "--time-limit", type=float, default=60*15, help="Time (s) of each player for a game\n\n")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Seed of the random generators and of the players accepting one\n(game i uses seed + i, offset for p2)\n\n")
+    parser.add_argument("-o", "--output", default=None, help="JSON file of the summary (default: standard output)\n\n")
+    args = parser.parse_args()
+
+    paths = dict(zip(PLAYERS, args.players_list))
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(play_game, game, paths, args.time_limit, args.seed) for game in range(args.games)]
+        games = [future.result() for future in futures]
+
+    summary = json.dumps(summarize(paths, games), indent=2)
+    if args.output is None:
+        print(summary)
+    else:
+        with open(args.output, "w") as file:
+            file.write(summary)
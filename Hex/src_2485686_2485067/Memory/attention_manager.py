@@ -76,7 +76,11 @@ class Attention_manager(Manager):
     @override
     def undo(self):
         self._memory.get_attention_history().pop()
-        self._memory.attention_board = np.copy(self.softmax(self._memory.attention_board_history[-1]))
+        if len(self._memory.attention_board_history) == 1:
+            # retour à l'état initial : cette matrice n'a jamais été normalisée (softmax de -inf partout)
+            self._memory.attention_board = np.copy(self._memory.attention_board_history[0])
+        else:
+            self._memory.attention_board = np.copy(self.softmax(self._memory.attention_board_history[-1]))
         self.local_attention_board = np.copy(self._memory.get_attention_history()[-1])
 
     def softmax(self,X):
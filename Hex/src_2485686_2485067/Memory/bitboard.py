@@ -0,0 +1,160 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+import numpy as np
+from src_2485686_2485067.geometry import DIRECTIONS, BRIDGE_DIRECTIONS
+
+
+SIDE = 16 # côté du plateau aggrandi (14 + 2 bords)
+FULL = (1 << (SIDE * SIDE)) - 1 # toutes les cases du plateau aggrandi
+
+def _bit(position: tuple) -> int:
+    return 1 << (position[0] * SIDE + position[1])
+
+def _columns_mask(columns) -> int:
+    mask = 0
+    for x in range(SIDE):
+        for y in columns:
+            mask |= 1 << (x * SIDE + y)
+    return mask
+
+def _shift_spec(dx: int, dy: int) -> tuple:
+    """
+    (décalage de bits, masque des cases de départ) d'une translation de (dx, dy).
+    Les cases qui sortiraient par une colonne sont retirées avant le décalage (sinon elles
+    réapparaîtraient sur la ligne voisine); celles qui sortent par une ligne tombent hors des 256 bits.
+    """
+    return dx * SIDE + dy, _columns_mask([y for y in range(SIDE) if 0 <= y + dy < SIDE])
+
+NEIGHBOUR_SHIFTS = tuple(_shift_spec(dx, dy) for dx, dy in DIRECTIONS)
+
+# Maillons (pont) vus depuis leur extrémité la plus petite dans l'ordre (ligne, colonne) :
+# (second pion, espace 1, espace 2), dans l'ordre de BRIDGE_DIRECTIONS
+BRIDGES = tuple(BRIDGE_DIRECTIONS[name] for name in ("SOUTH", "SOUTH_EAST", "SOUTH_WEST"))
+# translations inverses : bit p levé ssi la case p + offset est dans le masque
+BRIDGE_SHIFTS = tuple(tuple(_shift_spec(-dx, -dy) for dx, dy in bridge) for bridge in BRIDGES)
+
+FIRST_ROW = _columns_mask(range(SIDE)) & ((1 << SIDE) - 1)
+LAST_ROW = FIRST_ROW << ((SIDE - 1) * SIDE)
+FIRST_COLUMN = _columns_mask([0])
+LAST_COLUMN = _columns_mask([SIDE - 1])
+
+
+def shift(mask: int, spec: tuple) -> int:
+    """ Translation d'un masque (spec : voir _shift_spec)."""
+    offset, source = spec
+    mask &= source
+    return (mask << offset) & FULL if offset >= 0 else mask >> -offset
+
+def neighbours(mask: int) -> int:
+    """ Cases voisines d'au moins une case de mask."""
+    result = 0
+    for spec in NEIGHBOUR_SHIFTS:
+        result |= shift(mask, spec)
+    return result
+
+def flood_fill(seed: int, within: int) -> int:
+    """ Composantes de within contenant une case de seed (croissance par décalages successifs)."""
+    region = seed & within
+    while True:
+        grown = (region | neighbours(region)) & within
+        if grown == region:
+            return region
+        region = grown
+
+def positions(mask: int):
+    """ Positions (i, j) des cases de mask, par indice croissant."""
+    while mask:
+        low = mask & -mask
+        index = low.bit_length() - 1
+        yield divmod(index, SIDE)
+        mask ^= low
+
+
+class BitBoard:
+    """
+    Représentation du plateau aggrandi (16x16) par deux entiers de 256 bits, un par valeur de pion
+    (1 : mes pions, -1 : ceux de l'adversaire), la case (i, j) étant le bit i * 16 + j.
+    Les bords sont des pions comme dans Memory.board.
+
+    Tenu à jour par BoardManager en même temps que Memory.board : les managers peuvent l'interroger
+    (voisinage, connexité, maillons) par opérations sur des masques au lieu de parcourir le tableau numpy.
+    """
+
+    def __init__(self, board: np.ndarray, vertical_value: int):
+        """
+        Args:
+            board: plateau aggrandi de la mémoire
+            vertical_value: valeur des pions du joueur qui relie la ligne 0 à la ligne 15
+        """
+        self.vertical_value = vertical_value
+        self.stones = {1: 0, -1: 0}
+        self.load(board)
+
+    def load(self, board: np.ndarray):
+        """ Recharge tout le plateau depuis le tableau numpy."""
+        flat = board.ravel()
+        for value in (1, -1):
+            mask = 0
+            for index in np.flatnonzero(flat == value).tolist():
+                mask |= 1 << index
+            self.stones[value] = mask
+
+    def set(self, position: tuple, value: int):
+        """ Pose un pion de valeur value en position (case vide)."""
+        self.stones[value] |= _bit(position)
+
+    def clear(self, position: tuple):
+        """ Retire le pion en position."""
+        bit = _bit(position)
+        self.stones[1] &= ~bit
+        self.stones[-1] &= ~bit
+
+    def get(self, position: tuple) -> int:
+        """ Valeur de la case (1, -1 ou 0 si vide)."""
+        bit = _bit(position)
+        if self.stones[1] & bit:
+            return 1
+        if self.stones[-1] & bit:
+            return -1
+        return 0
+
+    def empty(self) -> int:
+        """ Masque des cases vides."""
+        return FULL & ~(self.stones[1] | self.stones[-1])
+
+    def is_connected(self, value: int) -> bool:
+        """ Vrai si les pions de valeur value relient leurs deux bords."""
+        stones = self.stones[value]
+        if value == self.vertical_value:
+            start, target = FIRST_ROW, LAST_ROW
+        else:
+            start, target = FIRST_COLUMN, LAST_COLUMN
+        return flood_fill(start & stones, stones) & target != 0
+
+    def group(self, position: tuple) -> int:
+        """ Masque du groupe de pions connectés contenant position."""
+        value = self.get(position)
+        if value == 0:
+            return 0
+        return flood_fill(_bit(position), self.stones[value])
+
+    def bridges(self, value: int) -> list:
+        """
+        Maillons des pions de valeur value : deux pions à distance 2 dont les deux cases communes sont vides.
+
+        Returns:
+            [(pion 1, pion 2, (espace 1, espace 2))], chaque maillon une fois, dans l'ordre du parcours
+            ligne par ligne du plateau (celui de MaillonsManager.rebuild)
+        """
+        stones = self.stones[value]
+        empty = self.empty()
+        found = []
+        for order, ((far, space1, space2), (far_shift, space1_shift, space2_shift)) in enumerate(zip(BRIDGES, BRIDGE_SHIFTS)):
+            anchors = stones & shift(stones, far_shift) & shift(empty, space1_shift) & shift(empty, space2_shift)
+            for i, j in positions(anchors):
+                found.append(((i, j), order, (i + far[0], j + far[1]),
+                              ((i + space1[0], j + space1[1]), (i + space2[0], j + space2[1]))))
+        found.sort(key=lambda bridge: (bridge[0], bridge[1]))
+        return [(p1, p2, spaces) for p1, _, p2, spaces in found]
@@ -21,7 +21,7 @@ class BoardManager(Manager):
         self._memory = _memory
         self.original_board = self.get_initial_board()
         self.history = UniqueStack()
-        """ Historique des situations du plateau"""
+        """ Historique des situations du plateau (copie complète du plateau, ou position jouée par play())"""
 
     def get_initial_board(self):
         original_board = np.zeros((self._memory.BOARD_SIZE+2,self._memory.BOARD_SIZE+2), dtype=int) # represente le plateau
@@ -53,6 +53,7 @@ class BoardManager(Manager):
             i = int(i)
             j = int(j)
             board[i+1, j+1] = 1 if piece.piece_type == max_piece else -1 # décallage car le tableau est aggrandi
+        self._memory.bitboard.load(board)
 
         # --- Détection du coup joué ---
         diff_mask = board != prev_board
@@ -60,6 +61,7 @@ class BoardManager(Manager):
 
         if len(diff_positions) == 1:
             move = tuple(map(int, diff_positions[0]))  # convertit [i, j] en (i, j)
+            self._memory.union_find.place(move[0]-1, move[1]-1, int(board[move]))
             self._memory.move_history.push(move)      # push le tuple complet
             self._memory.last_move = self._memory.move_history.peek()
             return
@@ -68,6 +70,29 @@ class BoardManager(Manager):
         else:
             raise ValueError(f"Erreur levée dans board_manager : {len(diff_positions)} cases modifiées.")
 
+    def play(self, position: tuple, value: int):
+        """
+        Chemin rapide de la recherche : pose directement une pierre sur le plateau.
+        Seule la position est empilée dans l'historique (annulation en O(1)).
+
+        Args:
+            position: position (i, j) dans le plateau aggrandi
+            value: 1 pour mon pion, -1 pour un pion adverse
+        """
+        self._memory.board[position] = value
+        self._memory.bitboard.set(position, value)
+        self._memory.union_find.place(position[0]-1, position[1]-1, value)
+        self.history.push(position)
+        self._memory.move_history.push(position)
+        self._memory.last_move = position
+
+    def is_winning_move(self, position: tuple) -> bool:
+        """
+        Vérifie si la pierre posée en position relie les deux bords de sa couleur
+        (union-find incrémental de la mémoire, O(log n)).
+        """
+        return self._memory.union_find.is_connected(int(self._memory.board[position]))
+
     @override
     def undo(self):
         if not self.history:
@@ -75,6 +100,14 @@ class BoardManager(Manager):
         
         last_board = self.history.pop()
         board = self._memory.get_board()
-        board[:] = last_board  # copie en place
+        if isinstance(last_board, tuple):
+            board[last_board] = 0  # coup posé par play()
+            self._memory.bitboard.clear(last_board)
+            self._memory.union_find.undo()
+        else:
+            if np.any(board != last_board):
+                self._memory.union_find.undo()
+            board[:] = last_board  # copie en place
+            self._memory.bitboard.load(board)
     
         self._memory.last_move = self._memory.move_history.pop()  # on retire aussi le dernier coup
\ No newline at end of file
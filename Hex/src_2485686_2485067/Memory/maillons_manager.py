@@ -7,6 +7,7 @@ from typing import override
 import itertools
 from game_state_hex import GameState
 from src_2485686_2485067.Memory.manager import Manager
+from src_2485686_2485067.geometry import BRIDGE_DIRECTIONS, geometry
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from my_player import MyPlayer  # import uniquement pour l'IDE
@@ -24,10 +25,18 @@ class MaillonsManager(Manager):
         - de le supprimer
         - de savoir si un pion appartient à un maillon
         - de supprimer les maillons invalidés
+    La mise à jour est incrémentale : seul le voisinage du dernier coup est examiné,
+    et chaque update empile un delta permettant à undo de restaurer l'état exact.
     """
 
+    # Directions hexagonales à distance 2 : (second pion, espace 1, espace 2)
+    DIRECTIONS = BRIDGE_DIRECTIONS
+    INCREMENTAL = True # met à jour le voisinage du dernier coup au lieu de reparcourir tout le plateau
+
     def __init__(self, _memory :"Memory"):
         self._memory = _memory
+        self._history_len = None # taille de l'historique des coups lors du dernier update
+        self._delta_log = [] # un delta par update : (maillons cassés précédents, _history_len précédent, delta)
 
 
     def add_links(self,p1, p2, spaces,color):
@@ -147,25 +156,72 @@ class MaillonsManager(Manager):
     @override
     def update(self,s:GameState = None):
         """
-        Parcourt le plateau et met à jour la mémoire :
-        détecte tous les maillons valides (2 pions + 2 espaces vides)
-        et les ajoute dans self._memory via add_links().
+        Met à jour les maillons après le dernier coup :
+        - un coup unique : seuls les maillons dont la case jouée est un espace (supprimés)
+          et ceux dont elle est une extrémité (ajoutés) sont modifiés
+        - sinon (premier appel, plateau reconstruit, INCREMENTAL désactivé) : parcours complet du plateau
         """
-
-        board = self._memory.get_board()
-        hauteur, largeur = board.shape
+        previous_broken = (list(self._memory.me_broken_links), list(self._memory.adversary_broken_links))
         self.broken_me_links_detector()
         self.broken_adversary_links_detector()
 
-        # Directions hexagonales à distance 2 (structure inchangée)
-        directions = {
-            "NORTH":       ((-2, 1), (-1, 0), (-1, 1)),
-            "SOUTH":       ((2, -1), (1, 0), (1, -1)),
-            "NORTH_EAST":  ((-1, 2), (-1, 1), (0, 1)),
-            "NORTH_WEST":  ((-1, -1), (-1, 0), (0, -1)),
-            "SOUTH_EAST":  ((1, 1), (1, 0), (0, 1)),
-            "SOUTH_WEST":  ((1, -2), (1, -1), (0, -1))
-        }
+        history_len = self._memory.move_history.len()
+        if self.INCREMENTAL and self._history_len is not None and history_len == self._history_len + 1:
+            delta = self.place_stone(self._memory.move_history.peek())
+        elif history_len == self._history_len:
+            delta = ([], []) # aucun nouveau pion
+        else:
+            delta = self.rebuild()
+
+        self._delta_log.append((previous_broken, self._history_len, delta))
+        self._history_len = history_len
+
+    def place_stone(self, position):
+        """
+        Met à jour les maillons autour d'un pion qui vient d'être posé en position.
+
+        Returns:
+            (maillons supprimés [(clé, espaces, couleur)], maillons ajoutés [(clé, couleur)])
+        """
+        board = self._memory.get_board()
+        my_color = self._memory.get_my_color()
+        adversary_color = self._memory.get_adversary_color()
+
+        # Les maillons dont la case jouée est un espace disparaissent
+        removed = []
+        for space_links, links, color in ((self._memory.me_space_links, self._memory.me_links, my_color),
+                                          (self._memory.adversary_space_links, self._memory.adversary_links, adversary_color)):
+            keys = space_links.get(position)
+            if keys:
+                for key in list(keys):
+                    removed.append((key, links[key], color))
+                    self.remove_maillon(*key, color)
+
+        # Nouveaux maillons ayant le pion posé pour extrémité
+        added = []
+        current = board[position]
+        color = my_color if current == 1 else adversary_color
+        grid = geometry(board.shape[0])
+        for p2, space1, space2 in grid.bridges[grid.index(position)]:
+            if board[p2] == current and board[space1] == 0 and board[space2] == 0:
+                key = frozenset({position, p2})
+                if key in self._memory.me_links or key in self._memory.adversary_links:
+                    continue
+                self.add_links(position, p2, [space1, space2], color)
+                added.append((key, color))
+        return removed, added
+
+    def rebuild(self):
+        """
+        Parcourt tout le plateau et recalcule tous les maillons valides (2 pions + 2 espaces vides).
+
+        Returns:
+            ("full", copie des maillons avant recalcul) pour undo
+        """
+        snapshot = (dict(self._memory.me_links),
+                    {k: set(v) for k, v in self._memory.me_space_links.items()},
+                    dict(self._memory.adversary_links),
+                    {k: set(v) for k, v in self._memory.adversary_space_links.items()})
 
         # Nettoyage des anciens maillons avant mise à jour
         self._memory.me_links.clear()
@@ -173,37 +229,31 @@ class MaillonsManager(Manager):
         self._memory.adversary_links.clear()
         self._memory.adversary_space_links.clear()
 
-        # Parcours du plateau
-        for i in range(hauteur):
-            for j in range(largeur):
-                current = board[i, j]
-                if current == 0:
-                    continue  # case vide → on ignore
-
-                # Pour chaque direction possible
-                for _, ((di, dj), (di1, dj1), (di2, dj2)) in directions.items():
-                    p1 = (i, j)
-                    p2 = (i + di, j + dj)
-                    space1 = (i + di1, j + dj1)
-                    space2 = (i + di2, j + dj2)
-
-                    # Vérification des bornes
-                    if not (0 <= p2[0] < hauteur and 0 <= p2[1] < largeur):
-                        continue
-                    if not (0 <= space1[0] < hauteur and 0 <= space1[1] < largeur):
-                        continue
-                    if not (0 <= space2[0] < hauteur and 0 <= space2[1] < largeur):
-                        continue
-
-                    # Test de validité du maillon
-                    if board[p2] == current and board[space1] == 0 and board[space2] == 0:
-                        color = self._memory.get_my_color() if current == 1 else self._memory.get_adversary_color()
-                        self.add_links(p1, p2, [space1, space2], color)
-
-
-                    
+        # Maillons de chaque couleur par opérations sur les masques du bitboard
+        bitboard = self._memory.get_bitboard()
+        for value, color in ((1, self._memory.get_my_color()), (-1, self._memory.get_adversary_color())):
+            for p1, p2, spaces in bitboard.bridges(value):
+                self.add_links(p1, p2, list(spaces), color)
+        return ("full", snapshot)
+
     @override
     def undo(self):
-        # Le plateau a déjà été restauré par BoardManager
-        # Donc on recalcule simplement les maillons à partir de l'état actuel
-        self.update()
\ No newline at end of file
+        """
+        Restaure exactement les maillons (et maillons cassés) d'avant le dernier update.
+        Le plateau a déjà été restauré par BoardManager.
+        """
+        previous_broken, history_len, delta = self._delta_log.pop()
+        if delta[0] == "full":
+            for target, saved in zip((self._memory.me_links, self._memory.me_space_links,
+                                      self._memory.adversary_links, self._memory.adversary_space_links), delta[1]):
+                target.clear()
+                target.update(saved)
+        else:
+            removed, added = delta
+            for key, color in added:
+                self.remove_maillon(*key, color)
+            for key, spaces, color in removed:
+                self.add_links(*key, list(spaces), color)
+        self._memory.me_broken_links[:] = previous_broken[0]
+        self._memory.adversary_broken_links[:] = previous_broken[1]
+        self._history_len = history_len
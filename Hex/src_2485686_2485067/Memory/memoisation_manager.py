@@ -1,5 +1,5 @@
+import itertools
 import numpy as np
-import random
 from typing import Optional
 from src_2485686_2485067.Memory.manager import Manager
 from typing import override, TYPE_CHECKING
@@ -12,27 +12,46 @@ class MemoisationManager(Manager):
     Gère un cache de métriques pour les états du plateau.
     Utilise un hachage de Zobrist pour identifier chaque état.
     Se base directement sur self.board (fourni par Memory).
+
+    Le cache est conservé d'un coup à l'autre (les recherches successives partagent la plupart
+    de leurs sous-arbres) :
+        - au plus max_entries entrées, les moins récemment utilisées sont évincées en premier
+        - chaque recherche incrémente la génération, les entrées non utilisées depuis max_age
+          recherches sont évincées
+        - le cache est vidé si les coefficients de l'heuristique changent
+        - le cache est désactivé (enabled = False) pendant une recherche locale, dont les coefficients
+          ne correspondent pas au contexte du cache
     """
 
-    def __init__(self, memory: "Memory", board_shape=(16, 16), possible_values=(-1, 0, 1), seed: Optional[int] = None):
-        self._cache = {}  # {board_hash: metrics_dict}
+    MAX_ENTRIES = 1 << 18
+    MAX_AGE = 4 # nombre de recherches sans utilisation avant éviction
+
+    def __init__(self, memory: "Memory", board_shape=(16, 16), seed: Optional[int] = None,
+                 max_entries: int = MAX_ENTRIES, max_age: int = MAX_AGE):
+        self._cache = {}  # {board_hash: (metrics, génération)}, ordonné du moins au plus récemment utilisé
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.generation = 0 # incrémentée à chaque nouvelle recherche
+        self._context = None # coefficients de l'heuristique avec lesquels les entrées ont été calculées
+        self.enabled = True # False : get() ne trouve rien et set() ne stocke rien
+
+        # compteurs (remis à zéro à chaque nouvelle recherche)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
         self.memory = memory
         self.last_move = None
         self.board = memory.get_board()
         self.board_shape = board_shape
-        self.possible_values = list(possible_values)
         self.hash_stack = []  # pour "undo"
+        self._history_len = None # taille de l'historique des coups lors du dernier update
 
-        if seed is not None:
-            random.seed(seed)
-
-        # Table de hachage de Zobrist
-        self.zobrist_table = {
-            (x, y, v): random.getrandbits(64)
-            for x in range(board_shape[0])
-            for y in range(board_shape[1])
-            for v in self.possible_values
-        }
+        # Table de hachage de Zobrist : une clé 64 bits par (case, couleur)
+        # case = x * largeur + y, couleur = 0 pour mes pions (1), 1 pour ceux de l'adversaire (-1)
+        rng = np.random.default_rng(seed)
+        self.zobrist_table = rng.integers(0, np.iinfo(np.uint64).max, size=(board_shape[0] * board_shape[1], 2),
+                                          dtype=np.uint64, endpoint=True)
 
         # Hash courant du plateau
         self.current_hash = self._hash_board(self.board)
@@ -41,36 +60,87 @@ class MemoisationManager(Manager):
     # Hachage complet du plateau
     # ------------------------------
     def _hash_board(self, board: np.ndarray) -> int:
-        h = 0
         xs, ys = np.nonzero(board)  # indices des cases non vides
-        for x, y in zip(xs, ys):
-            val = board[x, y]
-            h ^= self.zobrist_table[(x, y, val)]
-        return h
+        if len(xs) == 0:
+            return 0
+        keys = self.zobrist_table[xs * self.board_shape[1] + ys, (1 - board[xs, ys]) // 2]
+        return int(np.bitwise_xor.reduce(keys))
+
+    def _zobrist_key(self, position: tuple, value: int) -> int:
+        """ Clé de Zobrist d'un pion de valeur value (1 ou -1) en position."""
+        return int(self.zobrist_table[position[0] * self.board_shape[1] + position[1], (1 - value) // 2])
 
     # ------------------------------
-    # Interface publique du cache
+    # Interface publique du cache (indexée par le hash incrémental du plateau courant)
     # ------------------------------
-    def get(self, board: np.ndarray = None):
-        """Récupère les métriques d’un plateau donné (ou du plateau courant)."""
-        key = self.current_hash if board is None else self._hash_board(board)
-        return self._cache.get(key)
+    def get(self):
+        """Récupère les métriques du plateau courant (None si absent ou si le cache est désactivé)."""
+        if not self.enabled:
+            return None
+        entry = self._cache.pop(self.current_hash, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # réinsertion en fin : l'entrée devient la plus récemment utilisée
+        self._cache[self.current_hash] = (entry[0], self.generation)
+        return entry[0]
+
+    def set(self, metrics=None):
+        """Stocke les métriques du plateau courant (évince les plus anciennes si le budget est dépassé)."""
+        if not self.enabled:
+            return
+        self._cache.pop(self.current_hash, None)
+        self._cache[self.current_hash] = (metrics, self.generation)
+        if len(self._cache) > self.max_entries:
+            self._evict_oldest(len(self._cache) - self.max_entries)
 
-    def set(self, board: np.ndarray = None, metrics=None):
-        """Stocke les métriques d’un plateau donné (ou du plateau courant)."""
-        key = self.current_hash if board is None else self._hash_board(board)
-        self._cache[key] = metrics
+    def contains(self) -> bool:
+        """Vérifie si le plateau courant est déjà dans le cache."""
+        return self.current_hash in self._cache
 
-    def contains(self, board: np.ndarray = None) -> bool:
-        """Vérifie si un plateau est déjà dans le cache."""
-        key = self.current_hash if board is None else self._hash_board(board)
-        return key in self._cache
+    def new_search(self, context=None):
+        """
+        Signale le début d'une nouvelle recherche : évince les entrées trop anciennes
+        et remet les compteurs à zéro.
+
+        Args:
+            context: coefficients de l'heuristique; le cache est vidé s'ils ont changé
+        """
+        self.hits = self.misses = self.evictions = 0
+        if context != self._context:
+            self.evictions += len(self._cache)
+            self._cache.clear()
+            self._context = context
+        self.generation += 1
+        oldest_generation = self.generation - self.max_age
+        obsolete = [key for key, (_, generation) in self._cache.items() if generation < oldest_generation]
+        for key in obsolete:
+            del self._cache[key]
+        self.evictions += len(obsolete)
+
+    def _evict_oldest(self, count):
+        """ Évince les count entrées les moins récemment utilisées."""
+        for key in list(itertools.islice(self._cache, count)):
+            del self._cache[key]
+        self.evictions += count
+
+    def get_stats(self) -> dict:
+        """ Compteurs de la recherche en cours (ou de la dernière recherche)."""
+        return {
+            "entries": len(self._cache),
+            "generation": self.generation,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
 
     def clear(self):
         """Vide le cache et réinitialise l’historique."""
         self._cache.clear()
-        self.hash_stack.clear()
         self.current_hash = self._hash_board(self.board)
+        self.hash_stack = [self.current_hash]
+        self._history_len = self.memory.move_history.len()
 
     # ------------------------------
     # Gestion incrémentale du hash
@@ -80,31 +150,23 @@ class MemoisationManager(Manager):
         """
         Met à jour le hash courant après un coup.
         Suppose que self.board a déjà été mis à jour.
-        Nécessite que self.last_move et self.previous_value soient définis avant l'appel.
+        Un coup pose toujours un pion sur une case vide : seule la clé du nouveau pion est ajoutée.
         """
         self.last_move = self.memory.move_history.peek()
-        # Si aucun coup n’a été joué (début de partie)
-        if not hasattr(self, "last_move") or self.last_move is None:
-            self.current_hash = self._hash_board(self.board)
-            self.hash_stack = [self.current_hash]
-            return
-
-        x, y = self.last_move
-        old_val = getattr(self, "previous_value", 0)
-        new_val = self.board[x, y]
-
-        # Si c’est la première fois qu’on met à jour
-        if not self.hash_stack:
+        history_len = self.memory.move_history.len()
+
+        if self.hash_stack and history_len == self._history_len + 1:
+            # Mise à jour incrémentale du hash (Zobrist)
+            x, y = self.last_move
+            self.current_hash ^= self._zobrist_key((x, y), self.board[x, y])
+        elif not self.hash_stack or history_len != self._history_len:
+            # premier appel (ou plateau reconstruit) : hash complet
             self.current_hash = self._hash_board(self.board)
-
-        # Mise à jour incrémentale du hash (Zobrist)
-        if old_val != 0:
-            self.current_hash ^= self.zobrist_table[(x, y, old_val)]
-        if new_val != 0:
-            self.current_hash ^= self.zobrist_table[(x, y, new_val)]
+        # sinon aucun nouveau pion : le hash est inchangé
 
         # Sauvegarde du hash courant
         self.hash_stack.append(self.current_hash)
+        self._history_len = history_len
 
 
     @override
@@ -113,3 +175,4 @@ class MemoisationManager(Manager):
         if self.hash_stack:
             self.hash_stack.pop()
             self.current_hash = self.hash_stack[-1] if self.hash_stack else self._hash_board(self.board)
+        self._history_len = self.memory.move_history.len()
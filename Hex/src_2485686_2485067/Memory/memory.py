@@ -5,15 +5,19 @@
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from my_player import MyPlayer  # import uniquement pour l'IDE
+    from src_2485686_2485067.instrumentation import Instrumentation
 
 import numpy as np
 from seahorse.game.game_state import GameState
+from union_find_hex import HexUnionFind
 from src_2485686_2485067.Memory.maillons_manager import MaillonsManager
 from src_2485686_2485067.Memory.board_manager import BoardManager
 from src_2485686_2485067.Memory.attention_manager import Attention_manager
 from src_2485686_2485067.Memory.trapezoid_manager import TrapezoidManager
 from src_2485686_2485067.Memory.memoisation_manager import MemoisationManager
+from src_2485686_2485067.Memory.transposition_table import TranspositionTable
 from src_2485686_2485067.Memory.UniqueStack import UniqueStack
+from src_2485686_2485067.Memory.bitboard import BitBoard
 from src_2485686_2485067.Metrics.distance import Distance
 
 
@@ -21,8 +25,24 @@ from src_2485686_2485067.Metrics.distance import Distance
 
 class Memory():
     BOARD_SIZE = 14
-
-    def __init__(self :"MyPlayer",joueur):
+    LAZY = True # les managers dérivés ne sont mis à jour qu'à la lecture de leurs données (False : à chaque coup)
+    ZOBRIST_SEED = 0 # même hash de Zobrist dans tous les processus (tirages de la recherche, voir Algorithme_minimax_alpha_beta_typeA)
+
+    # Indices des managers dérivés (dans l'ordre du pipeline)
+    LINKS = 0
+    DISTANCE = 1
+    TRAPEZOID = 2
+    ATTENTION = 3
+    DERIVED_STAGES = 4
+
+    def __init__(self :"MyPlayer",joueur, cache_max_entries: int = MemoisationManager.MAX_ENTRIES,
+                 cache_max_age: int = MemoisationManager.MAX_AGE):
+        """
+        Args:
+            joueur: joueur propriétaire de la mémoire
+            cache_max_entries: nombre maximal d'entrées du cache de l'heuristique
+            cache_max_age: nombre de recherches sans utilisation avant l'éviction d'une entrée du cache
+        """
         self.joueur = joueur
 
         # GENERAL
@@ -42,6 +62,10 @@ class Memory():
 
         self.move_history = UniqueStack() # tuple(x,y) historique des coups
         self.last_move = None # Permet de stocker le dernier coup retiré lors d'un pop 
+        # connexité des pierres (plateau sans les bords), mise à jour coup par coup et annulable
+        self.union_find = HexUnionFind(self.BOARD_SIZE, vertical_color=1 if self.my_color == "R" else -1)
+        # même plateau en deux entiers de 256 bits (un par valeur de pion), tenu à jour par BoardManager
+        self.bitboard = BitBoard(self.board, vertical_value=1 if self.my_color == "R" else -1)
         # MAILLON MANAGER
 
         # Mes maillons
@@ -75,7 +99,11 @@ class Memory():
         """
 
         # cache pour l'heuristique (reset à chaque nouveau coup a jouer)
-        self.heuristique_cache = MemoisationManager(self)
+        self.heuristique_cache = MemoisationManager(self, seed=self.ZOBRIST_SEED, max_entries=cache_max_entries,
+                                                    max_age=cache_max_age)
+
+        # table de transposition de la recherche (conservée d'un coup à l'autre)
+        self.transposition_table = TranspositionTable()
 
         # MAJ par le module distance de Metrics
         self.my_critical_path = None
@@ -84,7 +112,13 @@ class Memory():
         self.adversary_distance = None
 
         # Memory manager 
-        self.manager = [BoardManager(self),MaillonsManager(self),Distance(joueur),TrapezoidManager(self),Attention_manager(self),self.heuristique_cache] # Attention l'ordre compte
+        # Les managers dérivés (maillons, distances, trapèzes, attention) sont paresseux : un coup joué
+        # les marque en retard, ils ne sont mis à jour qu'à la première lecture d'une de leurs données
+        self._lags = [0] * self.DERIVED_STAGES # nombre de coups (en haut de l'historique) non encore vus par chaque manager dérivé
+        self._replaying = False # True pendant le rattrapage (les managers lisent la mémoire directement)
+        self.board_manager = BoardManager(self)
+        self.manager = [self.board_manager,MaillonsManager(self),Distance(joueur),TrapezoidManager(self),Attention_manager(self),self.heuristique_cache] # Attention l'ordre compte
+        self.derived_manager = self.manager[1:1 + self.DERIVED_STAGES]
 
 
     def to_json(self):
@@ -116,6 +150,10 @@ class Memory():
         """Retourne ma couleur."""
         return self.adversary_color
 
+    def get_bitboard(self) -> BitBoard:
+        """ Retourne le plateau sous forme de bitboard (voir BitBoard)"""
+        return self.bitboard
+
     def get_board(self) -> np.ndarray:
         """Retourne le plateau actuel."""
         return self.board
@@ -124,6 +162,7 @@ class Memory():
 
     def get_me_links(self) -> dict:
         """Retourne la correspondance maillon <-> espaces"""
+        self._refresh(self.LINKS)
         return self.me_links
     
     def get_adversary_links(self) -> dict:
@@ -132,6 +171,7 @@ class Memory():
         Clé : frozenset des positions des deux pions adverses.
         Valeur : liste des coordonnées de l’espacement [(x1, y1), (x2, y2)].
         """
+        self._refresh(self.LINKS)
         return self.adversary_links
 
     def get_me_space_links(self) -> dict:
@@ -140,14 +180,17 @@ class Memory():
         Clé : coordonnée de l’espace vide (x, y).
         Valeur : frozenset représentant le maillon correspondant.
         """
+        self._refresh(self.LINKS)
         return self.me_space_links
     
     def get_me_broken_links(self) -> list:
         """ Retourne les maillons cassés par l'adversaire"""
+        self._refresh(self.LINKS)
         return self.me_broken_links
     
     def get_adversary_broken_links(self) -> list:
         """ Retourne les maillons brisés de l'adversaire par mes propres coups """
+        self._refresh(self.LINKS)
         return self.adversary_broken_links
 
     def get_adversary_space_links(self) -> dict:
@@ -156,12 +199,14 @@ class Memory():
         Clé : coordonnée de l’espace vide (x, y).
         Valeur : frozenset représentant le maillon correspondant.
         """
+        self._refresh(self.LINKS)
         return self.adversary_space_links
 
     # Trapèzes
 
     def get_me_trapezoid(self) -> dict:
         """Retourne la correspondance trapeze <-> espaces   pivots -> espaces vides""" 
+        self._refresh(self.TRAPEZOID)
         return self.me_trapezoid
     
     def get_adversary_trapezoid(self) -> dict:
@@ -170,6 +215,7 @@ class Memory():
         Clé : frozenset des positions des deux pions adverses.
         Valeur : liste des coordonnées de l’espacement [(x1, y1), (x2, y2)].
         """
+        self._refresh(self.TRAPEZOID)
         return self.adversary_trapezoid
     
     def get_me_space_trapezoid(self) -> dict:
@@ -178,6 +224,7 @@ class Memory():
         Clé : coordonnée de l’espace vide (x, y).
         Valeur : frozenset représentant le trapeze(pivot) correspondant. espace_vide -> pivot
         """
+        self._refresh(self.TRAPEZOID)
         return self.me_space_trapezoid
     
     def get_adversary_space_trapezoid(self) -> dict:
@@ -186,20 +233,45 @@ class Memory():
         Clé : coordonnée de l’espace vide (x, y).
         Valeur : frozenset représentant le trapeze(pivot) correspondant. espace_vide -> pivot
         """
+        self._refresh(self.TRAPEZOID)
         return self.adversary_space_trapezoid
     
     def get_me_broken_trapezoid(self) -> list:
         """ Retourne les trapezes cassés par l'adversaire"""
+        self._refresh(self.TRAPEZOID)
         return self.me_broken_trapezoid
     
     def get_adversary_broken_trapezoid(self) -> list:
         """ Retourne les trapezes brisés de l'adversaire par mes propres coups """
+        self._refresh(self.TRAPEZOID)
         return self.adversary_broken_trapezoid
 
 
 
 
     
+    # Distances
+
+    def get_my_distance(self) -> float:
+        """ Retourne ma distance (Dijkstra) jusqu'à mon bord opposé"""
+        self._refresh(self.DISTANCE)
+        return self.my_distance
+
+    def get_adversary_distance(self) -> float:
+        """ Retourne la distance (Dijkstra) de l'adversaire jusqu'à son bord opposé"""
+        self._refresh(self.DISTANCE)
+        return self.adversary_distance
+
+    def get_my_critical_path(self) -> list:
+        """ Retourne mon chemin critique"""
+        self._refresh(self.DISTANCE)
+        return self.my_critical_path
+
+    def get_adversary_critical_path(self) -> list:
+        """ Retourne le chemin critique de l'adversaire"""
+        self._refresh(self.DISTANCE)
+        return self.adversary_critical_path
+
     def get_move_history(self):
         """Retourne la liste de coups joués"""
         return self.move_history
@@ -208,12 +280,14 @@ class Memory():
         """
         Retourne la matrice d'attention
         """
+        self._refresh(self.ATTENTION)
         return self.attention_board
     
     def get_attention_history(self):
         """
         Retourne l'historique de la matrice d'attention
         """
+        self._refresh(self.ATTENTION)
         return self.attention_board_history
 
 
@@ -222,19 +296,84 @@ class Memory():
         """
         Update de la mémoire p
         """
+        self._refresh(self.DERIVED_STAGES - 1)
         for elem_manager in self.manager:
             elem_manager.update(current_state)
         return
     
+    def play(self, position: tuple, mine: bool):
+        """
+        Chemin rapide utilisé par la recherche : pose une pierre directement sur le plateau
+        (sans GameState) et met à jour le hash. Les managers dérivés sont seulement marqués
+        en retard (voir _refresh), ou mis à jour tout de suite si LAZY est désactivé. Annulable par undo().
+
+        Args:
+            position: position (i, j) dans le plateau aggrandi
+            mine: True si la pierre est à moi
+        """
+        self.board_manager.play(position, 1 if mine else -1)
+        self.heuristique_cache.update(None)
+        for stage in range(self.DERIVED_STAGES):
+            self._lags[stage] += 1
+        if not self.LAZY:
+            self._refresh(self.DERIVED_STAGES - 1)
+        return
+
     def undo(self):
         """ revient à l'état précédent """
-        for elem_manager in self.manager:
-            elem_manager.undo()
+        self.board_manager.undo()
+        for stage, elem_manager in enumerate(self.derived_manager):
+            # un manager qui n'a pas vu le coup n'a rien à annuler
+            if self._lags[stage] > 0:
+                self._lags[stage] -= 1
+            else:
+                elem_manager.undo()
+        self.heuristique_cache.undo()
         return
 
+    def instrument(self, instrumentation: "Instrumentation"):
+        """
+        Chronomètre update / play / undo de la mémoire et update / undo de chaque manager
+        (ainsi que play du BoardManager), sous les étiquettes "Memory.update", "Distance.undo", ...
+        """
+        for method_name in ("update", "play", "undo"):
+            instrumentation.wrap(self, method_name, f"Memory.{method_name}")
+        for elem_manager in self.manager:
+            for method_name in ("update", "undo"):
+                instrumentation.wrap(elem_manager, method_name, f"{type(elem_manager).__name__}.{method_name}")
+        instrumentation.wrap(self.board_manager, "play", f"{type(self.board_manager).__name__}.play")
 
+    def _refresh(self, stage: int):
+        """
+        Met à jour les managers dérivés jusqu'à stage (inclus) s'ils sont en retard.
 
-
+        Les coups en retard sont rejoués un par un (retirés temporairement du plateau puis reposés)
+        pour que chaque manager voie exactement la même suite de mises à jour qu'en mode immédiat.
+        Seul le dernier coup peut rester en retard pour les managers après stage.
+        """
+        if self._replaying or self._lags[stage] == 0:
+            return
+        self._replaying = True
+        try:
+            pending = max(self._lags) # les managers en aval sont toujours au moins autant en retard
+            moves = [self.move_history.pop() for _ in range(pending)][::-1]
+            values = [self.board[move] for move in moves]
+            for move in moves:
+                self.board[move] = 0
+                self.bitboard.clear(move)
+            for ply, (move, value) in enumerate(zip(moves, values)):
+                self.board[move] = value
+                self.bitboard.set(move, value)
+                self.move_history.push(move)
+                last_stage = stage if ply == pending - 1 else self.DERIVED_STAGES - 1
+                for idx in range(last_stage + 1):
+                    # ce coup est-il en retard pour ce manager ?
+                    if self._lags[idx] >= pending - ply:
+                        self.derived_manager[idx].update(None)
+            for idx in range(self.DERIVED_STAGES):
+                self._lags[idx] = 0 if idx <= stage else min(self._lags[idx], 1)
+        finally:
+            self._replaying = False
 
     def print__memory(self):
         """
@@ -245,6 +384,8 @@ class Memory():
         - l’historique des coups
         """
 
+        self._refresh(self.DERIVED_STAGES - 1)
+
         print("\n" + "=" * 60)
         print(f"🧠  MÉMOIRE DU JOUEUR ({self.my_color})")
         print("=" * 60)
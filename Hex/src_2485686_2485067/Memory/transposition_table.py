@@ -0,0 +1,105 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+
+class TranspositionTable:
+    """
+    Table de transposition de taille fixe, indexée par le hash de Zobrist du plateau.
+
+    Chaque case de la table contient deux entrées :
+        - depth_preferred : n'est remplacée que par une recherche au moins aussi profonde
+          (ou si l'entrée date d'une recherche précédente)
+        - always_replace : toujours remplacée
+    Une entrée est un tuple (clé, profondeur, valeur, borne, meilleur_coup, génération).
+    La valeur est toujours exprimée du point de vue de MAX.
+    La table est conservée d'un coup à l'autre, mais vidée si les coefficients de l'heuristique changent
+    (les valeurs et bornes stockées ne sont valides que pour les coefficients qui les ont produites).
+    """
+
+    # Type de borne
+    EXACT = 0
+    LOWER_BOUND = 1 # la vraie valeur est >= valeur stockée (coupure beta)
+    UPPER_BOUND = 2 # la vraie valeur est <= valeur stockée (aucun coup n'a dépassé alpha)
+
+    # Indices dans une entrée
+    KEY = 0
+    DEPTH = 1
+    VALUE = 2
+    FLAG = 3
+    MOVE = 4
+    GENERATION = 5
+
+    def __init__(self, size_log2: int = 16):
+        self.size = 1 << size_log2
+        self.mask = self.size - 1
+        self.depth_preferred = [None] * self.size
+        self.always_replace = [None] * self.size
+        self.generation = 0 # incrémentée à chaque nouvelle recherche
+        self._context = None # coefficients de l'heuristique avec lesquels les entrées ont été calculées
+
+        # compteurs (remis à zéro à chaque nouvelle recherche)
+        self.hits = 0
+        self.misses = 0
+
+    def new_search(self, context=None):
+        """
+        Signale le début d'une nouvelle recherche (les anciennes entrées deviennent remplaçables).
+
+        Args:
+            context: coefficients de l'heuristique; la table est vidée s'ils ont changé
+        """
+        if context != self._context:
+            self.clear()
+            self._context = context
+        self.generation += 1
+        self.hits = self.misses = 0
+
+    def probe(self, key: int):
+        """ Retourne l'entrée associée à key, ou None."""
+        index = key & self.mask
+        entry = self.depth_preferred[index]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        entry = self.always_replace[index]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key: int, depth: int, value: float, flag: int, best_move):
+        """ Enregistre le résultat d'un noeud (best_move est une position (i, j) ou None)."""
+        index = key & self.mask
+        entry = (key, depth, value, flag, best_move, self.generation)
+        current = self.depth_preferred[index]
+        if (current is None or current[0] == key or current[1] <= depth
+                or current[5] != self.generation):
+            # l'ancienne entrée profonde est rétrogradée plutôt que perdue
+            if current is not None and current[0] != key:
+                self.always_replace[index] = current
+            self.depth_preferred[index] = entry
+        else:
+            self.always_replace[index] = entry
+
+    def clear(self):
+        """ Vide la table."""
+        self.depth_preferred = [None] * self.size
+        self.always_replace = [None] * self.size
+        self.generation = 0
+
+    def get_stats(self) -> dict:
+        """ Compteurs de la recherche en cours (ou de la dernière recherche)."""
+        return {
+            "generation": self.generation,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def to_json(self):
+        """Sérialisation JSON compatible Seahorse."""
+        return {
+            "size": self.size,
+            "generation": self.generation
+        }
@@ -16,30 +16,11 @@ if TYPE_CHECKING:
 if TYPE_CHECKING:
     from src_2485686_2485067.Memory.memory import Memory
 
-class TrapezoidManager(Manager):
-    """
-    Gère les trapèzes du jeu de Hex.
-    Un trapèze est défini par :
-        - 1 jetons séparé de deux lignes/colonnes vides entre le bord de sa couleur
-        - 8 cases vides autour 
-    Permet :
-        - d'ajouter un trapèze
-        - de le supprimer
-        - de savoir si un pion appartient à un trapèze
-        - de supprimer un trapèze invalidé
-    """
-
-    def __init__(self, _memory :"Memory"):
-        self._memory = _memory
-        self.board = _memory.get_board()
-
-        self.lines_down = [_memory.get_board()[10,2:15],_memory.get_board()[11,2:15],_memory.get_board()[12,2:15]]
-        self.lines_up = [_memory.get_board()[6,2:15],_memory.get_board()[5,2:15],_memory.get_board()[4,2:15]]
-        self.rows_right = [_memory.get_board()[2:15,10],_memory.get_board()[2:15,11],_memory.get_board()[2:15,12]]
-        self.rows_left = [_memory.get_board()[2:15,5],_memory.get_board()[2:15,4],_memory.get_board()[2:15,3]]
+BOARD_SIDE = 16 # taille du plateau aggrandi (14 + 2 bords)
 
-        # (0,x,y) 0 : signifie case vide 1: pion m'appartenant -1: pion de l'adversaire
-        self.shematic = {
+# (0,x,y) 0 : signifie case vide 1: pion m'appartenant -1: pion de l'adversaire
+# schémas relatifs au pivot, pour le bord du bas (clé : distance du pivot au bord)
+SHEMATIC = {
     "3": [(0,1,-1),(0,1,0),(0,2,-2),(0,2,-1),(0,2,0),(0,2,-3),(0,1,-2),(0,0,-1)],
     "4": [(0,1,-1),(0,1,0),(0,2,-2),(0,2,-1),(0,2,0),(0,2,-3),(0,1,-2),(0,0,-1),
           (0,3,-2),(0,3,-1),(0,3,0),(0,3,-3),(0,3,-4),(0,3,-5),(0,3,1),(0,2,1),(0,1,1),(0,1,-3),(0,2,-4)],
@@ -47,37 +28,115 @@ class TrapezoidManager(Manager):
     #       (0,-3,-3),(1,-3,-2),(0,-3,-1),(0,-3,0),(0,-4,-5),(0,-4,-4),(0,-4,-3),(0,-4,-2),(0,-4,-1),(0,-4,0)]
     "5": [(0,0,0)]
 }
-        
-        self.mirror_shematic = {
+
+MIRROR_SHEMATIC = {
     "3": [(0,1,-1),(0,1,0),(0,2,-2),(0,2,-1),(0,2,0),(0,2,1),(0,1,1),(0,0,1)],
     "4": [(0,1,-1),(0,1,0),(0,2,-2),(0,2,-1),(0,2,0),(0,2,-3),(0,1,-2),(0,0,1),
           (0,3,-2),(0,3,-1),(0,3,0),(0,3,-3),(0,3,-4),(0,3,2),(0,3,1),(0,2,1),(0,1,1),(0,1,2),(0,2,2)],
     "5": [(0,0,0)] # case toujours pleine donc on ne fait pas de mirroir sur la ligne 5
 }
 
-        self.rotated_shematic60_left = {} # bas -> gauche
-        for key, coords_list in self.shematic.items():
-            self.rotated_shematic60_left[key] = [self.rotate60_clockwise_2D(t) for t in coords_list]
 
-        self.rotated_mirror_shematic60_left = {} # bas -> gauche (mirror)
-        for key, coords_list in self.mirror_shematic.items():
-            self.rotated_mirror_shematic60_left[key] = [self.rotate60_clockwise_2D(t) for t in coords_list]
+def rotate60_clockwise_2D(coord):
+    """
+    coord : tuple (_,q, r)
+    renvoie : tuple (_,q', r') après rotation de 60° clockwise
+    """
+    x,q, r = coord
+    s = -q - r           # calcul du cube complet
+    q_rot = -s            # rotation 60° clockwise
+    r_rot = -q
+    # s_rot = -r           # on n'a pas besoin de s pour la sortie 2D
+    return (x,q_rot, r_rot)
+
+def rotate180_clockwise_2D(coord):
+    """
+    coord : tuple (_,q, r)
+    renvoie : tuple (_,q', r') après rotation de 180° clockwise
+    """
+    return (coord[0],coord[1]*(-1), coord[2]*(-1))
+
+def _rotate(shematic, rotation):
+    return {key: [rotation(t) for t in coords_list] for key, coords_list in shematic.items()}
+
+ROTATED_SHEMATIC60_LEFT = _rotate(SHEMATIC, rotate60_clockwise_2D) # bas -> gauche
+ROTATED_MIRROR_SHEMATIC60_LEFT = _rotate(MIRROR_SHEMATIC, rotate60_clockwise_2D) # bas -> gauche (mirror)
+ROTATED_SHEMATIC180_TOP = _rotate(SHEMATIC, rotate180_clockwise_2D) # bas -> haut
+ROTATED_MIRROR_SHEMATIC180_TOP = _rotate(MIRROR_SHEMATIC, rotate180_clockwise_2D) # bas -> haut (mirror)
+ROTATED_SHEMATIC60_RIGHT = _rotate(ROTATED_SHEMATIC60_LEFT, rotate180_clockwise_2D) # gauche -> droite
+ROTATED_MIRROR_SHEMATIC60_RIGHT = _rotate(ROTATED_MIRROR_SHEMATIC60_LEFT, rotate180_clockwise_2D) # gauche -> droite (mirror)
 
-        self.rotated_shematic180_top = {} # bas -> haut
-        for key, coords_list in self.shematic.items():
-            self.rotated_shematic180_top[key] = [self.rotate180_clockwise_2D(t) for t in coords_list]
 
-        self.rotated_mirror_shematic180_top = {} # bas -> haut (mirror)
-        for key, coords_list in self.mirror_shematic.items():
-            self.rotated_mirror_shematic180_top[key] = [self.rotate180_clockwise_2D(t) for t in coords_list]
+def _compile_template(pivot, shematic):
+    """
+    Convertit un schéma relatif en cases absolues autour de pivot.
+
+    Returns:
+        (espaces [(0,x,y)], indices plats, valeurs attendues) ou None si le schéma sort du plateau
+    """
+    spaces = [(t[0], t[1]+pivot[0], t[2]+pivot[1]) for t in shematic]
+    if not all(0 <= x < BOARD_SIDE and 0 <= y < BOARD_SIDE for _, x, y in spaces):
+        return None
+    flat_indices = np.array([x * BOARD_SIDE + y for _, x, y in spaces], dtype=np.intp)
+    values = np.array([v for v, _, _ in spaces], dtype=int)
+    return spaces, flat_indices, values
+
+def _compile_templates():
+    """
+    Précompile, pour chaque pivot possible, la case du bord de référence (le pivot doit être de sa couleur)
+    et ses schémas (normal puis miroir) sous forme d'indices plats.
+    """
+    pivots = []
+    # 3 lignes du bas, 3 lignes du haut, 3 colonnes de gauche, 3 colonnes de droite
+    for line in (10, 11, 12):
+        for col in range(2, 15):
+            key = str(15-line)
+            pivots.append(((line, col), (15, 1), SHEMATIC[key], MIRROR_SHEMATIC[key]))
+    for line in (5, 4, 3):
+        for col in range(1, 14):
+            key = str(line)
+            pivots.append(((line, col), (0, 5), ROTATED_SHEMATIC180_TOP[key], ROTATED_MIRROR_SHEMATIC180_TOP[key]))
+    for col in (5, 4, 3):
+        for line in range(2, 15):
+            key = str(col)
+            pivots.append(((line, col), (5, 0), ROTATED_SHEMATIC60_LEFT[key], ROTATED_MIRROR_SHEMATIC60_LEFT[key]))
+    for col in (10, 11, 12):
+        for line in range(2, 15):
+            key = str(15-col)
+            pivots.append(((line, col), (5, 15), ROTATED_SHEMATIC60_RIGHT[key], ROTATED_MIRROR_SHEMATIC60_RIGHT[key]))
+
+    templates = dict()
+    for pivot, edge, shem, shem_mirror in pivots:
+        compiled = [t for t in (_compile_template(pivot, shem), _compile_template(pivot, shem_mirror)) if t is not None]
+        templates.setdefault(pivot, []).append((edge, compiled))
+    return templates
+
+TEMPLATES = _compile_templates()
+"""
+pivot (x,y) -> liste de (case du bord de référence, [(espaces, indices plats, valeurs), ...]) dans l'ordre de priorité
+"""
+
+
+class TrapezoidManager(Manager):
+    """
+    Gère les trapèzes du jeu de Hex.
+    Un trapèze est défini par :
+        - 1 jetons séparé de deux lignes/colonnes vides entre le bord de sa couleur
+        - 8 cases vides autour 
+    Permet :
+        - d'ajouter un trapèze
+        - de le supprimer
+        - de savoir si un pion appartient à un trapèze
+        - de supprimer un trapèze invalidé
+    """
 
-        self.rotated_shematic60_right = {} #gauche -> droite
-        for key, coords_list in self.rotated_shematic60_left.items():
-            self.rotated_shematic60_right[key] = [self.rotate180_clockwise_2D(t) for t in coords_list]
+    INCREMENTAL = True # revérifie seulement les pivots touchés par le dernier coup au lieu de tous les pivots
 
-        self.rotated_mirror_shematic60_right = {} #gauche -> droite (mirror)
-        for key, coords_list in self.rotated_mirror_shematic60_left.items():
-            self.rotated_mirror_shematic60_right[key] = [self.rotate180_clockwise_2D(t) for t in coords_list]
+    def __init__(self, _memory :"Memory"):
+        self._memory = _memory
+        self.board = _memory.get_board()
+        self._history_len = None # taille de l'historique des coups lors du dernier update
+        self._delta_log = [] # un delta par update : (trapèzes cassés précédents, _history_len précédent, delta)
 
     def add_trapezoid(self,p1,spaces,color):
         """
@@ -236,139 +295,170 @@ class TrapezoidManager(Manager):
     @override
     def update(self, s: GameState = None):
         """
-        Parcourt le plateau et met à jour la mémoire :
-        détecte si le dernier coup créé un trapèze
-        et l'ajoute dans self._memory via add_trapezoid().
+        Met à jour les trapèzes après le dernier coup :
+        - un coup unique : seuls les trapèzes contenant la case jouée sont retirés, puis
+          leurs pivots et la case jouée sont revérifiés
+        - sinon (premier appel, plateau reconstruit, INCREMENTAL désactivé) : vérification de tous les pivots
         """
 
         # la detection des trapèzes brisés va permettre ensuite de les restaurer pour pouvoir 
         # continuer a jouer dedans (une fois qu'un trapèze a été setup,la victoire est assuré )
 
+        previous_broken = (list(self._memory.me_broken_trapezoid), list(self._memory.adversary_broken_trapezoid))
+        history_len = self._memory.move_history.len()
+        single_move = self.INCREMENTAL and self._history_len is not None and history_len == self._history_len + 1
+
+        # copie des trapèzes touchés (ou de tous avant un recalcul) AVANT les détecteurs
+        # (qui retirent la case jouée de leurs espaces)
+        touched, snapshot = [], None
+        if single_move:
+            touched = self._touched_trapezoids(self._memory.move_history.peek())
+        elif history_len != self._history_len:
+            snapshot = self._snapshot()
+
         self.broken_me_trapezoid_detector()
         self.broken_adversary_trapezoid_detector()
 
+        if single_move:
+            delta = self.place_stone(self._memory.move_history.peek(), touched)
+        elif history_len == self._history_len:
+            delta = ([], []) # aucun nouveau pion
+        else:
+            delta = self.rebuild(snapshot)
+
+        self._memory.adversary_broken_trapezoid.clear()
+        self._delta_log.append((previous_broken, self._history_len, delta))
+        self._history_len = history_len
+
+    def _touched_trapezoids(self, position):
+        """ Trapèzes (des deux couleurs) dont position est un espace : [(clé, copie des espaces, couleur)]"""
+        touched = []
+        space = (0, position[0], position[1])
+        for space_trapezoid, trapezoids, color in ((self._memory.me_space_trapezoid, self._memory.me_trapezoid, self._memory.get_my_color()),
+                                                   (self._memory.adversary_space_trapezoid, self._memory.adversary_trapezoid, self._memory.get_adversary_color())):
+            for key in list(space_trapezoid.get(space, ())):
+                touched.append((key, list(trapezoids[key]), color))
+        return touched
+
+    def place_stone(self, position, touched):
+        """
+        Retire les trapèzes invalidés par le pion posé en position, puis revérifie
+        leurs pivots (un autre schéma peut rester valide) et la case jouée (nouveau pivot).
+
+        Returns:
+            (trapèzes retirés [(clé, espaces, couleur)], trapèzes ajoutés [(clé, couleur)])
+        """
+        for key, spaces, color in touched:
+            if self._memory.get_my_color() == color:
+                trapezoids, space_trapezoid = self._memory.me_trapezoid, self._memory.me_space_trapezoid
+            else:
+                trapezoids, space_trapezoid = self._memory.adversary_trapezoid, self._memory.adversary_space_trapezoid
+            # les espaces stockés ont pu être modifiés par les détecteurs : on nettoie avec la copie
+            for space in spaces:
+                trapezoids_for_space = space_trapezoid.get(space)
+                if trapezoids_for_space:
+                    trapezoids_for_space.discard(key)
+                    if not trapezoids_for_space:
+                        del space_trapezoid[space]
+            del trapezoids[key]
+
+        added = []
+        for pivot in [next(iter(key)) for key, _, _ in touched] + [position]:
+            key = self.check_pivot(pivot)
+            if key is not None:
+                added.append(key)
+        return touched, added
+
+    def check_pivot(self, pivot):
+        """
+        Ajoute le trapèze de pivot si l'un de ses schémas (précompilés) est valide.
+
+        Returns:
+            (clé, couleur) du trapèze ajouté, ou None
+        """
+        candidates = TEMPLATES.get(pivot)
+        if candidates is None:
+            return None
+        board = self.board
+        value = board[pivot]
+        if value == 0:
+            return None
+        key = frozenset({pivot})
+        if key in self._memory.me_trapezoid or key in self._memory.adversary_trapezoid:
+            return None
+        flat_board = board.ravel()
+        for edge, compiled in candidates:
+            # le pion doit être de la même couleur que le bord
+            if value != board[edge]:
+                continue
+            for spaces, flat_indices, values in compiled:
+                if np.array_equal(flat_board[flat_indices], values):
+                    color = self._memory.get_my_color() if value == 1 else self._memory.get_adversary_color()
+                    self.add_trapezoid(pivot, list(spaces), color)
+                    return (key, color)
+        return None
+
+    def _snapshot(self):
+        """ Copie des trapèzes des deux couleurs et de leurs espaces (restaurée par undo)."""
+        return ({k: list(v) for k, v in self._memory.me_trapezoid.items()},
+                {k: set(v) for k, v in self._memory.me_space_trapezoid.items()},
+                {k: list(v) for k, v in self._memory.adversary_trapezoid.items()},
+                {k: set(v) for k, v in self._memory.adversary_space_trapezoid.items()})
+
+    def rebuild(self, snapshot=None):
+        """
+        Vérifie tous les pivots possibles et recalcule tous les trapèzes.
+
+        Args:
+            snapshot: copie des trapèzes à restaurer par undo (défaut : celle des trapèzes actuels)
+
+        Returns:
+            ("full", copie des trapèzes avant recalcul) pour undo
+        """
+        if snapshot is None:
+            snapshot = self._snapshot()
+
         self._memory.me_trapezoid.clear()
         self._memory.me_space_trapezoid.clear()
         self._memory.adversary_trapezoid.clear()
         self._memory.adversary_space_trapezoid.clear()
 
-        my_color = self._memory.get_my_color()
-        adversary_color = self._memory.get_adversary_color()  
-
-        # on va parcourir les 3 lignes du bas
-        idx_line = 10
-        for line in self.lines_down:
-            idx_colonne = 2 # indexe de l'element
-            # pour chaque ligne, on parcourt les elements
-            for pos in line:
-                # si un pion est detecté sur la position et qu'il est de la même couleur que le bord
-                if(pos != 0 and pos == self.board[15,1]):
-                    position_initiale = (idx_line,idx_colonne)
-                    shem = self.shematic[str(15-idx_line)]
-                    shem_mirror = self.mirror_shematic[str(15-idx_line)]
-                    if self.is_a_trapez(position_initiale,shem):
-                        self.add_trapezoid(position_initiale,[(t[0], t[1]+position_initiale[0], t[2]+position_initiale[1]) for t in shem],my_color if self.board[position_initiale]==1 else adversary_color)
-                    if self.is_a_trapez(position_initiale,shem_mirror):
-                        self.add_trapezoid(position_initiale,[(t[0], t[1]+position_initiale[0], t[2]+position_initiale[1]) for t in shem_mirror],my_color if self.board[position_initiale]==1 else adversary_color)
-                    
-                idx_colonne+=1
-            idx_line+=1
-
-        # on va parcourir les 3 lignes du haut (attention on parcourt de gauche à droite)
-        idx_line = 5
-        for line in self.lines_up:
-            idx_colonne = 1 # indexe de l'element
-            # pour chaque ligne, on parcourt les elements
-            for pos in line:
-                # si un pion est detecté sur la position et qu'il est de la même couleur que le bord
-                if(self.board[idx_line,idx_colonne] != 0 and self.board[idx_line,idx_colonne] == self.board[0,5]):
-                    
-                    position_initiale = (idx_line,idx_colonne)
-                    shem = self.rotated_shematic180_top[str(idx_line)]
-                    shem_mirror = self.rotated_mirror_shematic180_top[str(idx_line)]
-                    if self.is_a_trapez(position_initiale,shem):
-                        self.add_trapezoid(position_initiale,[(t[0], t[1]+position_initiale[0], t[2]+position_initiale[1]) for t in shem],my_color if self.board[position_initiale]==1 else adversary_color)
-                    if self.is_a_trapez(position_initiale,shem_mirror):
-                        self.add_trapezoid(position_initiale,[(t[0], t[1]+position_initiale[0], t[2]+position_initiale[1]) for t in shem_mirror],my_color if self.board[position_initiale]==1 else adversary_color)
-                idx_colonne+=1
-            idx_line-=1
-
-        # on va parcourir les 3 colonnes de gauche
-        idx_colonne = 5
-        for col in self.rows_left:
-            idx_line = 2 # indexe de l'element
-            # pour chaque ligne, on parcourt les elements
-            for pos in col:
-                # si un pion est detecté sur la position et qu'il est de la même couleur que le bord
-                if(self.board[idx_line,idx_colonne] != 0 and self.board[idx_line,idx_colonne] == self.board[5,0]):
-                    position_initiale = (idx_line,idx_colonne)
-                    shem = self.rotated_shematic60_left[str(idx_colonne)]
-                    shem_mirror = self.rotated_mirror_shematic60_left[str(idx_colonne)]
-                    if self.is_a_trapez(position_initiale,shem):
-                        self.add_trapezoid(position_initiale,[(t[0], t[1]+position_initiale[0],t[2]+position_initiale[1]) for t in shem],my_color if pos==1 else adversary_color)
-                    if self.is_a_trapez(position_initiale,shem_mirror):
-                        self.add_trapezoid(position_initiale,[(t[0], t[1]+position_initiale[0],t[2]+position_initiale[1]) for t in shem_mirror],my_color if pos==1 else adversary_color)
-                idx_line+=1
-            idx_colonne-=1        
-
-        # on va parcourir les 3 colonnes de droite
-        idx_colonne = 10
-        for col in self.rows_right:
-            idx_line = 2 # indexe de l'element
-            # pour chaque ligne, on parcourt les elements
-            for pos in col:
-                # si un pion est detecté sur la position et qu'il est de la même couleur que le bord
-                if(self.board[idx_line,idx_colonne] != 0 and self.board[idx_line,idx_colonne] == self.board[5,15]):
-                    position_initiale = (idx_line,idx_colonne)
-                    shem = self.rotated_shematic60_right[str(15-idx_colonne)]
-                    shem_mirror = self.rotated_mirror_shematic60_right[str(15-idx_colonne)]
-                    if self.is_a_trapez(position_initiale,shem):
-                        self.add_trapezoid(position_initiale,[(t[0], t[1]+position_initiale[0], t[2]+position_initiale[1]) for t in shem],my_color if pos==1 else adversary_color)
-                    if self.is_a_trapez(position_initiale,shem_mirror):
-                        self.add_trapezoid(position_initiale,[(t[0], t[1]+position_initiale[0], t[2]+position_initiale[1]) for t in shem_mirror],my_color if pos==1 else adversary_color)
-                idx_line+=1
-            idx_colonne+=1        
-                    
-        self._memory.adversary_broken_trapezoid.clear()
-
-
+        for pivot in TEMPLATES:
+            self.check_pivot(pivot)
+        return ("full", snapshot)
 
     def rotate60_clockwise_2D(self,coord):
         """
         coord : tuple (_,q, r)
         renvoie : tuple (_,q', r') après rotation de 60° clockwise
         """
-        x,q, r = coord
-        s = -q - r           # calcul du cube complet
-        q_rot = -s            # rotation 60° clockwise
-        r_rot = -q
-        # s_rot = -r           # on n'a pas besoin de s pour la sortie 2D
-        return (x,q_rot, r_rot)
+        return rotate60_clockwise_2D(coord)
     
     def rotate180_clockwise_2D(self,coord):
         """
         coord : tuple (_,q, r)
         renvoie : tuple (_,q', r') après rotation de 180° clockwise
         """
-        return (coord[0],coord[1]*(-1), coord[2]*(-1))
-    
-            
-    def is_a_trapez(self,pos_initiale:tuple,liste_espaces_a_verifier:list):
-        for i in liste_espaces_a_verifier:
-            # rappel liste_espace_a_verifier a des elements de type (0,x,y)
-            position = (pos_initiale[0]+i[1],pos_initiale[1]+i[2])
-
-            # verification des bornes 
-            if not (0 <= position[0] < self.board.shape[0] and 0 <= position[1] < self.board.shape[1]):
-                return False
-            if self.board[position] != i[0]:
-                return False 
-        return True
-
-
+        return rotate180_clockwise_2D(coord)
 
+    @override
     def undo(self):
-        # Le plateau a déjà été restauré par BoardManager
-        # Donc on recalcule simplement les trapezes à partir de l'état actuel
-   
-        self.update()
\ No newline at end of file
+        """
+        Restaure exactement les trapèzes (et trapèzes cassés) d'avant le dernier update.
+        Le plateau a déjà été restauré par BoardManager.
+        """
+        previous_broken, history_len, delta = self._delta_log.pop()
+        if delta[0] == "full":
+            for target, saved in zip((self._memory.me_trapezoid, self._memory.me_space_trapezoid,
+                                      self._memory.adversary_trapezoid, self._memory.adversary_space_trapezoid), delta[1]):
+                target.clear()
+                target.update(saved)
+        else:
+            removed, added = delta
+            for key, color in added:
+                self.remove_trapezoid(key, color)
+            for key, spaces, color in removed:
+                self.add_trapezoid(key, list(spaces), color)
+        self._memory.me_broken_trapezoid[:] = previous_broken[0]
+        self._memory.adversary_broken_trapezoid[:] = previous_broken[1]
+        self._history_len = history_len
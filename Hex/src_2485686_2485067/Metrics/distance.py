@@ -5,9 +5,11 @@
 from game_state_hex import GameStateHex
 import numpy as np
 import heapq
+from collections import deque
 from typing import override, List, Tuple, Optional
 from typing import TYPE_CHECKING
 from src_2485686_2485067.Metrics.metrics import Metrics
+from src_2485686_2485067.geometry import geometry
 
 if TYPE_CHECKING:
     from my_player import MyPlayer
@@ -31,6 +33,9 @@ class Distance(Metrics):
     COST_ADV_PIECE = 0.0 #cout pour traverser une pièce à l'adversaire (pdv de l'adversaire)
     COST_MY_TRAPEZOID = 0.75 # cout pour traverser un trapeze à moi 
     COST_ADV_TRAPEZOID = 3 # cout pour traverser un trapèze de l'adversaire 
+    COST_SCALE = 20 # les coûts sont multipliés par ce facteur pour être entiers (file à seaux)
+    UNREACHED = 1 << 30 # distance (entière) d'une case non atteinte
+    INCREMENTAL = True # répare les plus courts chemins après un coup au lieu de tout recalculer
     
     def __init__(self, joueur:"MyPlayer"):
         super().__init__()
@@ -43,22 +48,44 @@ class Distance(Metrics):
         # Récupération du dernier coup
         self._last_move = None
 
+        # pile des résultats (ma_distance, distance_adverse, mon_chemin, chemin_adverse, arbres) précédant chaque update
+        self._stack = []
+
+        # Arbre des plus courts chemins de chaque joueur (clé : for_adversary), réparé d'un update à l'autre :
+        # (coûts, dist, parent, cases du chemin critique), None tant qu'il n'a pas été calculé
+        self._trees = {False: None, True: None}
+
+        # Coûts entiers et seaux de la file de Dial (un seau par distance modulo coût maximal + 1)
+        self._scaled_costs = {
+            "empty": self._scale(self.COST_EMPTY),
+            "my_link": self._scale(self.COST_MY_LINK),
+            "adv_link": self._scale(self.COST_ADV_LINK),
+            "my_piece": self._scale(self.COST_MY_PIECE),
+            "my_trapezoid": self._scale(self.COST_MY_TRAPEZOID),
+            "adv_trapezoid": self._scale(self.COST_ADV_TRAPEZOID),
+        }
+        self._buckets = [[] for _ in range(max(self._scaled_costs.values()) + 1)]
+
+    def _scale(self, cost: float) -> int:
+        """ Coût entier correspondant à cost (erreur si cost n'est pas un multiple de 1 / COST_SCALE)."""
+        scaled = round(cost * self.COST_SCALE)
+        if abs(scaled - cost * self.COST_SCALE) > 1e-9:
+            raise ValueError(f"Coût {cost} non représentable avec COST_SCALE = {self.COST_SCALE}")
+        return scaled
+
     @override
     def execute(self) -> Tuple[float, float]:
         """
         Retourne (ma_distance, distance_adversaire).
         """
         self._last_move = self.joueur._memory.move_history.peek()
-        # moi, si le dernier coup n'impacte pas le chemin optimal, on ne recalcul pas 
-        # if self._my_path_cache is None or (self._last_move and self._last_move in self._my_path_cache):
-        my_distance, my_path = self._dijkstra_player(for_adversary=False)
+        # moi
+        my_distance, my_path = self._shortest_path(for_adversary=False)
         self._my_distance_cache = my_distance
         self._my_path_cache = my_path
 
         # Adversaire
-        # if self._adv_path_cache is None or (self._last_move and self._last_move in self._adv_path_cache):
-
-        adv_distance, adv_path = self._dijkstra_player(for_adversary=True)
+        adv_distance, adv_path = self._shortest_path(for_adversary=True)
         self._adv_distance_cache = adv_distance
         self._adv_path_cache = adv_path
 
@@ -72,9 +99,67 @@ class Distance(Metrics):
         """Retourne le chemin critique de l'adversaire (à appeler après execute())."""
         return self._adv_path_cache or []
 
+    def _cell_costs(self, for_adversary: bool) -> List[int]:
+        """
+        Coût entier (voir COST_SCALE) pour entrer dans chaque case du plateau aggrandi (indices plats),
+        -1 si la case est bloquée par un pion adverse. Construit une fois par Dijkstra depuis
+        les cartes d'espaces des maillons et des trapèzes de la mémoire.
+        """
+        memory = self.joueur._memory
+        board = memory.get_board()
+        side = board.shape[1]
+        if for_adversary:
+            player_value = -1
+            my_links, opponent_links = memory.get_adversary_space_links(), memory.get_me_space_links()
+            my_trapezoids, opponent_trapezoids = memory.get_adversary_space_trapezoid(), memory.get_me_space_trapezoid()
+        else:
+            player_value = 1
+            my_links, opponent_links = memory.get_me_space_links(), memory.get_adversary_space_links()
+            my_trapezoids, opponent_trapezoids = memory.get_me_space_trapezoid(), memory.get_adversary_space_trapezoid()
+
+        # par priorité croissante : chaque règle écrase les précédentes
+        costs = [self._scaled_costs["empty"]] * (side * side)
+        for rule, spaces in (("adv_trapezoid", opponent_trapezoids), ("my_trapezoid", my_trapezoids)):
+            for value, i, j in spaces:
+                if value == 0:
+                    costs[i * side + j] = self._scaled_costs[rule]
+        for rule, spaces in (("adv_link", opponent_links), ("my_link", my_links)):
+            for i, j in spaces:
+                costs[i * side + j] = self._scaled_costs[rule]
+        for index, cell in enumerate(board.ravel().tolist()):
+            if cell == player_value:
+                costs[index] = self._scaled_costs["my_piece"]
+            elif cell != 0:
+                costs[index] = -1
+        return costs
+
+    def _shortest_path(self, for_adversary: bool) -> Tuple[float, List[Tuple[int, int]]]:
+        """
+        Distance et chemin critique du joueur, en réparant l'arbre du dernier update si possible :
+        seules les cases dont le coût a changé (et celles qui en dépendent) sont recalculées.
+        Le calcul complet n'est refait que si le coût d'une case du chemin critique a augmenté
+        (le chemin en cache n'est plus valide).
+        """
+        costs = self._cell_costs(for_adversary)
+        tree = self._trees[for_adversary]
+        repaired = None
+        if self.INCREMENTAL and tree is not None:
+            repaired = self._repair(costs, *tree)
+        if repaired is None:
+            dist, parent = self._full_search(costs, for_adversary)
+        else:
+            dist, parent = repaired
+        distance, path_indices = self._critical_path(dist, costs, for_adversary)
+        self._trees[for_adversary] = (costs, dist, parent, frozenset(path_indices))
+
+        if distance == self.UNREACHED:
+            return np.inf, []
+        positions = geometry(self.joueur._memory.get_board().shape[0]).positions
+        return distance / self.COST_SCALE, [positions[index] for index in path_indices]
+
     def _dijkstra_player(self, for_adversary: bool) -> Tuple[float, List[Tuple[int, int]]]:
         """
-        Implémentation générique de Dijkstra.
+        Calcul complet (sans réutiliser l'arbre du dernier update).
         
         Args:
             for_adversary: True pour calculer la distance de l'adversaire, False pour le joueur
@@ -82,136 +167,202 @@ class Distance(Metrics):
         Returns:
             (distance, chemin_optimal)
         """
+        costs = self._cell_costs(for_adversary)
+        dist, _ = self._full_search(costs, for_adversary)
+        distance, path_indices = self._critical_path(dist, costs, for_adversary)
+        if distance == self.UNREACHED:
+            return np.inf, []
+        positions = geometry(self.joueur._memory.get_board().shape[0]).positions
+        return distance / self.COST_SCALE, [positions[index] for index in path_indices]
+
+    def _edges(self, for_adversary: bool) -> Tuple[List[int], List[int]]:
+        """ Cases de départ et d'arrivée (indices plats) du joueur."""
         board = self.joueur._memory.get_board()
         hauteur, largeur = board.shape
-        
-        # Déterminer le joueur concerné
+        grid = geometry(hauteur)
         if for_adversary:
             player_color = self.joueur._memory.get_adversary_color()
-            player_value = -1
-            opponent_value = 1
         else:
             player_color = self.joueur.get_piece_type()
-            player_value = 1
-            opponent_value = -1
-        
-        # Initialisation
-        dist = np.full((hauteur, largeur), np.inf)
-        parent = {}  # Pour reconstruire le chemin
-        pq = []
-        objectives = set()
-        
-        # Déterminer points de départ et d'arrivée
-        is_vertical = (player_color == "R")
-        
-        if is_vertical:  # Rouge : haut → bas
-            start_row, end_row = 0, hauteur - 1
-            for col in range(largeur):
-                objectives.add((end_row, col))
-                cell = board[start_row, col]
-                
-                # Accepter les cases vides OU occupées par le joueur
-                if cell == player_value:
-                    dist[start_row, col] = 0
-                    parent[(start_row, col)] = None
-                    heapq.heappush(pq, (0, (start_row, col)))
-                elif cell == 0:
-                    dist[start_row, col] = self.COST_EMPTY
-                    parent[(start_row, col)] = None
-                    heapq.heappush(pq, (self.COST_EMPTY, (start_row, col)))
-        else:  # Bleu : gauche → droite
-            start_col, end_col = 0, largeur - 1
-            for row in range(hauteur):
-                objectives.add((row, end_col))
-                cell = board[row, start_col]
-                
-                if cell == player_value:
-                    dist[row, start_col] = 0
-                    parent[(row, start_col)] = None
-                    heapq.heappush(pq, (0, (row, start_col)))
-                elif cell == 0:
-                    dist[row, start_col] = self.COST_EMPTY
-                    parent[(row, start_col)] = None
-                    heapq.heappush(pq, (self.COST_EMPTY, (row, start_col)))
-        
-        # Récupérer les maillons et trapezes
-        if for_adversary:
-            my_links = set(self.joueur._memory.get_adversary_space_links())
-            opponent_links = set(self.joueur._memory.get_me_space_links())
-            my_trapezoids = set(self.joueur._memory.get_adversary_space_trapezoid())
-            opponent_trapezoids = set(self.joueur._memory.get_me_space_trapezoid())
-        else:
-            my_links = set(self.joueur._memory.get_me_space_links())
-            opponent_links = set(self.joueur._memory.get_adversary_space_links())
-            my_trapezoids = set(self.joueur._memory.get_me_space_trapezoid())
-            opponent_trapezoids = set(self.joueur._memory.get_adversary_space_trapezoid())
-        
-        # Directions hexagonales
-        directions = [(-1,0), (1,0), (0,-1), (0,1), (-1,1), (1,-1)]
-        
-        end_pos = None
-        
-        # Algorithme de Dijkstra
-        while pq:
-            cost, (i, j) = heapq.heappop(pq)
-            
-            # Optimisation : ignorer les doublons
-            if cost > dist[i, j]:
+        if player_color == "R":  # Rouge : haut → bas
+            return ([grid.index((0, col)) for col in range(largeur)],
+                    [grid.index((hauteur - 1, col)) for col in range(largeur)])
+        # Bleu : gauche → droite
+        return ([grid.index((row, 0)) for row in range(hauteur)],
+                [grid.index((row, largeur - 1)) for row in range(hauteur)])
+
+    def _full_search(self, costs: List[int], for_adversary: bool) -> Tuple[List[int], List[int]]:
+        """
+        Dijkstra à seaux (file de Dial) sur les indices plats et des coûts entiers :
+        les seaux sont indexés par distance modulo (coût maximal + 1), chacun est un tas d'indices
+        pour garder l'ordre (distance, indice) de l'ancienne file de priorité.
+        Toutes les cases atteignables sont fixées (l'arbre sert ensuite aux réparations).
+
+        Returns:
+            (dist, parent) : distances entières (UNREACHED si non atteinte) et parents (-1 : départ)
+        """
+        neighbours = geometry(self.joueur._memory.get_board().shape[0]).neighbours
+        size = len(costs)
+
+        # Initialisation (indices plats)
+        dist = [self.UNREACHED] * size
+        parent = [-1] * size # -1 : case de départ (ou non atteinte)
+        span = len(self._buckets)
+        buckets = self._buckets # vides à chaque appel
+        pending = 0 # nombre d'entrées dans les seaux
+
+        starts, _ = self._edges(for_adversary)
+        for index in starts:
+            # Accepter les cases vides OU occupées par le joueur (les maillons ne comptent pas au départ)
+            cost = costs[index]
+            if cost < 0:
                 continue
-            
-            # Objectif atteint
-            if (i, j) in objectives:
-                end_pos = (i, j)
-                break
-            
-            # Explorer les voisins
-            for di, dj in directions:
-                ni, nj = i + di, j + dj
-                
-                # Vérifier les limites
-                if not (0 <= ni < hauteur and 0 <= nj < largeur):
+            if cost != self._scaled_costs["my_piece"]:
+                cost = self._scaled_costs["empty"]
+            dist[index] = cost
+            heapq.heappush(buckets[cost % span], index)
+            pending += 1
+
+        current = 0
+        while pending:
+            bucket = buckets[current % span]
+            while bucket:
+                index = heapq.heappop(bucket)
+                pending -= 1
+
+                # entrée périmée (la case a été atteinte plus tôt depuis)
+                if dist[index] != current:
                     continue
-                
-                cell = board[ni, nj]
-                
-                # Case bloquée par l'adversaire
-                if cell == opponent_value:
+
+                for neighbour in neighbours[index]:
+                    cost = costs[neighbour]
+                    if cost < 0: # Case bloquée par l'adversaire
+                        continue
+                    new_cost = current + cost
+                    if new_cost < dist[neighbour]:
+                        dist[neighbour] = new_cost
+                        parent[neighbour] = index
+                        heapq.heappush(buckets[new_cost % span], neighbour)
+                        pending += 1
+            current += 1
+        return dist, parent
+
+    def _repair(self, costs: List[int], old_costs: List[int], old_dist: List[int], old_parent: List[int],
+                old_path: frozenset) -> Optional[Tuple[List[int], List[int]]]:
+        """
+        Répare l'arbre des plus courts chemins après un changement de coûts (Ramalingam-Reps) :
+        - une case devenue plus chère (ou bloquée) invalide son sous-arbre, remis à UNREACHED;
+        - une case devenue moins chère (ou débloquée) peut raccourcir les distances autour d'elle.
+        Les cases invalidées ou moins chères sont réévaluées depuis leurs voisins puis les améliorations
+        sont propagées par Dijkstra : seule la zone touchée par le coup est parcourue.
+
+        Returns:
+            (dist, parent) réparés (nouvelles listes), ou None si une case du chemin critique
+            est devenue plus chère (calcul complet nécessaire)
+        """
+        increased, decreased = [], []
+        for index, (cost, old_cost) in enumerate(zip(costs, old_costs)):
+            if cost != old_cost:
+                if old_cost >= 0 and (cost < 0 or cost > old_cost):
+                    if index in old_path:
+                        return None
+                    increased.append(index)
+                else:
+                    decreased.append(index)
+        if not increased and not decreased:
+            return old_dist, old_parent
+
+        neighbours = geometry(self.joueur._memory.get_board().shape[0]).neighbours
+        unreached = self.UNREACHED
+        dist, parent = list(old_dist), list(old_parent) # les anciens arbres restent dans la pile d'undo
+
+        # Sous-arbres des cases plus chères : leurs distances passaient par ces cases
+        seeds = list(decreased)
+        if increased:
+            children = [[] for _ in dist]
+            for index, father in enumerate(parent):
+                if father >= 0:
+                    children[father].append(index)
+            stack = list(increased)
+            while stack:
+                index = stack.pop()
+                if dist[index] == unreached:
                     continue
-                
-                # Calculer le coût de déplacement
-                if cell == player_value:
-                    move_cost = self.COST_MY_PIECE
-                elif (ni, nj) in my_links:
-                    move_cost = self.COST_MY_LINK
-                elif (ni, nj) in opponent_links:
-                    move_cost = self.COST_ADV_LINK
-                elif (0,ni,nj) in my_trapezoids:
-                    move_cost = self.COST_MY_TRAPEZOID
-                elif (0,ni,nj) in opponent_trapezoids:
-                    move_cost = self.COST_ADV_TRAPEZOID
-                else:  # Case vide
-                    move_cost = self.COST_EMPTY
-                
-                new_cost = cost + move_cost
-                
-                # Mise à jour si meilleur chemin trouvé
-                if new_cost < dist[ni, nj]:
-                    dist[ni, nj] = new_cost
-                    parent[(ni, nj)] = (i, j)
-                    heapq.heappush(pq, (new_cost, (ni, nj)))
-        
-        # Reconstruire le chemin optimal
-        if end_pos is None:
-            return np.inf, []
-        
+                dist[index] = unreached
+                parent[index] = -1
+                seeds.append(index)
+                stack.extend(children[index])
+
+        # Réévaluation depuis les voisins puis propagation
+        queue = []
+        for index in seeds:
+            cost = costs[index]
+            if cost < 0:
+                continue
+            for neighbour in neighbours[index]:
+                candidate = dist[neighbour] + cost
+                if candidate < dist[index]:
+                    dist[index] = candidate
+                    parent[index] = neighbour
+            if dist[index] < unreached:
+                heapq.heappush(queue, (dist[index], index))
+        while queue:
+            current, index = heapq.heappop(queue)
+            if current != dist[index]:
+                continue
+            for neighbour in neighbours[index]:
+                cost = costs[neighbour]
+                if cost < 0:
+                    continue
+                new_cost = current + cost
+                if new_cost < dist[neighbour]:
+                    dist[neighbour] = new_cost
+                    parent[neighbour] = index
+                    heapq.heappush(queue, (new_cost, neighbour))
+        return dist, parent
+
+    def _critical_path(self, dist: List[int], costs: List[int], for_adversary: bool) -> Tuple[int, List[int]]:
+        """
+        Case d'arrivée la plus proche (plus petite distance puis plus petit indice) et chemin depuis
+        le bord de départ (indices plats).
+
+        Le chemin est reconstruit depuis dist seulement (pas depuis les parents, qui dépendent de
+        l'historique des réparations) : parcours en largeur depuis l'arrivée sur les prédécesseurs p
+        tels que dist[p] + coût == dist[case], dans l'ordre fixe des voisins de geometry, jusqu'à la
+        première case de départ rencontrée. Le chemin est donc le même après une réparation qu'après
+        un calcul complet.
+        """
+        starts, objectives = self._edges(for_adversary)
+        end_pos = min(objectives, key=lambda index: (dist[index], index))
+        if dist[end_pos] == self.UNREACHED:
+            return self.UNREACHED, []
+        neighbours = geometry(self.joueur._memory.get_board().shape[0]).neighbours
+        start_cells = set(starts)
+        my_piece, empty = self._scaled_costs["my_piece"], self._scaled_costs["empty"]
+
+        def is_start(index):
+            # distance obtenue dès le départ (voir _full_search)
+            cost = costs[index]
+            return index in start_cells and dist[index] == (cost if cost == my_piece else empty)
+
+        following = {end_pos: -1} # case -> case suivante vers l'arrivée
+        start = end_pos if is_start(end_pos) else None
+        queue = deque([end_pos])
+        while start is None:
+            index = queue.popleft()
+            target = dist[index] - costs[index]
+            for neighbour in neighbours[index]:
+                if dist[neighbour] == target and neighbour not in following:
+                    following[neighbour] = index
+                    if is_start(neighbour):
+                        start = neighbour
+                        break
+                    queue.append(neighbour)
         path = []
-        current = end_pos
-        while current is not None:
+        current = start
+        while current != -1:
             path.append(current)
-            current = parent.get(current)
-        
-        path.reverse()
-        
+            current = following[current]
         return dist[end_pos], path
     
     def visualize_path(self, path: List[Tuple[int, int]], label: str = "Path"):
@@ -244,11 +395,26 @@ class Distance(Metrics):
 
     @override
     def update(self,s0):
+        memory = self.joueur._memory
+        self._stack.append((memory.my_distance, memory.adversary_distance,
+                            memory.my_critical_path, memory.adversary_critical_path, dict(self._trees)))
         my_distance, adv_distance = self.execute()
-        self.joueur._memory.my_distance = my_distance
-        self.joueur._memory.adversary_distance = adv_distance
-        self.joueur._memory.my_critical_path = self._my_path_cache
-        self.joueur._memory.adversary_critical_path = self._adv_path_cache
+        memory.my_distance = my_distance
+        memory.adversary_distance = adv_distance
+        memory.my_critical_path = self._my_path_cache
+        memory.adversary_critical_path = self._adv_path_cache
 
     def undo(self):
-        self.update(None)
\ No newline at end of file
+        """
+        Restaure les distances et chemins d'avant le dernier update (sans relancer Dijkstra).
+        """
+        memory = self.joueur._memory
+        my_distance, adv_distance, my_path, adv_path, self._trees = self._stack.pop()
+        memory.my_distance = my_distance
+        memory.adversary_distance = adv_distance
+        memory.my_critical_path = my_path
+        memory.adversary_critical_path = adv_path
+        self._my_distance_cache = my_distance
+        self._adv_distance_cache = adv_distance
+        self._my_path_cache = my_path
+        self._adv_path_cache = adv_path
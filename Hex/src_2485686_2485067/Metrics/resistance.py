@@ -0,0 +1,109 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+import numpy as np
+from typing import override, Tuple
+from typing import TYPE_CHECKING
+from src_2485686_2485067.Metrics.metrics import Metrics
+from src_2485686_2485067.geometry import geometry
+if TYPE_CHECKING:
+    from my_player import MyPlayer  # import uniquement pour l'IDE
+
+
+class Resistance(Metrics):
+    """
+    Résistance électrique (Anshelevich / Hexy) entre les deux bords de chaque joueur.
+
+    Chaque case est une résistance : faible pour un pion du joueur, 1 pour une case vide,
+    infinie pour un pion adverse; deux cases voisines sont reliées par la somme de leurs résistances.
+    Un bord est mis au potentiel 1, l'autre à 0 : les lois de Kirchhoff donnent un système linéaire
+    (laplacien des cases libres) résolu avec numpy, la résistance équivalente vaut 1 / courant sortant.
+
+    Retourne (ma_résistance, résistance_adverse)
+    """
+
+    EMPTY_RESISTANCE = 1.0 # résistance d'une case vide
+    STONE_RESISTANCE = 0.01 # résistance d'un pion du joueur (quasi conducteur)
+    REGULARIZATION = 1e-9 # rend le système inversible quand des cases sont isolées
+
+    def __init__(self, joueur: "MyPlayer"):
+        super().__init__()
+        self.joueur = joueur
+        self.side = joueur._memory.BOARD_SIZE + 2
+        grid = geometry(self.side)
+
+        # paires de cases voisines (chaque paire une fois)
+        pairs = [(a, b) for a in range(len(grid.positions)) for b in grid.neighbours[a] if a < b]
+        self.pair_a = np.array([a for a, _ in pairs])
+        self.pair_b = np.array([b for _, b in pairs])
+
+        # bords de chaque orientation (masques sur le plateau aplati)
+        rows, columns = np.divmod(np.arange(self.side * self.side), self.side)
+        last = self.side - 1
+        self.edges = {True: (rows == 0, rows == last), False: (columns == 0, columns == last)}
+
+    @override
+    def execute(self) -> Tuple[float, float]:
+        board = self.joueur._memory.get_board().ravel()
+        vertical = self.joueur._memory.get_my_color() == "R"
+        return self.resistance(board, 1, vertical), self.resistance(board, -1, not vertical)
+
+    def resistance(self, board: np.ndarray, value: int, vertical: bool) -> float:
+        """
+        Résistance équivalente entre les deux bords du joueur dont les pions valent value.
+
+        Args:
+            board: plateau aggrandi aplati
+            vertical: True si le joueur relie la ligne 0 à la dernière ligne
+        """
+        start_edge, target_edge = self.edges[vertical]
+        source = start_edge & (board == value)
+        sink = target_edge & (board == value)
+        terminal = source | sink
+
+        # résistance de chaque case (les bords du joueur sont des conducteurs parfaits)
+        r = np.where(board == value, self.STONE_RESISTANCE, np.where(board == 0, self.EMPTY_RESISTANCE, np.inf))
+        r[terminal] = 0.0
+        with np.errstate(divide="ignore"): # deux cases de bord : conductance infinie, jamais utilisée
+            conductance = 1.0 / (r[self.pair_a] + r[self.pair_b])
+
+        # inconnues : cases traversables hors bords du joueur
+        free = np.isfinite(r) & ~terminal
+        unknown = np.full(board.shape[0], -1)
+        unknown[free] = np.arange(int(free.sum()))
+        n = int(free.sum())
+        if n == 0:
+            return np.inf
+
+        a, b = self.pair_a, self.pair_b
+        ua, ub = unknown[a], unknown[b]
+        laplacian = np.zeros((n, n))
+        rhs = np.zeros(n)
+
+        # paires entre deux inconnues
+        both = (ua >= 0) & (ub >= 0) & (conductance > 0)
+        g = conductance[both]
+        np.add.at(laplacian, (ua[both], ua[both]), g)
+        np.add.at(laplacian, (ub[both], ub[both]), g)
+        np.add.at(laplacian, (ua[both], ub[both]), -g)
+        np.add.at(laplacian, (ub[both], ua[both]), -g)
+
+        # paires entre une inconnue et un bord (potentiel 1 à la source, 0 au puits)
+        for unknown_side, other in ((ua, b), (ub, a)):
+            mask = (unknown_side >= 0) & terminal[other] & (conductance > 0)
+            g = conductance[mask]
+            np.add.at(laplacian, (unknown_side[mask], unknown_side[mask]), g)
+            np.add.at(rhs, unknown_side[mask], g * source[other[mask]])
+
+        laplacian[np.diag_indices(n)] += self.REGULARIZATION
+        voltage = np.linalg.solve(laplacian, rhs)
+
+        # courant sortant de la source
+        current = 0.0
+        for unknown_side, other in ((ua, b), (ub, a)):
+            mask = (unknown_side >= 0) & source[other] & (conductance > 0)
+            current += float(np.sum(conductance[mask] * (1.0 - voltage[unknown_side[mask]])))
+        if current <= 0:
+            return np.inf
+        return 1.0 / current
@@ -0,0 +1,140 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+import numpy as np
+from typing import override, Tuple
+from typing import TYPE_CHECKING
+from src_2485686_2485067.Metrics.metrics import Metrics
+from src_2485686_2485067.geometry import geometry
+if TYPE_CHECKING:
+    from my_player import MyPlayer  # import uniquement pour l'IDE
+
+
+class TwoDistance(Metrics):
+    """
+    Two-distance (Queenbee) de chaque joueur.
+
+    La two-distance d'une case vide à un bord vaut 1 si elle touche le bord, sinon 1 + la deuxième
+    plus petite two-distance de ses voisins : l'adversaire peut toujours couper le meilleur voisin.
+    Les voisins sont étendus à travers les groupes de pions du joueur (deux cases vides touchant
+    un même groupe sont voisines), les pions adverses bloquent.
+
+    Potentiel d'un joueur : minimum sur les cases vides de (two-distance au bord 1 + au bord 2);
+    mobilité : nombre de cases atteignant ce minimum.
+
+    Retourne (mon_potentiel, ma_mobilité, potentiel_adverse, mobilité_adverse)
+    """
+
+    def __init__(self, joueur: "MyPlayer"):
+        super().__init__()
+        self.joueur = joueur
+        self.side = joueur._memory.BOARD_SIZE + 2
+        self.grid = geometry(self.side)
+        last = self.side - 1
+        # cases des bords de chaque orientation (indices plats)
+        self.edges = {
+            True: ([self.grid.index((0, j)) for j in range(self.side)],
+                   [self.grid.index((last, j)) for j in range(self.side)]),
+            False: ([self.grid.index((i, 0)) for i in range(self.side)],
+                    [self.grid.index((i, last)) for i in range(self.side)]),
+        }
+
+    @override
+    def execute(self) -> Tuple[float, int, float, int]:
+        cells = self.joueur._memory.get_board().ravel().tolist()
+        vertical = self.joueur._memory.get_my_color() == "R"
+        my_potential, my_mobility = self.potential(cells, 1, vertical)
+        adversary_potential, adversary_mobility = self.potential(cells, -1, not vertical)
+        return my_potential, my_mobility, adversary_potential, adversary_mobility
+
+    def potential(self, cells: list, value: int, vertical: bool) -> Tuple[float, int]:
+        """
+        Potentiel et mobilité du joueur dont les pions valent value.
+
+        Args:
+            cells: plateau aggrandi aplati (liste)
+            vertical: True si le joueur relie la ligne 0 à la dernière ligne
+        """
+        neighbours = self.grid.neighbours
+
+        # Groupes de pions du joueur et cases vides qui les bordent
+        group = [-1] * len(cells)
+        group_liberties = []
+        for index, cell in enumerate(cells):
+            if cell != value or group[index] != -1:
+                continue
+            gid = len(group_liberties)
+            liberties = set()
+            group[index] = gid
+            stack = [index]
+            while stack:
+                current = stack.pop()
+                for neighbour in neighbours[current]:
+                    if cells[neighbour] == value:
+                        if group[neighbour] == -1:
+                            group[neighbour] = gid
+                            stack.append(neighbour)
+                    elif cells[neighbour] == 0:
+                        liberties.add(neighbour)
+            group_liberties.append(liberties)
+
+        start_edge, target_edge = self.edges[vertical]
+        start_groups = {group[index] for index in start_edge if cells[index] == value}
+        target_groups = {group[index] for index in target_edge if cells[index] == value}
+        if start_groups & target_groups:
+            return 0.0, 1 # les deux bords sont déjà reliés
+        edge_groups = start_groups | target_groups
+
+        # Voisins étendus de chaque case vide (les groupes reliés à un bord n'en font pas partie :
+        # ils servent de point de départ)
+        extended = {}
+        for index, cell in enumerate(cells):
+            if cell != 0:
+                continue
+            ext = set()
+            for neighbour in neighbours[index]:
+                neighbour_cell = cells[neighbour]
+                if neighbour_cell == 0:
+                    ext.add(neighbour)
+                elif neighbour_cell == value and group[neighbour] not in edge_groups:
+                    ext |= group_liberties[group[neighbour]]
+            ext.discard(index)
+            extended[index] = ext
+
+        from_start = self.__two_distance(extended, set().union(*(group_liberties[g] for g in start_groups)))
+        from_target = self.__two_distance(extended, set().union(*(group_liberties[g] for g in target_groups)))
+
+        best, mobility = np.inf, 0
+        for index in extended:
+            total = from_start.get(index, np.inf) + from_target.get(index, np.inf)
+            if total < best:
+                best, mobility = total, 1
+            elif total == best and total < np.inf:
+                mobility += 1
+        return best, mobility
+
+    def __two_distance(self, extended: dict, sources: set) -> dict:
+        """
+        Two-distance depuis un bord par file à seaux (les distances sont entières) :
+        une case est fixée à k + 1 dès que son deuxième voisin est fixé à k.
+        """
+        distance = {}
+        seen = dict.fromkeys(extended, 0) # nombre de voisins déjà fixés
+        bucket = list(sources)
+        k = 1
+        while bucket:
+            next_bucket = []
+            for index in bucket:
+                if index in distance:
+                    continue
+                distance[index] = k
+                for neighbour in extended[index]:
+                    if neighbour in distance:
+                        continue
+                    seen[neighbour] += 1
+                    if seen[neighbour] == 2:
+                        next_bucket.append(neighbour)
+            bucket = next_bucket
+            k += 1
+        return distance
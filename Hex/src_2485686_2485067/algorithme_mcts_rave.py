@@ -0,0 +1,228 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+from game_state_hex import GameStateHex
+from src_2485686_2485067.algorithme import Algorithme
+from typing import override, Optional
+from seahorse.game.light_action import LightAction
+from src_2485686_2485067.geometry import geometry
+import numpy as np
+import math
+import time
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from my_player import MyPlayer  # import uniquement pour l'IDE
+
+
+BOARD_SIDE = 16 # plateau aggrandi de la mémoire (14 + 2 bords)
+NEIGHBOURS = geometry(BOARD_SIDE).neighbours # voisins de chaque case (indice plat)
+
+
+class _Node:
+    """
+    Noeud de l'arbre MCTS.
+
+    wins/visits sont comptés du point de vue de player (le joueur qui a joué move).
+    amaf_wins/amaf_visits (RAVE) sont indexés par case et comptés du point de vue du joueur
+    qui doit jouer dans ce noeud (-player) : alloués à la première expansion.
+    """
+    __slots__ = ("move", "player", "parent", "children", "untried", "visits", "wins", "amaf_visits", "amaf_wins")
+
+    def __init__(self, move, player, parent, untried):
+        self.move = move
+        self.player = player
+        self.parent = parent
+        self.children = []
+        self.untried = untried # coups non encore développés (le meilleur a priori en dernier)
+        self.visits = 0
+        self.wins = 0.0
+        self.amaf_visits = None
+        self.amaf_wins = None
+
+
+class Algorithme_mcts_rave(Algorithme):
+    """
+    Recherche Monte Carlo (UCT) avec statistiques RAVE/AMAF.
+
+    - les simulations remplissent aléatoirement toutes les cases vides (numpy) : sur un plateau
+      de Hex plein il y a exactement un gagnant, une seule vérification de connexité suffit
+    - la matrice d'attention de la mémoire sert de prior (ordre d'expansion et bonus de sélection)
+    - la recherche travaille sur une copie du plateau de la mémoire (la mémoire n'est pas modifiée)
+    """
+
+    EXPLORATION = 0.4 # constante UCT
+    RAVE_EQUIVALENCE = 300 # nombre de visites pour lequel RAVE et UCT ont le même poids
+    PRIOR_WEIGHT = 1.0 # poids du bonus de prior (décroît en 1/(visites+1))
+    DEFAULT_ITERATIONS = 2000 # simulations sans budget de temps
+    LOCAL_ITERATIONS = 300 # simulations d'une recherche locale
+
+    def __init__(self, joueur:"MyPlayer", iterations: int = DEFAULT_ITERATIONS, seed: Optional[int] = None):
+        super().__init__()
+        self.joueur = joueur
+        self.iterations = iterations
+        self.rng = np.random.default_rng(seed)
+        self.local_analysis_area = None
+        self.root = None
+        self.prior = None # prior (attention) de chaque case à la racine
+        self.simulations = 0 # nombre de simulations de la dernière recherche
+        self.nodes = 0 # noeuds créés depuis la création du moteur (un par simulation)
+
+        # joueur vertical (relie la ligne 0 à la ligne 15) : valeur de ses pions sur le plateau de la mémoire
+        self.vertical_value = 1 if joueur._memory.get_my_color() == "R" else -1
+
+    @override
+    def execute(self, s0: GameStateHex, max_depth = None, local_analysis_area = None, branching_factor = None, time_budget = None):
+        """
+        Lance la recherche depuis s0 (même interface que l'alpha-beta).
+
+        Args:
+            max_depth: ignoré (la profondeur est guidée par les simulations)
+            local_analysis_area: liste des cases (plateau aggrandi) auxquelles restreindre les coups de la racine
+            branching_factor: ignoré
+            time_budget: temps alloué au coup (en secondes); sinon un nombre fixe de simulations
+
+        Returns:
+            (taux de victoire estimé du coup choisi, coup)
+        """
+        self.local_analysis_area = local_analysis_area
+
+        # uniquement le premier coup
+        first_move = self.joueur._forced_move.first_move()
+        if first_move is not None:
+            return 0, first_move
+
+        #  Verification d'un coup forcé (peut lancer une recherche locale)
+        forced_move = self.joueur._forced_move.find_me_forced_move(local_analysis_area, s0, 0)
+        if forced_move is not None:
+            return 0, forced_move
+
+        # la recherche locale a pu écraser la zone d'analyse
+        self.local_analysis_area = local_analysis_area
+        root_board = self.joueur._memory.get_board().ravel().copy()
+        self.prior = self.__prior(root_board)
+        order = np.argsort(self.prior, kind="stable") # du moins au plus probable (pop() donne le meilleur)
+
+        untried = order[root_board[order] == 0].tolist()
+        if local_analysis_area is not None:
+            area = {x * BOARD_SIDE + y for x, y in local_analysis_area}
+            untried = [cell for cell in untried if cell in area]
+        if len(untried) == 0:
+            return 0, None
+
+        self.root = _Node(None, -1, None, untried)
+        self.simulations = 0
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        if deadline is None:
+            budget = self.LOCAL_ITERATIONS if local_analysis_area is not None else self.iterations
+        while True:
+            if deadline is not None:
+                if time.perf_counter() >= deadline and self.simulations > 0:
+                    break
+            elif self.simulations >= budget:
+                break
+            self.__iterate(root_board, order)
+            self.simulations += 1
+            self.nodes += 1
+
+        best = max(self.root.children, key=lambda child: child.visits)
+        x, y = divmod(best.move, BOARD_SIDE)
+        move = LightAction({"piece": self.joueur._memory.get_my_color(), "position": (x - 1, y - 1)})
+        return best.wins / best.visits, move
+
+    def __prior(self, board):
+        """ Prior des cases (matrice d'attention de la mémoire, normalisée par son maximum)."""
+        attention = np.nan_to_num(self.joueur._memory.get_attention_board().ravel(), nan=0.0, neginf=0.0)
+        attention = np.where(board == 0, attention, 0.0)
+        max_attention = attention.max()
+        return attention / max_attention if max_attention > 0 else attention
+
+    def __iterate(self, root_board, order):
+        """ Une simulation : sélection, expansion, simulation aléatoire, rétropropagation."""
+        board = root_board.copy()
+        node = self.root
+        path = [node]
+        player = 1 # je joue à la racine
+
+        # Sélection
+        while not node.untried and node.children:
+            node = self.__select(node)
+            board[node.move] = player
+            path.append(node)
+            player = -player
+
+        # Expansion (coup le plus probable a priori d'abord)
+        if node.untried:
+            move = node.untried.pop()
+            board[move] = player
+            if node.amaf_visits is None:
+                node.amaf_visits = np.zeros(BOARD_SIDE * BOARD_SIDE, dtype=np.int32)
+                node.amaf_wins = np.zeros(BOARD_SIDE * BOARD_SIDE, dtype=np.int32)
+            child = _Node(move, player, node, order[board[order] == 0].tolist())
+            node.children.append(child)
+            node = child
+            path.append(node)
+            player = -player
+
+        # Simulation : remplissage aléatoire des cases vides, les joueurs alternent
+        empty = self.rng.permutation(np.flatnonzero(board == 0))
+        board[empty[0::2]] = player
+        board[empty[1::2]] = -player
+        winner = self.__winner(board)
+
+        # Rétropropagation (+ AMAF : tous les coups joués après le noeud par le joueur qui doit y jouer)
+        played = {1: (board == 1) & (root_board == 0), -1: (board == -1) & (root_board == 0)}
+        for node in path:
+            node.visits += 1
+            if winner == node.player:
+                node.wins += 1
+            if node.move is not None:
+                played[node.player][node.move] = False
+            if node.amaf_visits is not None:
+                mover = -node.player
+                mask = played[mover]
+                node.amaf_visits[mask] += 1
+                if winner == mover:
+                    node.amaf_wins[mask] += 1
+
+    def __select(self, node: _Node) -> _Node:
+        """ Fils maximisant UCT mélangé à RAVE, plus le bonus de prior."""
+        log_visits = math.log(node.visits)
+        best, best_score = None, float("-inf")
+        for child in node.children:
+            q = child.wins / child.visits
+            amaf_visits = node.amaf_visits[child.move]
+            if amaf_visits > 0:
+                beta = math.sqrt(self.RAVE_EQUIVALENCE / (3 * child.visits + self.RAVE_EQUIVALENCE))
+                q = (1 - beta) * q + beta * node.amaf_wins[child.move] / amaf_visits
+            score = (q + self.EXPLORATION * math.sqrt(log_visits / child.visits)
+                     + self.PRIOR_WEIGHT * self.prior[child.move] / (child.visits + 1))
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def __winner(self, board) -> int:
+        """
+        Gagnant d'un plateau plein (1 : moi, -1 : l'adversaire) :
+        le joueur vertical gagne ssi ses pions relient la ligne 0 à la ligne 15.
+        """
+        cells = board.tolist()
+        value = self.vertical_value
+        last_row = (BOARD_SIDE - 1) * BOARD_SIDE
+        seen = bytearray(BOARD_SIDE * BOARD_SIDE)
+        stack = [1] # case (0, 1) du bord du haut
+        seen[1] = 1
+        while stack:
+            cell = stack.pop()
+            if cell >= last_row:
+                return value
+            for neighbour in NEIGHBOURS[cell]:
+                if not seen[neighbour] and cells[neighbour] == value:
+                    seen[neighbour] = 1
+                    stack.append(neighbour)
+        return -value
+
+    def to_json(self):
+        return {
+            "type": "Algorithme_mcts_rave",
+        }
@@ -5,24 +5,122 @@
 from seahorse.game.game_state import GameState
 from game_state_hex import GameStateHex
 from src_2485686_2485067.algorithme import Algorithme
-from typing import override
+from typing import override, Optional
 from src_2485686_2485067.heuristique import Heuristique
+from src_2485686_2485067.heuristique_v1 import Heuristique_v1
+from src_2485686_2485067.batch_evaluator import BatchEvaluator
 from seahorse.game.light_action import LightAction
 import numpy as np
-import random
 from src_2485686_2485067.Memory.memory import Memory
+from src_2485686_2485067.Memory.transposition_table import TranspositionTable
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from my_player import MyPlayer  # import uniquement pour l'IDE
 
 
+import math
 import time 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+
+class SearchTimeout(Exception):
+    """Levée lorsque la date limite de l'approfondissement itératif est dépassée."""
+
+
+# -------------------------------------------------------------------------
+# Recherche parallèle à la racine : état propre à chaque processus de calcul
+# -------------------------------------------------------------------------
+_worker_shared_alpha = None # borne alpha partagée entre les processus (multiprocessing.Value)
+_worker_shared_search = None # identifiant de la recherche parallèle en cours (multiprocessing.Value)
+_worker_piece_type = None
+_worker_player_options = {} # options du joueur principal transmises au joueur du processus (voir MyPlayer)
+_worker_engine_options = {} # options du moteur principal absentes de MyPlayer (attributs du moteur)
+_worker_player = None # joueur local au processus (sa propre mémoire)
+_worker_history = [] # coups (position, valeur) déjà joués sur la mémoire du processus
+
+def _init_worker(shared_alpha, shared_search, piece_type, player_options, engine_options):
+    """ Initialisation d'un processus de la recherche parallèle."""
+    global _worker_shared_alpha, _worker_shared_search, _worker_piece_type, _worker_player_options, _worker_engine_options
+    _worker_shared_alpha = shared_alpha
+    _worker_shared_search = shared_search
+    _worker_piece_type = piece_type
+    _worker_player_options = player_options
+    _worker_engine_options = engine_options
+
+def _sync_worker_memory(root_moves):
+    """
+    Amène la mémoire du processus sur la racine décrite par root_moves (coups dans l'ordre).
+    Seuls les coups manquants sont joués si la mémoire est déjà sur un préfixe de la partie,
+    sinon la mémoire est reconstruite depuis le plateau vide.
+    """
+    global _worker_player, _worker_history
+    if _worker_player is None or root_moves[:len(_worker_history)] != _worker_history:
+        from my_player import MyPlayer # import local : my_player importe ce module
+        _worker_player = MyPlayer(_worker_piece_type, name="worker", **_worker_player_options)
+        for option, value in _worker_engine_options.items():
+            setattr(_worker_player._ai_engine, option, value)
+        _worker_history = []
+    if len(root_moves) > len(_worker_history):
+        for position, value in root_moves[len(_worker_history):]:
+            _worker_player._memory.play(position, value == 1)
+        _worker_history = list(root_moves)
+        engine = _worker_player._ai_engine
+        engine.heuristique.coefficient_update()
+        engine.transposition_table.new_search(engine.heuristique.get_coefficients())
+        _worker_player._memory.heuristique_cache.new_search(engine.heuristique.get_coefficients())
+    return _worker_player
+
+def _search_root_move(search_id, root_moves, position, depth, branching_factor, beta, wall_deadline):
+    """
+    Tâche d'un processus : valeur du coup position joué à la racine, pour la recherche parallèle search_id.
+
+    Returns:
+        (résultat, noeuds visités, évaluations de feuilles), résultat valant (valeur, alpha utilisé,
+        meilleure ligne après le coup) ou None si la date limite est dépassée ou si la recherche search_id est terminée
+    """
+    if _worker_shared_search.value != search_id:
+        return None, 0, 0 # tâche déjà distribuée quand sa recherche s'est terminée
+    engine = _sync_worker_memory(root_moves)._ai_engine
+    nodes, leaf_evaluations = engine.nodes, engine.leaf_evaluations
+    alpha = _worker_shared_alpha.value # profite des coupures déjà trouvées par les autres processus
+    deadline = None if wall_deadline is None else time.perf_counter() + (wall_deadline - time.time())
+    result = engine.search_root_move(position, depth, branching_factor, alpha, beta, deadline,
+                                     _worker_shared_search, search_id)
+    nodes, leaf_evaluations = engine.nodes - nodes, engine.leaf_evaluations - leaf_evaluations
+    if result is None:
+        return None, nodes, leaf_evaluations
+    value, line = result
+    with _worker_shared_alpha.get_lock():
+        if value > _worker_shared_alpha.value:
+            _worker_shared_alpha.value = value
+    return (value, alpha, line), nodes, leaf_evaluations
+
 
 class Algorithme_minimax_alpha_beta_typeA(Algorithme):
 
-    
+    KILLER_SLOTS = 2 # coups tueurs mémorisés par profondeur
+    HISTORY_WEIGHT = 1.0 # poids de l'historique face à l'attention (toutes deux normalisées par leur maximum)
+    ASPIRATION_WINDOW = 0.25 # demi-largeur de la fenêtre autour du score de l'itération précédente (None : désactivée)
+    BATCH_DEPTH = 1 # profondeur maximale des noeuds dont les fils sont ordonnés par l'évaluation groupée
+    PARALLEL_MIN_DEPTH = 4 # profondeur minimale d'une itération pour répartir la racine entre les processus
+    INDEPENDENT_ROOT_MOVES = False # ni table de transposition ni coup tueur/de la table hors sélection : l'arbre d'un coup de la racine ne dépend pas de ses frères (valeur identique en séquentiel et en parallèle)
 
-    def __init__(self,joueur:"MyPlayer", heuristique:Heuristique):
+    def __init__(self,joueur:"MyPlayer", heuristique:Heuristique, workers: int = 1, start_method: str = None,
+                 pvs: bool = True, batch_ordering: bool = False, seed: Optional[int] = None):
+        """
+        Args:
+            workers: nombre de processus de la recherche parallèle à la racine (1 : recherche séquentielle)
+            start_method: méthode de démarrage des processus ("fork", "spawn", "forkserver"; None : celle par défaut)
+            pvs: Principal Variation Search (fenêtre nulle pour les fils après le premier) et fenêtres
+                d'aspiration en approfondissement itératif
+            batch_ordering: ordonne les fils de la racine et de la profondeur 1 par l'évaluation groupée
+                de BatchEvaluator (Heuristique_v1 uniquement)
+            seed: graine du tirage des coups de actions_selection (None : non reproductible). Avec une graine,
+                le tirage d'un noeud ne dépend que de la graine et de la position (hash de Zobrist) :
+                les processus de la recherche parallèle tirent les mêmes coups que la recherche séquentielle
+        """
         super().__init__()
         self.default_mode_branching_factor = 30
         self.maximum_depth = None
@@ -32,13 +130,64 @@ class Algorithme_minimax_alpha_beta_typeA(Algorithme):
         self.joueur = joueur
         self.matrice_debug = np.zeros((16, 16))
 
+        # Approfondissement itératif
+        self.deadline = None # date limite (time.perf_counter) de la recherche en cours
+        self.completed_depth = 0 # profondeur de la dernière itération terminée
+        self.previous_pv = [] # meilleure ligne (positions) de l'itération précédente
+        self.pv_table = {} # profondeur -> meilleure ligne trouvée depuis ce noeud
+        self.follow_pv = False # vrai tant que l'on descend le long de previous_pv
+        self.root_forced = False # vrai si la racine a joué un coup forcé
+        self._ply = 0 # nombre de coups appliqués sur la mémoire pendant la recherche
+        self.root_state = None # seul GameStateHex de la recherche (les noeuds internes jouent sur la mémoire)
+        self.nodes = 0 # noeuds visités depuis la création du moteur (toutes recherches, processus de calcul compris)
+        self.leaf_evaluations = 0 # appels à l'heuristique sur les feuilles depuis la création du moteur (idem)
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.pvs = pvs
+        if batch_ordering and not isinstance(heuristique, Heuristique_v1):
+            raise ValueError("L'évaluation groupée n'est disponible qu'avec Heuristique_v1")
+        self.batch_evaluator = BatchEvaluator(joueur, heuristique) if batch_ordering else None
+
+        # Table de transposition (partagée avec la mémoire, conservée d'un coup à l'autre)
+        self.transposition_table = joueur._memory.transposition_table
+
+        # Ordonnancement des coups par les coupures déjà obtenues
+        self.killer_moves = {} # profondeur -> positions ayant provoqué une coupure (la plus récente en premier)
+        self.history_table = np.zeros((16, 16)) # bonus des coupures par case (plateau aggrandi)
+
+        # Recherche parallèle à la racine (pool créé à la première recherche, conservé d'un coup à l'autre)
+        self.workers = workers
+        self.start_method = start_method
+        self._executor = None
+        self._shared_alpha = None
+        self._shared_search = None
+
+        # Arrêt de la recherche en cours demandé par un autre thread (réflexion pendant le temps adverse)
+        self.stop_requested = False
+        # recherche parallèle dont fait partie la tâche en cours (uniquement dans un processus de calcul) :
+        # la tâche s'arrête dès que l'identifiant partagé ne vaut plus search_id
+        self.shared_search = None
+        self.search_id = None
+
         
     @override
-    def execute(self,s0: GameStateHex,max_depth,local_analysis_area = None,branching_factor = None):
+    def execute(self,s0: GameStateHex,max_depth,local_analysis_area = None,branching_factor = None,time_budget = None,resume = None):
+        """
+        Lance la recherche depuis s0.
+
+        Args:
+            max_depth: profondeur de recherche (profondeur maximale en mode itératif)
+            local_analysis_area: liste des cases d'une recherche locale
+            branching_factor: nombre de coups explorés par noeud
+            time_budget: temps alloué au coup (en secondes). Si fourni, la recherche
+                se fait par approfondissement itératif (1, 2, ..., max_depth) jusqu'à la date limite.
+            resume: état d'une recherche déjà faite depuis s0 (voir ponder), l'approfondissement reprend à sa suite
+        """
         self.matrice_debug = np.zeros((16, 16))
         # MAJ avec le coup joué par l'adversaire 
+        self.root_state = s0
         self.maximum_depth = max_depth
-        self.local_analysis_area = local_analysis_area
+        self.__set_local_analysis_area(local_analysis_area)
         if branching_factor != None:
             self.branching_factor = branching_factor
         else:
@@ -46,6 +195,10 @@ class Algorithme_minimax_alpha_beta_typeA(Algorithme):
 
         
         self.heuristique.coefficient_update()
+        if local_analysis_area is None:
+            self.transposition_table.new_search(self.heuristique.get_coefficients())
+            self.joueur._memory.heuristique_cache.new_search(self.heuristique.get_coefficients())
+            self.__new_search_ordering()
         
         if local_analysis_area is not None: # uniquement dans le cadre d'une recherche locale 
             self.joueur._heuristique.beta_me = 0
@@ -60,128 +213,640 @@ class Algorithme_minimax_alpha_beta_typeA(Algorithme):
         if first_move is not None:
             return 0,first_move
         
-        (v, m) = self.__maxValue(s0, float("-inf"),float("+inf"),depth = 0)
+        if time_budget is None:
+            (v, m) = self.__search_root(s0, max_depth, follow_pv=False)
+        else:
+            (v, m) = self.iterative_deepening(s0, max_depth, time_budget, resume)
+
         # Si jamais c'est vide, on génère un choix aléatoire
         if m is None:
             possible = list(s0.generate_possible_light_actions())
-            m = random.choice(possible)
+            m = possible[self.rng.integers(len(possible))]
         # sécurité (forcer la conversion en cas de besoin)
         if not isinstance(m, LightAction):
             m = LightAction({"piece": self.joueur._memory.get_my_color(), "position": m})
 
         return (v,m)
 
-    def __maxValue(self,s: GameStateHex,alpha,beta,depth):
+    def iterative_deepening(self, s0: GameStateHex, max_depth, time_budget, resume = None):
+        """
+        Recherche aux profondeurs 1, 2, ..., max_depth jusqu'à épuisement de time_budget (secondes,
+        None : sans limite, jusqu'à une demande d'arrêt). Retourne le résultat de la dernière itération
+        terminée; la meilleure ligne de chaque itération est jouée en premier à l'itération suivante.
+        Avec resume (voir ponder), les itérations déjà terminées ne sont pas refaites.
+        """
+        start = time.perf_counter()
+        self.deadline = None if time_budget is None else start + time_budget
+        self.previous_pv = []
+        self.completed_depth = 0
+        self._ply = 0
+        best = (None, None)
+        if resume is not None:
+            self.previous_pv = list(resume["previous_pv"])
+            self.completed_depth = resume["completed_depth"]
+            best = resume["best"]
+        try:
+            for depth in range(self.completed_depth + 1, max_depth + 1):
+                iteration_start = time.perf_counter()
+                try:
+                    result = self.__aspiration_search(s0, depth, best[0])
+                except SearchTimeout:
+                    # on remet la mémoire dans l'état de la racine
+                    while self._ply > 0:
+                        self.__unplay()
+                    break
+                best = result
+                self.completed_depth = depth
+                self.previous_pv = [self.__position(m) for m in self.pv_table.get(0, [])]
+
+                # coup forcé ou fin de partie trouvée : inutile d'aller plus profond
+                if self.root_forced or abs(best[0]) >= 10000:
+                    break
+                # l'itération suivante coûte au moins autant que la précédente
+                now = time.perf_counter()
+                if self.deadline is not None and self.deadline - now < now - iteration_start:
+                    break
+        finally:
+            self.deadline = None
+
+        # aucune itération terminée : on garde le meilleur coup partiel de la racine
+        if best[1] is None and self.pv_table.get(0):
+            best = (0, self.pv_table[0][0])
+        if best[0] is None:
+            best = (0, best[1])
+        return best
+
+    def __search_root(self, s0: GameStateHex, depth, follow_pv, alpha = float("-inf"), beta = float("+inf")):
+        """ Lance une recherche alpha-beta complète à la profondeur donnée."""
+        self.maximum_depth = depth
+        self.pv_table = {}
+        self.follow_pv = follow_pv and len(self.previous_pv) > 0
+        self.root_forced = False
+        return self.__maxValue(alpha,beta,depth = 0)
+
+    def __aspiration_search(self, s0: GameStateHex, depth, previous_score):
+        """
+        Recherche de la racine dans une fenêtre centrée sur le score de l'itération précédente;
+        si le score en sort, le côté dépassé est ouvert et la recherche relancée.
+        """
+        if (not self.pvs or self.ASPIRATION_WINDOW is None or previous_score is None
+                or abs(previous_score) >= 10000 or self.__parallel(depth)):
+            return self.__search_root(s0, depth, follow_pv=True)
+        alpha = previous_score - self.ASPIRATION_WINDOW
+        beta = previous_score + self.ASPIRATION_WINDOW
+        while True:
+            result = self.__search_root(s0, depth, True, alpha, beta)
+            if result[0] <= alpha and alpha > float("-inf"):
+                alpha = float("-inf")
+            elif result[0] >= beta and beta < float("+inf"):
+                beta = float("+inf")
+            else:
+                return result
+
+    def __check_time(self):
+        if self.stop_requested or (self.shared_search is not None and self.shared_search.value != self.search_id):
+            raise SearchTimeout()
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+
+    def ponder(self, s0: GameStateHex, max_depth, resume = None, new_search: bool = True):
+        """
+        Réflexion pendant le temps de l'adversaire : approfondissement itératif sans date limite depuis s0
+        (la mémoire doit déjà être sur s0), jusqu'à max_depth ou une demande d'arrêt (stop_requested),
+        à la suite de resume si fourni. Remplit la table de transposition et le cache de l'heuristique.
+        new_search : False pour les appels suivants d'une même réflexion (les entrées déjà calculées
+        ne doivent pas vieillir).
+
+        Returns:
+            état de reprise de la recherche (à passer à execute(resume=...) si s0 est bien la position jouée)
+        """
+        self.root_state = s0
+        self.__set_local_analysis_area(None)
+        self.branching_factor = self.default_mode_branching_factor
+        self.heuristique.coefficient_update()
+        if new_search:
+            self.transposition_table.new_search(self.heuristique.get_coefficients())
+            self.joueur._memory.heuristique_cache.new_search(self.heuristique.get_coefficients())
+            self.__new_search_ordering()
+        try:
+            best = self.iterative_deepening(s0, max_depth, None, resume)
+        except Exception:
+            # on remet la mémoire dans l'état de la racine avant de propager
+            while self._ply > 0:
+                self.__unplay()
+            raise
+        return {"completed_depth": self.completed_depth, "previous_pv": list(self.previous_pv), "best": best}
+
+    def __play(self, move, mine: bool) -> bool:
+        """
+        Pose la pierre de move directement sur la mémoire (sans créer de GameStateHex).
+
+        Returns:
+            True si le coup termine la partie
+        """
+        x, y = move.data["position"]
+        position = (x + 1, y + 1) # décallage car le plateau de la mémoire est aggrandi
+        self.joueur._memory.play(position, mine)
+        self._ply += 1
+        return self.joueur._memory.board_manager.is_winning_move(position)
+
+    def __unplay(self):
+        """ Annule le dernier coup appliqué par __play."""
+        self.joueur._memory.undo()
+        self._ply -= 1
+
+    def __position(self, move):
+        return tuple(move.data["position"]) if isinstance(move, LightAction) else tuple(move)
+
+    def __store_pv(self, depth, move):
+        """ Mémorise la meilleure ligne depuis depth : move suivi de la ligne du fils."""
+        self.pv_table[depth] = [move] + self.pv_table.get(depth + 1, [])
+
+    def __order_pv(self, actions, depth):
+        """ Place en tête le coup de la ligne principale précédente (si on est encore dessus)."""
+        if not self.follow_pv:
+            return actions
+        if depth >= len(self.previous_pv):
+            self.follow_pv = False
+            return actions
+        pv_position = self.previous_pv[depth]
+        for idx, move in enumerate(actions):
+            if move != "annex" and self.__position(move) == pv_position:
+                return [move] + actions[:idx] + actions[idx + 1:]
+        self.follow_pv = False
+        return actions
+
+    def __set_local_analysis_area(self, local_analysis_area):
+        """
+        Entre dans une recherche locale (ou en sort avec None). Comme la table de transposition (voir __use_tt),
+        le cache de l'heuristique n'est pas utilisé tant qu'une recherche locale est en cours :
+        ses scores sont calculés avec des coefficients modifiés.
+        """
+        self.local_analysis_area = local_analysis_area
+        self.joueur._memory.heuristique_cache.enabled = local_analysis_area is None
+
+    def __use_tt(self):
+        """ La table n'est pas utilisée en recherche locale (coefficients de l'heuristique modifiés)."""
+        return self.local_analysis_area is None
+
+    def __probe_tt(self, key, remaining, alpha, beta, depth):
+        """
+        Consulte la table de transposition avant la génération des coups.
+
+        Returns:
+            (valeur si coupure sinon None, alpha, beta, meilleur coup stocké)
+        """
+        entry = None if self.INDEPENDENT_ROOT_MOVES else self.transposition_table.probe(key)
+        if entry is None:
+            return None, alpha, beta, None
+        _, draft, value, flag, tt_move, _ = entry
+        # pas de coupure à la racine : il faut un coup à jouer
+        # (chaque borne est comparée à la fenêtre avant de la resserrer : la fenêtre ne doit pas devenir vide)
+        if depth > 0 and draft >= remaining:
+            if flag == TranspositionTable.EXACT:
+                return value, alpha, beta, tt_move
+            elif flag == TranspositionTable.LOWER_BOUND:
+                if value >= beta:
+                    return value, alpha, beta, tt_move
+                alpha = max(alpha, value)
+            else:
+                if value <= alpha:
+                    return value, alpha, beta, tt_move
+                beta = min(beta, value)
+        return None, alpha, beta, tt_move
+
+    def __store_tt(self, key, remaining, v_star, m_star, alpha_orig, beta_orig, maximizing: bool):
+        """
+        Enregistre le résultat du noeud avec le type de borne correspondant à la fenêtre initiale.
+        La coupure du noeud est testée en premier (v_star >= beta pour MAX, v_star <= alpha pour MIN) :
+        si la fenêtre est vide (alpha == beta), v_star peut valoir les deux bornes à la fois.
+        """
+        if key is None or m_star is None:
+            return
+        fail_high = v_star >= beta_orig
+        fail_low = v_star <= alpha_orig
+        if fail_high and (maximizing or not fail_low):
+            flag = TranspositionTable.LOWER_BOUND
+        elif fail_low:
+            flag = TranspositionTable.UPPER_BOUND
+        else:
+            flag = TranspositionTable.EXACT
+        self.transposition_table.store(key, remaining, v_star, flag, self.__position(m_star))
+
+    def __order_tt(self, actions, legal_actions, tt_move):
+        """ Place en tête le meilleur coup stocké dans la table (ajouté s'il n'a pas été sélectionné)."""
+        if tt_move is None:
+            return actions
+        for idx, move in enumerate(actions):
+            if move != "annex" and self.__position(move) == tt_move:
+                return [move] + actions[:idx] + actions[idx + 1:]
+        for move in legal_actions:
+            if self.__position(move) == tt_move:
+                return [move] + actions
+        return actions
+
+    def __new_search_ordering(self):
+        """ Nouvelle recherche : les coups tueurs sont oubliés, l'historique est vieilli."""
+        self.killer_moves = {}
+        self.history_table *= 0.5
+
+    def __order_moves(self, actions, legal_actions, depth, mine: bool):
+        """
+        Trie les coups sélectionnés (de chaque côté du marqueur "annex") par attention et historique mélangés
+        (par l'évaluation groupée des fils jusqu'à BATCH_DEPTH si elle est activée),
+        puis place en tête les coups tueurs de cette profondeur (ajoutés s'ils n'ont pas été sélectionnés,
+        sauf avec INDEPENDENT_ROOT_MOVES).
+        """
+        if self.local_analysis_area is not None:
+            return actions
+        attention = self.joueur._memory.get_attention_board()
+        attention_max = attention.max()
+        history_max = self.history_table.max()
+
+        batch_scores = None
+        moves = [move for move in actions if move != "annex"]
+        if self.batch_evaluator is not None and depth <= self.BATCH_DEPTH and moves:
+            positions = [(x + 1, y + 1) for x, y in (move.data["position"] for move in moves)]
+            scores = self.batch_evaluator.evaluate(positions, mine)
+            # meilleurs coups du joueur au trait en premier (MIN minimise le score)
+            batch_scores = {position: float(value if mine else -value) for position, value in zip(positions, scores)}
+
+        def score(move):
+            x, y = move.data["position"]
+            if batch_scores is not None:
+                return batch_scores[(x + 1, y + 1)]
+            value = attention[x + 1, y + 1] / attention_max if attention_max > 0 else 0.0
+            if history_max > 0:
+                value += self.HISTORY_WEIGHT * self.history_table[x + 1, y + 1] / history_max
+            return value
+
+        if "annex" in actions:
+            idx = actions.index("annex")
+            actions = sorted(actions[:idx], key=score, reverse=True) + ["annex"] + sorted(actions[idx + 1:], key=score, reverse=True)
+        else:
+            actions = sorted(actions, key=score, reverse=True)
+
+        for killer in reversed(self.killer_moves.get(depth, [])):
+            for idx, move in enumerate(actions):
+                if move != "annex" and self.__position(move) == killer:
+                    actions = [move] + actions[:idx] + actions[idx + 1:]
+                    break
+            else:
+                if self.INDEPENDENT_ROOT_MOVES:
+                    continue
+                for move in legal_actions:
+                    if self.__position(move) == killer:
+                        actions = [move] + actions
+                        break
+        return actions
+
+    def __record_cutoff(self, move, depth):
+        """ move a provoqué une coupure : il devient coup tueur de cette profondeur et gagne en historique."""
+        if self.local_analysis_area is not None:
+            return
+        position = self.__position(move)
+        killers = self.killer_moves.setdefault(depth, [])
+        if position in killers:
+            killers.remove(position)
+        killers.insert(0, position)
+        del killers[self.KILLER_SLOTS:]
+        remaining = self.maximum_depth - depth
+        self.history_table[position[0] + 1, position[1] + 1] += remaining * remaining
+
+    def __legal_actions(self, color: str):
+        """ Coups légaux (cases vides du plateau de la mémoire) pour la couleur donnée."""
+        board = self.joueur._memory.get_board()
+        xs, ys = np.nonzero(board[1:-1, 1:-1] == 0)
+        return [LightAction({"piece": color, "position": (int(x), int(y))}) for x, y in zip(xs, ys)]
+
+    def __maxValue(self,alpha,beta,depth):
+        self.__check_time()
+        self.nodes += 1
+        self.pv_table[depth] = []
         # si la profondeur de recherche est atteint
         if depth == self.maximum_depth:
-            return self.heuristique.execute(), None
+            return self.__evaluate_leaf(), None
+
+        # Table de transposition
+        remaining = self.maximum_depth - depth
+        alpha_orig, beta_orig = alpha, beta
+        key, tt_move = None, None
+        if self.__use_tt():
+            key = self.joueur._memory.heuristique_cache.current_hash
+            tt_value, alpha, beta, tt_move = self.__probe_tt(key, remaining, alpha, beta, depth)
+            if tt_value is not None:
+                return tt_value, None
         
         #  Verification d'un coup forcé 
-        _forced_move = self.joueur._forced_move.find_me_forced_move(self.local_analysis_area,s,depth)
+        _forced_move = self.joueur._forced_move.find_me_forced_move(self.local_analysis_area,self.root_state,depth)
         if _forced_move is not None:
             light_action = _forced_move  
-            s_prime = s.apply_action(light_action)
-            self.joueur._memory.update(s_prime)
-            v, _ = self.__minValue(s_prime, alpha, beta, depth + 1)
-            self.joueur._memory.undo()
+            if self.__play(light_action, mine=True):
+                self.__unplay()
+                self.pv_table[depth] = [light_action]
+                return self.__evaluate(True), light_action
+            v, _ = self.__minValue(alpha, beta, depth + 1)
+            self.__unplay()
+            self.__store_pv(depth, light_action)
+            if depth == 0:
+                self.root_forced = True
             return v, light_action
 
         v_star = float("-inf")
         m_star = None
 
         # selection des meilleures actions
-        actions = list(s.generate_possible_light_actions())
-        actions = self.actions_selection(actions)
+        legal_actions = self.__legal_actions(self.joueur._memory.get_my_color())
+        actions = self.actions_selection(legal_actions)
+        actions = self.__order_moves(actions, legal_actions, depth, mine=True)
+        actions = self.__order_tt(actions, legal_actions, tt_move)
+        actions = self.__order_pv(actions, depth)
 
         if len(actions) == 0:
-            return self.heuristique.execute(), None
+            return self.__evaluate_leaf(), None
+        if depth == 0 and self.__parallel(self.maximum_depth) and self.local_analysis_area is None:
+            v_star, m_star = self.__parallel_root(actions, alpha, beta)
+            self.__store_tt(key, remaining, v_star, m_star, alpha_orig, beta_orig, maximizing=True)
+            return (v_star, m_star)
+        pvs = self.pvs and self.__use_tt()
+        first = True
         for move in actions:
             # si on sort de la zone d'intérêt, on de descend plus
             if move == "annex":
                 if depth == 0:
-                    self.maximum_depth = 2
+                    self.maximum_depth = max(1, self.maximum_depth - 1)
                 continue
 
-            s_prime = s.apply_action(move)
-             # MAJ Memory
-            self.joueur._memory.update(s_prime)
-           
             # Condition d'arrêt (finale)
-            if s_prime.is_done():
-                score = self.__evaluate(s_prime)
-                self.joueur._memory.undo()
+            if self.__play(move, mine=True):
+                score = self.__evaluate(True)
+                self.__unplay()
+                self.pv_table[depth] = [move]
                 return score, move  # score est +inf si MAX gagne, -inf si MIN gagne
 
             # on cherche la valeur minimum a la profondeur suivante 
-            
-            (v,_) = self.__minValue(s_prime,alpha,beta, depth + 1)
+            if first or not pvs:
+                (v,_) = self.__minValue(alpha,beta, depth + 1)
+            else:
+                # PVS : on vérifie seulement que le coup dépasse alpha (fenêtre nulle ]alpha, alpha + epsilon]),
+                # la recherche complète n'est refaite que s'il le dépasse. Une fenêtre vide [alpha, alpha]
+                # ne suffit pas : une coupure à égalité (ex. sur une défaite) serait prise pour un échec.
+                (v,_) = self.__minValue(alpha,math.nextafter(alpha, beta), depth + 1)
+                if alpha < v < beta:
+                    (v,_) = self.__minValue(alpha,beta, depth + 1)
+            first = False
+            self.follow_pv = False # les frères suivants ne sont plus sur la ligne principale
 
             # On cherche la plus grande valeur a la profondeur n+1
             if(v > v_star):
                 v_star = v
                 m_star = move
                 alpha = max(alpha,v_star)
-            self.joueur._memory.undo()
-            if (v_star >= beta): return (v_star,m_star) #pruning
+                self.__store_pv(depth, move)
+            self.__unplay()
+            if (v_star >= beta): #pruning
+                self.__record_cutoff(move, depth)
+                break
+        self.__store_tt(key, remaining, v_star, m_star, alpha_orig, beta_orig, maximizing=True)
         # if(depth == 0):
         #     print("coup joué :",v_star,m_star)
         return (v_star,m_star)
 
-    def __minValue(self,s: GameStateHex,alpha,beta,depth):
+    def __minValue(self,alpha,beta,depth):
+        self.__check_time()
+        self.nodes += 1
+        self.pv_table[depth] = []
         # si la profondeur de recherche est atteint
         if depth == self.maximum_depth:
-            return self.heuristique.execute(), None
+            return self.__evaluate_leaf(), None
+
+        # Table de transposition
+        remaining = self.maximum_depth - depth
+        alpha_orig, beta_orig = alpha, beta
+        key, tt_move = None, None
+        if self.__use_tt():
+            key = self.joueur._memory.heuristique_cache.current_hash
+            tt_value, alpha, beta, tt_move = self.__probe_tt(key, remaining, alpha, beta, depth)
+            if tt_value is not None:
+                return tt_value, None
 
         #  Verification d'un coup forcé (_forced_move est de type light_action)
-        _forced_move = self.joueur._forced_move.find_adversary_forced_move(self.local_analysis_area,s,depth)
+        _forced_move = self.joueur._forced_move.find_adversary_forced_move(self.local_analysis_area,self.root_state,depth)
         if _forced_move is not None:
             light_action = _forced_move  
-            s_prime = s.apply_action(light_action)
-            self.joueur._memory.update(s_prime)
-            v, _ = self.__maxValue(s_prime, alpha, beta, depth + 1)
-            self.joueur._memory.undo()
+            if self.__play(light_action, mine=False):
+                self.__unplay()
+                self.pv_table[depth] = [light_action]
+                return self.__evaluate(False), light_action
+            v, _ = self.__maxValue(alpha, beta, depth + 1)
+            self.__unplay()
+            self.__store_pv(depth, light_action)
             return v, light_action
         
         v_star = float("+inf")
         m_star = None
 
         # selection des meilleures actions
-        actions = list(s.generate_possible_light_actions())
-        actions = self.actions_selection(actions)
+        legal_actions = self.__legal_actions(self.joueur._memory.get_adversary_color())
+        actions = self.actions_selection(legal_actions)
+        actions = self.__order_moves(actions, legal_actions, depth, mine=False)
+        actions = self.__order_tt(actions, legal_actions, tt_move)
+        actions = self.__order_pv(actions, depth)
 
         # La liste des actions peut être vide sans être à un noeud terminal global (recherche locale)
         if len(actions) == 0:
-            return self.heuristique.execute(), None
+            return self.__evaluate_leaf(), None
 
+        pvs = self.pvs and self.__use_tt()
+        first = True
         for move in actions:     
             if move == "annex":
                 continue
-            s_prime = s.apply_action(move)
-            self.joueur._memory.update(s_prime)
-
             # Condition d'arrêt (finale)
-            if s_prime.is_done():
-                score = self.__evaluate(s_prime)
-                self.joueur._memory.undo()
+            if self.__play(move, mine=False):
+                score = self.__evaluate(False)
+                self.__unplay()
+                self.pv_table[depth] = [move]
                 return score, move  # score est +inf si MAX gagne, -inf si MIN gagne
 
 
             # on cherche la valeur minimum a la profondeur suivante 
-            (v,_) = self.__maxValue(s_prime,alpha,beta, depth + 1)
+            if first or not pvs:
+                (v,_) = self.__maxValue(alpha,beta, depth + 1)
+            else:
+                # PVS : fenêtre nulle [beta - epsilon, beta[, recherche complète seulement si le coup passe sous beta
+                (v,_) = self.__maxValue(math.nextafter(beta, alpha),beta, depth + 1)
+                if alpha < v < beta:
+                    (v,_) = self.__maxValue(alpha,beta, depth + 1)
+            first = False
+            self.follow_pv = False # les frères suivants ne sont plus sur la ligne principale
 
             # On cherche la plus petite valeur a la profondeur n+1
             if(v < v_star):
                 v_star = v
                 m_star = move
                 beta = min(beta,v_star)
-            self.joueur._memory.undo()
-            if (v_star <= alpha): return (v_star,m_star) #pruning
+                self.__store_pv(depth, move)
+            self.__unplay()
+            if (v_star <= alpha): #pruning
+                self.__record_cutoff(move, depth)
+                break
+        self.__store_tt(key, remaining, v_star, m_star, alpha_orig, beta_orig, maximizing=False)
         return (v_star,m_star)   
 
-    def __evaluate(self, s: GameStateHex) -> float:
-        my_id = self.joueur.get_id()
+    def __pool(self):
+        """ Pool de processus de la recherche parallèle (créé à la première utilisation)."""
+        if self._executor is None:
+            context = multiprocessing.get_context(self.start_method)
+            self._shared_alpha = context.Value("d", float("-inf"))
+            self._shared_search = context.Value("q", 0)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                                 initializer=_init_worker,
+                                                 initargs=(self._shared_alpha, self._shared_search, self.joueur.get_piece_type(),
+                                                           *self.__worker_options()))
+        return self._executor
+
+    def __worker_options(self):
+        """
+        Configuration du joueur des processus de calcul, identique à celle du joueur principal
+        (sauf ce qui ne concerne que lui : processus, réflexion, instrumentation, traces).
 
-        return +10000 if s.scores[my_id] == 1 else -10000
+        Returns:
+            (options de MyPlayer, options du moteur absentes de MyPlayer)
+        """
+        player_options = {
+            "heuristique": self.joueur._heuristique_name,
+            "batch_ordering": self.batch_evaluator is not None,
+            "seed": self.seed,
+            "cache_max_entries": self.joueur._memory.heuristique_cache.max_entries,
+            "cache_max_age": self.joueur._memory.heuristique_cache.max_age,
+        }
+        return player_options, {"pvs": self.pvs, "INDEPENDENT_ROOT_MOVES": self.INDEPENDENT_ROOT_MOVES}
+
+    def shutdown(self):
+        """ Arrête les processus de la recherche parallèle."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def __parallel(self, depth) -> bool:
+        """
+        True si une itération de profondeur depth répartit la racine entre les processus.
+
+        Chaque tâche coûte quelques millisecondes fixes (envoi, mise à jour de la mémoire du processus,
+        résultat) et perd l'ordonnancement appris par les autres : aux profondeurs < PARALLEL_MIN_DEPTH
+        (itérations de l'ordre de la seconde ou moins), ce coût domine
+        (profondeur 3 sur benchmark_positions.json : ~1.2 s séquentiel, 2 à 3 s avec 3 processus).
+        Aucun gain n'a été mesuré au-delà non plus : sur un seul coeur, la profondeur 4 est 2 à 4 fois
+        plus lente avec 3 processus (midgame_1 : 4.6 s séquentiel, 9.1 s en parallèle).
+        """
+        return self.workers > 1 and depth >= self.PARALLEL_MIN_DEPTH
+
+    def __parallel_root(self, actions, alpha, beta):
+        """
+        Répartit les coups de la racine entre les processus du pool (un coup par tâche, dans l'ordre).
+        Chaque processus joue sur sa propre mémoire reconstruite depuis l'historique de la racine;
+        la borne alpha est partagée pour que les tâches suivantes profitent des coupures précédentes.
+
+        Les tâches portent l'identifiant de la recherche; il est incrémenté à chaque sortie (résultat,
+        coupure beta ou arrêt), ce qui arrête aussi les tâches déjà en cours dans les processus.
+        Les noeuds et feuilles des tâches terminées s'ajoutent aux compteurs du moteur
+        (ceux d'une tâche encore en cours à la sortie sont perdus).
+        """
+        executor = self.__pool()
+        with self._shared_alpha.get_lock():
+            self._shared_alpha.value = alpha
+        search_id = self._shared_search.value
+        memory = self.joueur._memory
+        root_moves = [(tuple(map(int, position)), int(memory.get_board()[position])) for position in memory.move_history]
+        wall_deadline = None
+        if self.deadline is not None:
+            wall_deadline = time.time() + (self.deadline - time.perf_counter())
+
+        tasks = []
+        for move in actions:
+            if move == "annex":
+                self.maximum_depth = max(1, self.maximum_depth - 1)
+                continue
+            tasks.append((move, executor.submit(_search_root_move, search_id, root_moves, self.__position(move),
+                                                self.maximum_depth, self.branching_factor, beta, wall_deadline)))
+
+        v_star, m_star, exact_star = float("-inf"), None, False
+        counted = 0 # tâches dont les compteurs ont été ajoutés
+        try:
+            for move, task in tasks:
+                while True:
+                    try:
+                        result, nodes, leaf_evaluations = task.result(timeout=0.05)
+                        break
+                    except FutureTimeoutError:
+                        self.__check_time() # demande d'arrêt pendant l'attente
+                self.nodes += nodes
+                self.leaf_evaluations += leaf_evaluations
+                counted += 1
+                if result is None:
+                    raise SearchTimeout()
+                v, alpha_used, line = result
+                # une valeur <= alpha utilisé n'est qu'une borne : à égalité on garde une valeur exacte
+                exact = v > alpha_used
+                if v > v_star or (v == v_star and exact and not exact_star):
+                    v_star, m_star, exact_star = v, move, exact
+                    self.pv_table[0] = [move] + line
+                if v_star >= beta:
+                    break
+        finally:
+            # fin de la recherche search_id : les tâches en attente sont annulées, celles déjà lancées s'arrêtent
+            with self._shared_search.get_lock():
+                self._shared_search.value = search_id + 1
+            for _, task in tasks[counted:]:
+                if not task.cancel() and task.done() and task.exception() is None:
+                    _, nodes, leaf_evaluations = task.result()
+                    self.nodes += nodes
+                    self.leaf_evaluations += leaf_evaluations
+        return v_star, m_star
+
+    def search_root_move(self, position, depth, branching_factor, alpha, beta, deadline, shared_search = None,
+                         search_id = None):
+        """
+        Recherche parallèle (côté processus) : valeur du coup position joué à la racine,
+        la recherche descendant jusqu'à depth.
+
+        Returns:
+            (valeur, meilleure ligne après le coup) ou None si deadline est dépassée ou si la recherche
+            search_id est terminée (shared_search a changé)
+        """
+        self.shared_search = shared_search
+        self.search_id = search_id
+        self.maximum_depth = depth
+        self.branching_factor = branching_factor
+        self.__set_local_analysis_area(None)
+        self.root_state = None
+        self.deadline = deadline
+        self.pv_table = {}
+        self.previous_pv = []
+        self.follow_pv = False
+        self.root_forced = False
+        self._ply = 0
+        move = LightAction({"piece": self.joueur._memory.get_my_color(), "position": position})
+        try:
+            if self.__play(move, mine=True):
+                return self.__evaluate(True), []
+            v, _ = self.__minValue(alpha, beta, 1)
+            return v, [self.__position(m) for m in self.pv_table.get(1, [])]
+        except SearchTimeout:
+            return None
+        finally:
+            while self._ply > 0:
+                self.__unplay()
+            self.deadline = None
+
+    def __evaluate_leaf(self) -> float:
+        """ Valeur heuristique d'une feuille (profondeur maximale ou plus aucun coup)."""
+        self.leaf_evaluations += 1
+        return self.heuristique.execute()
+
+    def __evaluate(self, i_won: bool) -> float:
+        return +10000 if i_won else -10000
     
 
     def to_json(self):
@@ -306,7 +971,10 @@ class Algorithme_minimax_alpha_beta_typeA(Algorithme):
 
         # tirage pondéré
         num_to_choose = min(remaining_slots, len(remaining_indices))  
-        chosen_rest = np.random.choice(remaining_indices, size=num_to_choose, replace=False, p=remaining_probs)
+        rng = self.rng
+        if self.seed is not None: # tirage propre à la position (voir __init__)
+            rng = np.random.default_rng((self.seed, self.joueur._memory.heuristique_cache.current_hash))
+        chosen_rest = rng.choice(remaining_indices, size=num_to_choose, replace=False, p=remaining_probs)
 
         # assemblage final
         selected_actions = [valid_action_list[idx] for idx in selected_indices]+["annex"]+[valid_action_list[idx] for idx in chosen_rest]
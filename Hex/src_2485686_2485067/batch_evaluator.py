@@ -0,0 +1,120 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+import numpy as np
+from typing import TYPE_CHECKING
+from src_2485686_2485067.Metrics.center_control import Center_control
+from src_2485686_2485067.Metrics.distance import Distance
+from src_2485686_2485067.geometry import geometry
+if TYPE_CHECKING:
+    from my_player import MyPlayer
+    from src_2485686_2485067.heuristique_v1 import Heuristique_v1
+
+
+class BatchEvaluator:
+    """
+    Évaluation groupée des fils de la position courante de la mémoire (un coup de plus) :
+    les N plateaux fils sont empilés en un tableau (N, 16, 16) et les métriques de Heuristique_v1
+    sont calculées pour tous en une passe numpy, sans jouer les coups sur la mémoire.
+
+    - contrôle du centre : produit terme à terme avec la pondération de Center_control
+    - blocage : part du chemin critique adverse (celui de la position courante) occupée par mes pions
+    - distances : plus court chemin par relaxation min-plus sur les coûts de Distance de la position
+      courante (les maillons et trapèzes créés par le coup du fils ne sont pas pris en compte)
+
+    Les maillons ne sont pas comptés : le score est une approximation de Heuristique_v1.execute()
+    destinée à l'ordonnancement des coups.
+    """
+
+    def __init__(self, joueur: "MyPlayer", heuristique: "Heuristique_v1"):
+        self.joueur = joueur
+        self.heuristique = heuristique
+        self.center_control_board = Center_control(joueur).center_control_board
+        self.distance = Distance(joueur) # uniquement pour ses coûts par case et ses bords
+
+        # voisins de chaque case (indices plats), complétés par une case fictive bloquée (indice side * side)
+        grid = geometry(self.center_control_board.shape[0])
+        size = len(grid.positions)
+        self.neighbours = np.full((size, 6), size)
+        for index, cells in enumerate(grid.neighbours):
+            self.neighbours[index, :len(cells)] = cells
+
+    def children(self, positions: list, value: int) -> np.ndarray:
+        """
+        Plateaux (N, 16, 16) obtenus en posant un pion de valeur value sur chaque position (plateau aggrandi).
+        """
+        board = self.joueur._memory.get_board()
+        boards = np.repeat(board[np.newaxis], len(positions), axis=0)
+        rows, columns = np.array(positions).T
+        boards[np.arange(len(positions)), rows, columns] = value
+        return boards
+
+    def center_control(self, boards: np.ndarray) -> np.ndarray:
+        """ Contrôle du centre de chaque plateau (voir Center_control.execute)."""
+        return np.tensordot(boards == 1, self.center_control_board, axes=2)
+
+    def blocking(self, boards: np.ndarray) -> np.ndarray:
+        """ Part du chemin critique adverse courant occupée par mes pions, pour chaque plateau."""
+        path = self.joueur._memory.get_adversary_critical_path()
+        if not path:
+            return np.zeros(len(boards))
+        rows, columns = np.array(path).T
+        return (boards[:, rows, columns] == 1).sum(axis=1) / len(path)
+
+    def distances(self, boards: np.ndarray, for_adversary: bool) -> np.ndarray:
+        """
+        Distance du joueur pour chaque plateau, par relaxation min-plus :
+        dist = min(dist, min(dist des voisins) + coût de la case) jusqu'à stabilité.
+
+        Returns:
+            distances (N,) en unités de Distance (np.inf si le joueur est coupé)
+        """
+        count = len(boards)
+        size = self.neighbours.shape[0]
+        player_value = -1 if for_adversary else 1
+
+        # coûts de la position courante, corrigés des pions posés par chaque fils
+        base = np.array(self.distance._cell_costs(for_adversary), dtype=float)
+        base[base < 0] = np.inf
+        flat = boards.reshape(count, size)
+        costs = np.empty((count, size + 1))
+        costs[:, :size] = base
+        costs[:, size] = np.inf
+        costs[:, :size][flat == player_value] = self.distance._scaled_costs["my_piece"]
+        costs[:, :size][flat == -player_value] = np.inf
+
+        starts, objectives = self.distance._edges(for_adversary)
+        dist = np.full((count, size + 1), np.inf)
+        start_costs = costs[:, starts]
+        dist[:, starts] = np.where(start_costs == self.distance._scaled_costs["my_piece"], start_costs,
+                                   np.where(np.isfinite(start_costs), self.distance._scaled_costs["empty"], np.inf))
+        while True:
+            relaxed = np.minimum(dist[:, :size], dist[:, self.neighbours].min(axis=2) + costs[:, :size])
+            if np.array_equal(relaxed, dist[:, :size]):
+                break
+            dist[:, :size] = relaxed
+        return dist[:, objectives].min(axis=1) / self.distance.COST_SCALE
+
+    def evaluate(self, positions: list, mine: bool) -> np.ndarray:
+        """
+        Score (point de vue de MAX, comme Heuristique_v1) de chaque fils obtenu en jouant une position.
+
+        Args:
+            positions: positions (i, j) du plateau aggrandi
+            mine: True si les coups sont les miens
+        """
+        heuristique = self.heuristique
+        boards = self.children(positions, 1 if mine else -1)
+        my_distance = self.distances(boards, for_adversary=False)
+        adversary_distance = self.distances(boards, for_adversary=True)
+        with np.errstate(invalid="ignore"):
+            scores = (
+                -heuristique.alpha * my_distance / heuristique.MAX_DISTANCE +
+                heuristique.delta * adversary_distance / heuristique.MAX_DISTANCE +
+                heuristique.gamma * self.center_control(boards) / heuristique.MAX_CENTER +
+                heuristique.epsilon * self.blocking(boards)
+            )
+        scores[adversary_distance == np.inf] = 10000
+        scores[my_distance == np.inf] = -10000
+        return scores
@@ -152,48 +152,52 @@ class EarlyVictory:
     def _union_find_victory(self, color: str) -> bool:
         """
         Teste si le joueur de la couleur donnée a relié ses deux bords.
-        Utilise Union-Find pour explorer les connexions.
+        Les groupes de pierres viennent de l'union-find incrémental de la mémoire;
+        seules les connexions virtuelles (liens + trapèzes) sont ajoutées ici, sur un
+        petit Union-Find dont les noeuds sont les racines de ces groupes.
         """
-        n = self.size * self.size
-        uf = UnionFind(n + 4)  # +4 pour TOP, BOTTOM, LEFT, RIGHT
-        board = self.board
-        me = 1 if color == self._memory.get_my_color() else -1  
-
-        # Indices virtuels
-        TOP, BOTTOM, LEFT, RIGHT = n, n + 1, n + 2, n + 3
-        index = lambda i, j: i * self.size + j
-
-        # Union des voisins adjacents de même couleur
-        for i in range(self.size):
-            for j in range(self.size):
-                if board[i, j] != me:
-                    continue
-                for di, dj in [(-1,0),(1,0),(0,-1),(0,1),(-1,1),(1,-1)]:
-                    ni, nj = i + di, j + dj
-                    if 0 <= ni < self.size and 0 <= nj < self.size and board[ni, nj] == me:
-                        uf.union(index(i, j), index(ni, nj))
+        uf = self._memory.union_find
+        me = 1 if color == self._memory.get_my_color() else -1
+        if color == 'R':
+            start, goal = uf.TOP, uf.BOTTOM  # Rouge relie haut → bas
+        else:
+            start, goal = uf.LEFT, uf.RIGHT  # Bleu relie gauche → droite
 
-        # Union via les structures (liens + trapèzes)
-        def union_cells(cells):
-            cells_list = []
-            for c in cells:
-                if isinstance(c, (tuple, list)) and len(c) == 2:
-                    cells_list.append(tuple(c))
-            for a in cells_list:
-                for b in cells_list:
-                    uf.union(index(a[0], a[1]), index(b[0], b[1]))
+        # Connexion par les pierres uniquement
+        if uf.find(start) == uf.find(goal):
+            return True
 
         # Récupération des structures selon la couleur
-        if color == self._memory.get_my_color():
+        if me == 1:
             links = self._memory.get_me_links()
             traps = self._memory.get_me_trapezoid()
         else:
             links = self._memory.get_adversary_links()
             traps = self._memory.get_adversary_trapezoid()
+        if not links and not traps:
+            return False
+
+        # Union-Find réduit : un noeud par groupe de pierres concerné
+        roots = {}
+        def node(root):
+            if root not in roots:
+                roots[root] = len(roots)
+            return roots[root]
+        def cell_node(cell):
+            return node(uf.find(self._uf_index(cell)))
+
+        start_node, goal_node = node(uf.find(start)), node(uf.find(goal))
+        overlay = UnionFind(2 + 2 * len(links) + 2 * sum(len(trap) for trap in traps))
+
+        # Union via les structures (liens + trapèzes)
+        def union_cells(cells):
+            cells_list = [tuple(c) for c in cells if isinstance(c, (tuple, list)) and len(c) == 2]
+            for a in cells_list[1:]:
+                overlay.union(cell_node(cells_list[0]), cell_node(a))
 
         for link in links.keys():
             union_cells(link)
-            
+
         for trap in traps.keys():
             if len(trap) > 1:
                 # Trapèze classique → union interne
@@ -202,41 +206,31 @@ class EarlyVictory:
                 # Trapèze unitaire → relier au bord le plus proche selon sa couleur
                 (i, j) = next(iter(trap))
                 if color == 'R':  # Rouge : haut ↔ bas
-                    # On regarde le plus proche entre TOP et BOTTOM
-                    dist_top = i
-                    dist_bottom = self.size - 1 - i
-                    if dist_top <= dist_bottom:
-                        uf.union(index(i, j), TOP)
-                    else:
-                        uf.union(index(i, j), BOTTOM)
-
-                elif color == 'B':  # Bleu : gauche ↔ droite
-                    # On regarde le plus proche entre LEFT et RIGHT
-                    dist_left = j
-                    dist_right = self.size - 1 - j
-                    if dist_left <= dist_right:
-                        uf.union(index(i, j), LEFT)
-                    else:
-                        uf.union(index(i, j), RIGHT)
-
-        # Connexion aux bords virtuels selon la couleur
-        if color == 'R':
-            # Rouge relie haut → bas
-            for j in range(self.size):
-                if board[0, j] == me:
-                    uf.union(index(0, j), TOP)
-                if board[self.size - 1, j] == me:
-                    uf.union(index(self.size - 1, j), BOTTOM)
-            return uf.find(TOP) == uf.find(BOTTOM)
+                    edge = start_node if i <= self.size - 1 - i else goal_node
+                else:  # Bleu : gauche ↔ droite
+                    edge = start_node if j <= self.size - 1 - j else goal_node
+                overlay.union(cell_node((i, j)), edge)
 
-        else:
-            # Bleu relie gauche → droite
-            for i in range(self.size):
-                if board[i, 0] == me:
-                    uf.union(index(i, 0), LEFT)
-                if board[i, self.size - 1] == me:
-                    uf.union(index(i, self.size - 1), RIGHT)
-            return uf.find(LEFT) == uf.find(RIGHT)
+        return overlay.find(start_node) == overlay.find(goal_node)
+
+    def _uf_index(self, cell) -> int:
+        """
+        Convertit une case du plateau aggrandi en noeud de l'union-find de la mémoire
+        (les cases des bords correspondent aux noeuds virtuels).
+        """
+        uf = self._memory.union_find
+        i, j = cell
+        last = self.size - 1
+        # les coins appartiennent aux bords gauche/droite (colonnes remplies en dernier)
+        if j == 0:
+            return uf.LEFT
+        if j == last:
+            return uf.RIGHT
+        if i == 0:
+            return uf.TOP
+        if i == last:
+            return uf.BOTTOM
+        return (i - 1) * uf.dim + (j - 1)
 
     def to_json(self):
         """Sérialisation JSON compatible Seahorse."""
@@ -0,0 +1,67 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+from functools import lru_cache
+
+
+# Directions hexagonales (voisins directs)
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, 1), (1, -1))
+
+# Directions hexagonales à distance 2 reliées par un maillon : (second pion, espace 1, espace 2)
+BRIDGE_DIRECTIONS = {
+    "NORTH":       ((-2, 1), (-1, 0), (-1, 1)),
+    "SOUTH":       ((2, -1), (1, 0), (1, -1)),
+    "NORTH_EAST":  ((-1, 2), (-1, 1), (0, 1)),
+    "NORTH_WEST":  ((-1, -1), (-1, 0), (0, -1)),
+    "SOUTH_EAST":  ((1, 1), (1, 0), (0, 1)),
+    "SOUTH_WEST":  ((1, -2), (1, -1), (0, -1))
+}
+
+# Cases à distance hexagonale exactement 2 (12 cases)
+RING2 = ((-2, 0), (2, 0), (0, -2), (0, 2), (-1, -1), (1, 1),
+         (-2, 1), (-1, 2), (1, -2), (2, -1), (-2, 2), (2, -2))
+
+
+class Geometry:
+    """
+    Tables de voisinage précalculées d'un plateau carré side x side (plateau aggrandi : side = 16).
+    Une case est désignée par son indice plat i * side + j; seules les cases dans le plateau
+    figurent dans les tables, les boucles n'ont donc plus de test de bornes.
+
+    Attributes:
+        positions: indice plat -> (i, j)
+        neighbours: indice plat -> indices plats des voisins directs
+        bridges: indice plat -> [(second pion, espace 1, espace 2)] en positions (i, j), dans l'ordre de BRIDGE_DIRECTIONS
+        ring2: indice plat -> indices plats des cases à distance 2
+    """
+
+    def __init__(self, side: int):
+        self.side = side
+        self.positions = [(i, j) for i in range(side) for j in range(side)]
+        self.neighbours = [self.__offsets(i, j, DIRECTIONS) for i, j in self.positions]
+        self.ring2 = [self.__offsets(i, j, RING2) for i, j in self.positions]
+        self.bridges = []
+        for i, j in self.positions:
+            bridges = []
+            for offsets in BRIDGE_DIRECTIONS.values():
+                cells = [(i + di, j + dj) for di, dj in offsets]
+                if all(self.contains(cell) for cell in cells):
+                    bridges.append(tuple(cells))
+            self.bridges.append(bridges)
+
+    def contains(self, position: tuple) -> bool:
+        return 0 <= position[0] < self.side and 0 <= position[1] < self.side
+
+    def index(self, position: tuple) -> int:
+        """ Indice plat de la case (i, j)."""
+        return position[0] * self.side + position[1]
+
+    def __offsets(self, i, j, offsets):
+        return [(i + di) * self.side + (j + dj) for di, dj in offsets if self.contains((i + di, j + dj))]
+
+
+@lru_cache(maxsize=None)
+def geometry(side: int) -> Geometry:
+    """ Tables du plateau side x side (calculées une seule fois par taille)."""
+    return Geometry(side)
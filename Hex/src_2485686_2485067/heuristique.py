@@ -3,9 +3,27 @@
 # See LICENSE file for details.
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src_2485686_2485067.instrumentation import Instrumentation
 
 class Heuristique(ABC):  
 
     @abstractmethod
     def execute(self):
-        pass
\ No newline at end of file
+        pass
+
+    def coefficient_update(self):
+        """ Ajuste les coefficients selon l'état de la partie (appelé avant chaque recherche)."""
+        pass
+
+    def get_coefficients(self):
+        """
+        Coefficients courants de l'heuristique (les valeurs mises en cache ne sont valides
+        que pour ces coefficients). None si l'heuristique n'en a pas.
+        """
+        return None
+
+    def instrument(self, instrumentation: "Instrumentation"):
+        """ Chronomètre l'évaluation (les heuristiques y ajoutent leurs métriques)."""
+        instrumentation.wrap(self, "execute", f"{type(self).__name__}.execute")
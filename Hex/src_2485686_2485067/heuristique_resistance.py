@@ -0,0 +1,51 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+from src_2485686_2485067.Metrics.resistance import Resistance
+from src_2485686_2485067.heuristique import Heuristique
+from typing import override
+from typing import TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from my_player import MyPlayer
+
+class Heuristique_resistance(Heuristique):
+    """
+    Heuristique d'Anshelevich (Hexy) : log du rapport des résistances électriques
+    entre les bords de l'adversaire et les miens.
+    """
+
+    def __init__(self, joueur:"MyPlayer"):
+        super().__init__()
+        self.joueur = joueur
+        self.metric_resistance = Resistance(self.joueur)
+
+    @override
+    def execute(self) -> float:
+        """
+        Score de la position actuelle (plus il est élevé, meilleure est la position pour MAX).
+        """
+        cached_score = self.joueur._memory.heuristique_cache.get()
+        if cached_score is not None:
+            return cached_score
+
+        score = self.joueur._early_victory_detector.check_victory()
+        if score is not None and score != 0:
+            return score
+
+        my_resistance, adversary_resistance = self.metric_resistance.execute()
+        if my_resistance == np.inf:
+            return -10000 # Position perdante
+        if adversary_resistance == np.inf:
+            return 10000 # Position gagnante
+
+        score = float(np.log(adversary_resistance / my_resistance))
+
+        self.joueur._memory.heuristique_cache.set(score)
+        return score
+
+    @override
+    def get_coefficients(self):
+        return (Resistance.EMPTY_RESISTANCE, Resistance.STONE_RESISTANCE)
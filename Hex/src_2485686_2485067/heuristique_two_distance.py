@@ -0,0 +1,57 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+from src_2485686_2485067.Metrics.two_distance import TwoDistance
+from src_2485686_2485067.heuristique import Heuristique
+from typing import override
+from typing import TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from my_player import MyPlayer
+
+class Heuristique_two_distance(Heuristique):
+    """
+    Heuristique de Queenbee : écart des potentiels two-distance,
+    départagé par la mobilité (nombre de cases réalisant le potentiel).
+    """
+
+    POTENTIAL_WEIGHT = 1.0 # poids de l'écart des potentiels
+    MOBILITY_WEIGHT = 0.01 # poids de l'écart des mobilités (départage)
+
+    def __init__(self, joueur:"MyPlayer"):
+        super().__init__()
+        self.joueur = joueur
+        self.metric_two_distance = TwoDistance(self.joueur)
+
+    @override
+    def execute(self) -> float:
+        """
+        Score de la position actuelle (plus il est élevé, meilleure est la position pour MAX).
+        """
+        cached_score = self.joueur._memory.heuristique_cache.get()
+        if cached_score is not None:
+            return cached_score
+
+        score = self.joueur._early_victory_detector.check_victory()
+        if score is not None and score != 0:
+            return score
+
+        my_potential, my_mobility, adversary_potential, adversary_mobility = self.metric_two_distance.execute()
+        if my_potential == np.inf:
+            return -10000 # Position perdante
+        if adversary_potential == np.inf:
+            return 10000 # Position gagnante
+
+        score = (
+            self.POTENTIAL_WEIGHT * (adversary_potential - my_potential) +
+            self.MOBILITY_WEIGHT * (my_mobility - adversary_mobility)
+        )
+
+        self.joueur._memory.heuristique_cache.set(score)
+        return score
+
+    @override
+    def get_coefficients(self):
+        return (self.POTENTIAL_WEIGHT, self.MOBILITY_WEIGHT)
@@ -13,6 +13,7 @@ import numpy as np
 
 if TYPE_CHECKING:
     from my_player import MyPlayer
+    from src_2485686_2485067.instrumentation import Instrumentation
 
 class Heuristique_v1(Heuristique):
     """
@@ -77,8 +78,9 @@ class Heuristique_v1(Heuristique):
         Plus le score est élevé, meilleure est la position pour MAX.
         """
         # si l'heuristique a déjà été calculé alors on la retourne directement 
-        if(self.joueur._memory.heuristique_cache.contains(self.joueur._memory.get_board())):
-            return self.joueur._memory.heuristique_cache.get(self.joueur._memory.get_board())
+        cached_score = self.joueur._memory.heuristique_cache.get()
+        if cached_score is not None:
+            return cached_score
 
         # Early victory detector
         score = self.joueur._early_victory_detector.check_victory()
@@ -88,9 +90,9 @@ class Heuristique_v1(Heuristique):
 
         # Calcul des métriques de base
  #       my_distance, adversary_distance = self.metric_distance_jetons.execute()
-        my_distance, adversary_distance = self.joueur._memory.my_distance,self.joueur._memory.adversary_distance
+        my_distance, adversary_distance = self.joueur._memory.get_my_distance(),self.joueur._memory.get_adversary_distance()
         nbr_maillons_moi, nbr_maillons_adversaire = self.metric_maillons.execute()
-        nbr_trapezes_moi = len(self.joueur._memory.me_trapezoid)
+        nbr_trapezes_moi = len(self.joueur._memory.get_me_trapezoid())
         center_score = self.metric_center_control.execute()
         
         # Gestion des distances infinies (pas de chemin possible)
@@ -121,7 +123,7 @@ class Heuristique_v1(Heuristique):
         )
 
         # sauvegarde de la valeur de l'heuristique pour cet état 
-        self.joueur._memory.heuristique_cache.set(self.joueur._memory.get_board(),score)
+        self.joueur._memory.heuristique_cache.set(score)
         
         return score
 
@@ -135,7 +137,7 @@ class Heuristique_v1(Heuristique):
         """
         # Récupérer le chemin critique de l'adversaire (depuis le cache)
  #       adv_path = self.metric_distance_jetons.get_adversary_critical_path()
-        adv_path = self.joueur._memory.adversary_critical_path
+        adv_path = self.joueur._memory.get_adversary_critical_path()
         
         if not adv_path or len(adv_path) == 0:
             return 0.0
@@ -177,7 +179,7 @@ class Heuristique_v1(Heuristique):
         
         # ===== AJUSTEMENT TACTIQUE =====
         
-        my_distance, adversary_distance = self.joueur._memory.my_distance,self.joueur._memory.adversary_distance
+        my_distance, adversary_distance = self.joueur._memory.get_my_distance(),self.joueur._memory.get_adversary_distance()
         distance_diff = my_distance - adversary_distance
         
         # Gestion des distances infinies
@@ -204,6 +206,19 @@ class Heuristique_v1(Heuristique):
             self.mode = "COMPETITIF"
  #           print(f"MODE COMPÉTITIF : {my_distance:.1f} vs {adversary_distance:.1f}")
 
+    @override
+    def instrument(self, instrumentation: "Instrumentation"):
+        super().instrument(instrumentation)
+        instrumentation.wrap(self, "compute_blocking_score", f"{type(self).__name__}.compute_blocking_score")
+        for metric in (self.metric_maillons, self.metric_center_control):
+            instrumentation.wrap(metric, "execute", f"{type(metric).__name__}.execute")
+        detector = self.joueur._early_victory_detector
+        instrumentation.wrap(detector, "check_victory", f"{type(detector).__name__}.check_victory")
+
+    @override
+    def get_coefficients(self):
+        return (self.alpha, self.beta_me, self.beta_adv, self.gamma, self.delta, self.epsilon, self.zeta)
+
     def to_json(self):
         """Sérialisation pour debug et logging."""
         return {
@@ -218,7 +233,7 @@ class Heuristique_v1(Heuristique):
         Recalcule automatiquement le score et toutes les métriques.
         """
         # Calculer toutes les métriques
-        my_distance, adversary_distance = self.joueur._memory.my_distance,self.joueur._memory.adversary_distance
+        my_distance, adversary_distance = self.joueur._memory.get_my_distance(),self.joueur._memory.get_adversary_distance()
         nbr_maillons_moi, nbr_maillons_adversaire = self.metric_maillons.execute()
         center_score = self.metric_center_control.execute()
         blocking_score = self.compute_blocking_score()
@@ -247,8 +262,8 @@ class Heuristique_v1(Heuristique):
         # Récupérer les chemins critiques
         # my_path = self.metric_distance_jetons.get_my_critical_path()
         # adv_path = self.metric_distance_jetons.get_adversary_critical_path()
-        my_path = self.joueur._memory.my_critical_path
-        adv_path = self.joueur._memory.adversary_critical_path
+        my_path = self.joueur._memory.get_my_critical_path()
+        adv_path = self.joueur._memory.get_adversary_critical_path()
         
         # Calculs de normalisation (gérer les infinis)
         if my_distance != np.inf:
@@ -0,0 +1,68 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+from time import perf_counter_ns
+
+
+class Instrumentation:
+    """
+    Compteurs d'appels et temps cumulés (perf_counter_ns) par étiquette, sur demande.
+
+    wrap() remplace une méthode d'une instance par une version chronométrée : rien n'est modifié
+    (ni ralenti) tant que l'instrumentation n'est pas branchée. Les temps sont inclusifs : le temps
+    d'une évaluation comprend celui des managers paresseux qu'elle déclenche (voir Memory._refresh).
+
+    Les compteurs sont remis à zéro au début de chaque coup (reset) et une photo de ceux-ci
+    est ajoutée à l'historique à la fin du coup (end_move).
+    """
+
+    def __init__(self):
+        self.counters = dict() # étiquette -> [nombre d'appels, temps total en ns]
+        self.history = list() # photo des compteurs de chaque coup (voir snapshot)
+
+    def wrap(self, owner, method_name: str, label: str):
+        """
+        Chronomètre la méthode method_name de l'objet owner sous l'étiquette label.
+        """
+        method = getattr(owner, method_name)
+        counter = self.counters.setdefault(label, [0, 0])
+
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                counter[0] += 1
+                counter[1] += perf_counter_ns() - start
+
+        setattr(owner, method_name, timed)
+
+    def reset(self):
+        """ Remet les compteurs à zéro (sur place : les méthodes chronométrées gardent leur compteur)."""
+        for counter in self.counters.values():
+            counter[0] = 0
+            counter[1] = 0
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            {étiquette: {"calls": nombre d'appels, "total_ms": temps total en ms}} des compteurs courants
+        """
+        return {label: {"calls": calls, "total_ms": total_ns / 1e6}
+                for label, (calls, total_ns) in self.counters.items()}
+
+    def end_move(self) -> dict:
+        """ Ajoute la photo des compteurs du coup qui se termine à l'historique et la retourne."""
+        snapshot = self.snapshot()
+        self.history.append(snapshot)
+        return snapshot
+
+    def totals(self) -> dict:
+        """ Somme de l'historique (même format que snapshot) : répartition du temps sur toute la partie."""
+        totals = {label: {"calls": 0, "total_ms": 0.0} for label in self.counters}
+        for snapshot in self.history:
+            for label, counter in snapshot.items():
+                totals[label]["calls"] += counter["calls"]
+                totals[label]["total_ms"] += counter["total_ms"]
+        return totals
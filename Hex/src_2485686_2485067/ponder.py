@@ -0,0 +1,111 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+import threading
+import numpy as np
+from game_state_hex import GameStateHex
+from seahorse.game.light_action import LightAction
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from my_player import MyPlayer  # import uniquement pour l'IDE
+
+
+class Ponderer:
+    """
+    Réflexion pendant le temps de l'adversaire.
+
+    Après notre coup, un thread étudie les réponses adverses les plus probables (celle de la ligne
+    principale de notre dernière recherche, puis les cases libres des chemins critiques et de la matrice
+    d'attention). Les réponses sont approfondies tour à tour, une profondeur à la fois : chacune est jouée
+    sur la mémoire et la recherche reprend là où elle s'était arrêtée, ce qui remplit la table de
+    transposition et le cache de l'heuristique. Si l'adversaire joue une réponse étudiée, compute_action
+    reprend cette recherche au lieu de repartir de zéro.
+
+    La mémoire est partagée avec le thread : stop() doit être appelé avant toute autre utilisation.
+    """
+
+    REPLIES = 4 # nombre de réponses adverses étudiées
+
+    def __init__(self, joueur: "MyPlayer", max_depth: int, replies: int = REPLIES):
+        self.joueur = joueur
+        self.max_depth = max_depth
+        self.replies = replies
+        self._thread = None
+        self.results = {} # {position de la réponse (plateau aggrandi): état de reprise de la recherche}
+
+    def start(self, s: GameStateHex):
+        """ Lance la réflexion depuis s (position après notre coup, la mémoire doit être à jour)."""
+        self.stop()
+        self.results = {}
+        replies = self.likely_replies()
+        if len(replies) == 0:
+            return
+        self._thread = threading.Thread(target=self.__run, args=(s, replies), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> dict:
+        """
+        Arrête la réflexion en cours (la mémoire est remise dans l'état de départ).
+
+        Returns:
+            {position de la réponse: état de reprise} des réponses étudiées
+        """
+        if self._thread is not None:
+            self.joueur._ai_engine.stop_requested = True
+            self._thread.join()
+            self._thread = None
+            self.joueur._ai_engine.stop_requested = False
+        return self.results
+
+    def likely_replies(self) -> list:
+        """ Réponses adverses les plus probables (positions du plateau aggrandi), la plus probable en premier."""
+        memory = self.joueur._memory
+        board = memory.get_board()
+        replies = []
+
+        # réponse prévue par la ligne principale de notre dernière recherche
+        previous_pv = self.joueur._ai_engine.previous_pv
+        if len(previous_pv) > 1:
+            x, y = previous_pv[1]
+            if board[x + 1, y + 1] == 0:
+                replies.append((x + 1, y + 1))
+
+        # puis les cases vides des chemins critiques (l'adversaire avance ou nous bloque),
+        # enfin les autres cases vides, par attention décroissante
+        attention = np.nan_to_num(memory.get_attention_board(), nan=0.0, neginf=0.0)
+        critical = set(memory.get_adversary_critical_path()) | set(memory.get_my_critical_path())
+        candidates = [position for position in critical if board[position] == 0]
+        candidates.sort(key=lambda position: attention[position], reverse=True)
+        for flat in np.argsort(attention, axis=None, kind="stable")[::-1]:
+            position = np.unravel_index(flat, board.shape)
+            candidates.append((int(position[0]), int(position[1])))
+        for position in candidates:
+            if len(replies) >= self.replies:
+                break
+            if board[position] == 0 and position not in replies:
+                replies.append(position)
+        return replies
+
+    def __run(self, s: GameStateHex, replies: list):
+        memory = self.joueur._memory
+        engine = self.joueur._ai_engine
+        new_search = True # une seule recherche (au sens des caches) pour toute la réflexion
+        for depth in range(1, self.max_depth + 1):
+            for position in replies:
+                if engine.stop_requested:
+                    return
+                action = LightAction({"piece": memory.get_adversary_color(), "position": (position[0] - 1, position[1] - 1)})
+                s_prime = s.apply_action(action)
+                memory.play(position, mine=False)
+                try:
+                    if memory.board_manager.is_winning_move(position):
+                        continue # la partie serait finie : rien à préparer
+                    resume = engine.ponder(s_prime, depth, self.results.get(position), new_search)
+                    new_search = False
+                except Exception:
+                    return # la réflexion n'est qu'une aide : on abandonne sans perturber la partie
+                finally:
+                    memory.undo()
+                if resume["completed_depth"] > 0:
+                    self.results[position] = resume
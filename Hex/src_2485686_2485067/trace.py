@@ -0,0 +1,85 @@
+# Copyright (c) 2025
+# Licensed under the MIT License.
+# See LICENSE file for details.
+
+import contextlib
+import json
+import sys
+from typing import Callable, Optional
+
+
+class Trace:
+    """
+    Traces du joueur par niveau et par sous-système, construites seulement si elles sont actives.
+
+    - log() : message formaté à la demande (arguments à la printf, ou fonction retournant le texte)
+    - dump() : fonction d'affichage existante (ex. Memory.print__memory) redirigée vers le flux des traces
+    - record() : un enregistrement JSON compact par ligne dans un fichier (analyse hors ligne des parties)
+
+    Par défaut rien n'est actif : aucun texte n'est construit et rien n'est écrit.
+    """
+
+    OFF = 0 # aucune trace
+    INFO = 1 # une ligne par coup
+    DEBUG = 2 # contenu complet de la mémoire
+    LEVELS = {"off": OFF, "info": INFO, "debug": DEBUG}
+
+    SUBSYSTEMS = ("memory", "search", "time") # sous-systèmes pouvant être activés séparément
+
+    def __init__(self, level: str = "off", subsystems: Optional[tuple] = None, records: Optional[str] = None,
+                 stream=None):
+        """
+        Args:
+            level: niveau maximal des traces affichées ("off", "info" ou "debug")
+            subsystems: sous-systèmes tracés (None : tous)
+            records: fichier JSONL des enregistrements par coup (None : pas d'enregistrement)
+            stream: flux des traces (défaut : sortie standard au moment de l'écriture)
+        """
+        if level not in self.LEVELS:
+            raise ValueError(f"Niveau de trace inconnu : {level} (attendu : {', '.join(self.LEVELS)})")
+        unknown = set(subsystems or ()) - set(self.SUBSYSTEMS)
+        if unknown:
+            raise ValueError(f"Sous-système de trace inconnu : {', '.join(sorted(unknown))} "
+                             f"(attendu : {', '.join(self.SUBSYSTEMS)})")
+        self.level = self.LEVELS[level]
+        self.subsystems = frozenset(self.SUBSYSTEMS if subsystems is None else subsystems)
+        self.stream = stream
+        self._records = open(records, "a") if records is not None else None
+
+    def enabled(self, subsystem: str, level: int) -> bool:
+        """ True si les traces de ce niveau sont actives pour ce sous-système."""
+        return level <= self.level and subsystem in self.subsystems
+
+    def recording(self) -> bool:
+        """ True si les enregistrements par coup sont écrits."""
+        return self._records is not None
+
+    def log(self, subsystem: str, level: int, message, *args):
+        """
+        Écrit une ligne de trace si elle est active. Le texte n'est construit qu'à ce moment :
+        message % args, ou message() si message est une fonction.
+        """
+        if not self.enabled(subsystem, level):
+            return
+        text = message() if callable(message) else (message % args if args else message)
+        print(f"[{subsystem}] {text}", file=self.stream or sys.stdout)
+
+    def dump(self, subsystem: str, level: int, printer: Callable[[], object]):
+        """ Appelle printer (qui affiche avec print) si la trace est active, vers le flux des traces."""
+        if not self.enabled(subsystem, level):
+            return
+        with contextlib.redirect_stdout(self.stream or sys.stdout):
+            printer()
+
+    def record(self, build: Callable[[], dict]):
+        """ Ajoute l'enregistrement build() (construit seulement si les enregistrements sont actifs)."""
+        if self._records is None:
+            return
+        self._records.write(json.dumps(build(), separators=(",", ":")) + "\n")
+        self._records.flush()
+
+    def close(self):
+        """ Ferme le fichier des enregistrements."""
+        if self._records is not None:
+            self._records.close()
+            self._records = None
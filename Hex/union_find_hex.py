@@ -0,0 +1,117 @@
+from typing import Hashable, List, Tuple
+
+
+class HexUnionFind:
+    """
+    Incremental disjoint-set over the cells of an Hex board, with four virtual edge nodes.
+
+    Stones are added one at a time with place(); only the placed stone is merged with its
+    same-coloured neighbours (and its edges). Unions are done by rank without path
+    compression, so every change can be rolled back with undo().
+
+    Attributes:
+        dim (int): dimension of the (square) board
+        vertical_color (Hashable): colour that links TOP and BOTTOM (the other one links LEFT and RIGHT)
+    """
+
+    NEIGHBOURS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, 1), (1, -1))
+
+    def __init__(self, dim: int, vertical_color: Hashable) -> None:
+        self.dim = dim
+        self.vertical_color = vertical_color
+        n = dim * dim
+        self.TOP, self.BOTTOM, self.LEFT, self.RIGHT = n, n + 1, n + 2, n + 3
+        self.parent = list(range(n + 4))
+        self.rank = [0] * (n + 4)
+        self.color = [None] * n
+        self.history = []  # one entry per place(): (cell, [(child_root, new_root, rank_bumped), ...])
+        self.neighbours = [
+            [(i + di) * dim + (j + dj) for di, dj in self.NEIGHBOURS if 0 <= i + di < dim and 0 <= j + dj < dim]
+            for i in range(dim) for j in range(dim)
+        ]
+
+    def copy(self) -> "HexUnionFind":
+        """
+        Returns an independent copy of the current partition (without the undo history).
+        """
+        clone = HexUnionFind.__new__(HexUnionFind)
+        clone.dim = self.dim
+        clone.vertical_color = self.vertical_color
+        clone.TOP, clone.BOTTOM, clone.LEFT, clone.RIGHT = self.TOP, self.BOTTOM, self.LEFT, self.RIGHT
+        clone.parent = self.parent.copy()
+        clone.rank = self.rank.copy()
+        clone.color = self.color.copy()
+        clone.history = []
+        clone.neighbours = self.neighbours
+        return clone
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def _union(self, a: int, b: int, log: List[Tuple[int, int, bool]]) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        bumped = rank[ra] == rank[rb]
+        if bumped:
+            rank[ra] += 1
+        log.append((rb, ra, bumped))
+
+    def place(self, i: int, j: int, color: Hashable) -> None:
+        """
+        Adds a stone of the given colour at (i, j) and merges it with its group(s).
+
+        Args:
+            i (int): line indice
+            j (int): column indice
+            color (Hashable): colour of the stone
+        """
+        cell = i * self.dim + j
+        self.color[cell] = color
+        log = []
+        for neighbour in self.neighbours[cell]:
+            if self.color[neighbour] == color:
+                self._union(cell, neighbour, log)
+        last = self.dim - 1
+        if color == self.vertical_color:
+            if i == 0:
+                self._union(cell, self.TOP, log)
+            if i == last:
+                self._union(cell, self.BOTTOM, log)
+        else:
+            if j == 0:
+                self._union(cell, self.LEFT, log)
+            if j == last:
+                self._union(cell, self.RIGHT, log)
+        self.history.append((cell, log))
+
+    def undo(self) -> None:
+        """
+        Removes the last placed stone and restores the previous partition.
+        """
+        if not self.history:
+            raise IndexError("Nothing to undo: the union-find history is empty.")
+        cell, log = self.history.pop()
+        for child_root, new_root, bumped in reversed(log):
+            self.parent[child_root] = child_root
+            if bumped:
+                self.rank[new_root] -= 1
+        self.color[cell] = None
+
+    def is_connected(self, color: Hashable) -> bool:
+        """
+        Checks if the given colour links its two edges.
+
+        Returns:
+            bool: True if the player of this colour has won
+        """
+        if color == self.vertical_color:
+            return self.find(self.TOP) == self.find(self.BOTTOM)
+        return self.find(self.LEFT) == self.find(self.RIGHT)